@@ -0,0 +1,219 @@
+"""
+Render benchmarks with a history, so there are numbers before (and after)
+optimizing anything.
+
+Each scene is rendered at -q l with narration off and manim's partial-movie
+cache disabled (so every run does the full work), one at a time, each in a
+fresh process so peak memory belongs to that scene alone. Per scene:
+
+    construct_s   time spent in construct (building mobjects, playing)
+    render_s      whole render, including combining the movie
+    frames        frames written (movie length x frame rate)
+    fps           frames / render_s
+    peak_rss_mb   peak resident memory of the worker process
+    output_bytes  size of the final movie
+
+Every run is appended as one JSON line to "0 Exports/bench_history.jsonl"
+(never rewritten) along with the git commit and manim version, then compared
+with the previous run: a scene whose construct_s, render_s or peak_rss_mb
+grew by more than --threshold, or whose fps dropped by more than it, is
+flagged and the exit code is 1.
+
+Good stress cases: LPSPart2NaiveExpandSolutions (hundreds of plays) and
+CacheIndexingExplanation (thousands of mobjects).
+
+Usage:
+    python "0 Tools/bench.py" LPSPart2NaiveExpandSolutions CacheIndexingExplanation
+    python "0 Tools/bench.py" "6 Manachers" --threshold 0.05
+    python "0 Tools/bench.py" --history
+"""
+import argparse
+import json
+import multiprocessing
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import build
+import deps
+import exports
+import scenes
+
+HISTORY = exports.EXPORTS_DIR / "bench_history.jsonl"
+THRESHOLD = 0.10
+# metric -> +1 if bigger is worse, -1 if smaller is worse
+TRACKED = {"construct_s": 1, "render_s": 1, "peak_rss_mb": 1, "fps": -1}
+
+
+# ---------------------------------- #
+#  Measuring one scene
+# ---------------------------------- #
+def _peak_rss_mb():
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (1 << 20 if sys.platform == "darwin" else 1 << 10), 1)
+
+
+class BenchMixin:
+    """Times construct on its own, apart from setup and combining the movie."""
+    construct_time = 0.0
+
+    def construct(self):
+        start = time.perf_counter()
+        try:
+            super().construct()
+        finally:
+            self.construct_time = time.perf_counter() - start
+
+
+def measure(info, quality="l", overrides=None):
+    """Worker: renders one scene and returns its metrics."""
+    from manim import config
+
+    scene_cls = scenes.load_scene(info, overrides)
+    scene_cls = type(info.name, (BenchMixin, scene_cls), {})
+    start = time.perf_counter()
+    # always from scratch: cached partial movies would turn construct and render time into cache hits
+    scene = scenes.render(info, quality, overrides=overrides, scene_cls=scene_cls, disable_caching=True)
+    render_time = time.perf_counter() - start
+
+    frames = round(scene.renderer.time * config.frame_rate)
+    movie = Path(scene.renderer.file_writer.movie_file_path)
+    if not movie.is_absolute():
+        movie = info.path.parent / movie
+    return {
+        "construct_s": round(scene.construct_time, 3),
+        "render_s": round(render_time, 3),
+        "frames": frames,
+        "plays": scene.renderer.num_plays,
+        "fps": round(frames / render_time, 1) if render_time else 0.0,
+        "peak_rss_mb": _peak_rss_mb(),
+        "output_bytes": movie.stat().st_size if movie.exists() else 0,
+    }
+
+
+def measure_isolated(info, quality="l", overrides=None):
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(measure, info, quality, overrides).result()
+
+
+# ---------------------------------- #
+#  History
+# ---------------------------------- #
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=scenes.ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history():
+    if not HISTORY.exists():
+        return []
+    runs = []
+    for line in HISTORY.read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            runs.append(json.loads(line))
+    return runs
+
+
+def append_run(run):
+    HISTORY.parent.mkdir(parents=True, exist_ok=True)
+    with open(HISTORY, "a", encoding="utf-8") as f:
+        f.write(json.dumps(run, sort_keys=True) + "\n")
+
+
+def previous_result(history, key, quality):
+    """
+    The newest earlier measurement of one scene at this quality, with its
+    run. Runs from before caching was disabled are skipped: they may have
+    timed cache hits.
+    """
+    for run in reversed(history):
+        if run["quality"] == quality and run.get("disable_caching") and key in run["scenes"]:
+            return run, run["scenes"][key]
+    return None, None
+
+
+def regressions(old, new, threshold=THRESHOLD):
+    """['construct_s 1.20 -> 1.61 (+34%)', ...] for metrics that got worse by more than threshold."""
+    found = []
+    for metric, direction in TRACKED.items():
+        before, after = old.get(metric), new.get(metric)
+        if not before or after is None:
+            continue
+        change = (after - before) / before
+        if change * direction > threshold:
+            found.append(f"{metric} {before} -> {after} ({change:+.0%})")
+    return found
+
+
+def bench(infos, quality="l", overrides=None, threshold=THRESHOLD, out=print):
+    """Measures every scene, appends the run to the history, returns the number of regressions."""
+    history = load_history()
+    run = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": git_commit(),
+        "manim": deps.manim_version(),
+        "quality": quality,
+        "disable_caching": True,
+        "scenes": {},
+    }
+    flagged = 0
+    for info in infos:
+        key = f"{exports._rel(info.path)}:{info.name}"
+        try:
+            result = measure_isolated(info, quality, overrides)
+        except Exception as err:
+            out(f"ERROR {key}: {err}")
+            continue
+        run["scenes"][key] = result
+        out(f"{info.name:<40} construct {result['construct_s']:7.2f}s  render {result['render_s']:7.2f}s  "
+            f"{result['fps']:6.1f} fps  {result['peak_rss_mb']:7.1f} MB  {result['output_bytes'] / 1e6:6.1f} MB out")
+        base_run, base = previous_result(history, key, quality)
+        if base is None:
+            continue
+        for reason in regressions(base, result, threshold):
+            flagged += 1
+            out(f"    REGRESSION vs {base_run['commit'] or base_run['created']}: {reason}")
+    append_run(run)
+    return flagged
+
+
+def show_history(out=print):
+    for run in load_history():
+        total = sum(s["render_s"] for s in run["scenes"].values())
+        out(f"{run['created']}  {run['commit'] or '-':<8} manim {run['manim']:<10} "
+            f"-q {run['quality']}  {len(run['scenes'])} scenes  {total:.1f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("targets", nargs="*", help="scene names, FILE:Scene, files or folders (default: all)")
+    parser.add_argument("-q", "--quality", default="l", choices=sorted(scenes.QUALITIES))
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="relative change that counts as a regression (default 0.10)")
+    parser.add_argument("--history", action="store_true", help="list past runs and exit")
+    args = parser.parse_args(argv)
+
+    if args.history:
+        show_history()
+        return 0
+    try:
+        infos = build.resolve_targets(args.targets)
+    except LookupError as err:
+        parser.error(str(err))
+    flagged = bench(infos, args.quality, {"INCLUDE_NARRATION": False}, args.threshold)
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Make-like incremental renders: only scenes whose dependencies changed since
+their last recorded export are rendered again.
+
+Every export in "0 Exports/manifest.json" carries the dependency digests it
+was rendered from (deps.py). A scene is stale if it was never exported at
+this quality, its export file is gone, or any digest differs now: its own
+class, a helper or constant it references (create_tile, NARRATOR_VOICE),
+a sibling module, an asset like Zeta.mp3, or a cached narration clip.
+
+Usage:
+    python "0 Tools/build.py" "6 Manachers" -q h --dry-run
+    python "0 Tools/build.py" LPSPart4PythonCode LPSPart5PerformanceTest -q h
+    python "0 Tools/build.py" --no-narration --keep-going
+"""
+import argparse
+import sys
+import traceback
+from pathlib import Path
+
+import deps
+import exports
+import scenes
+
+
+def resolve_targets(targets):
+    """Scene names, FILE:Scene, files and folders -> SceneInfos, in order, no repeats."""
+    if not targets:
+        return scenes.discover_all()
+    found = []
+    for target in targets:
+        path = scenes.ROOT / target
+        if path.exists():
+            found.extend(scenes.discover_all([path]))
+        else:
+            found.append(scenes.find_scene(target))
+    unique = {}
+    for info in found:
+        unique.setdefault((info.path, info.name), info)
+    return list(unique.values())
+
+
+def latest_exports():
+    """Newest manifest entry per (file, scene, quality)."""
+    return {(e["file"], e["scene"], e["quality"]): e for e in exports.latest_entries()}
+
+
+def stale_reasons(info, quality, overrides=None, latest=None):
+    """
+    Why `info` needs rendering at `quality`, as a list of strings;
+    empty if its newest export is still up to date.
+    """
+    if latest is None:
+        latest = latest_exports()
+    entry = latest.get((exports._rel(info.path), info.name, quality))
+    if entry is None:
+        return [f"never exported at -q {quality}"]
+    if not (scenes.ROOT / entry["export"]).exists():
+        return [f"export {entry['export']} is missing"]
+    expected = exports._rel(exports.export_path(info, quality, Path(entry["export"]).suffix))
+    if entry["export"] != expected:
+        # exported before paths had the file stem; another file's scene of the same name may own it
+        return [f"export {entry['export']} predates per-file export paths"]
+    current = deps.scene_deps(info, overrides)
+    if "deps" not in entry:
+        if entry["fingerprint"] != deps.fingerprint(current):
+            return ["exported before dependency tracking"]
+        return []
+    return deps.explain(entry["deps"], current)
+
+
+def plan(infos, quality, overrides=None):
+    """[(SceneInfo, reasons)] for every scene; up-to-date ones have no reasons."""
+    latest = latest_exports()
+    return [(info, stale_reasons(info, quality, overrides, latest)) for info in infos]
+
+
+def build(infos, quality="l", overrides=None, dry_run=False, keep_going=False, force=False, out=print):
+    """
+    Renders the stale scenes among `infos` (all of them with force) and
+    records each one. Returns the list of scenes that failed.
+    """
+    failed = []
+    for info, reasons in plan(infos, quality, overrides):
+        if force and not reasons:
+            reasons = ["forced"]
+        name = f"{info.path.parent.name}/{info.path.name}:{info.name}"
+        if not reasons:
+            out(f"up to date  {name}")
+            continue
+        out(f"{'stale' if dry_run else 'building'}  {name}")
+        for reason in reasons:
+            out(f"    {reason}")
+        if dry_run:
+            continue
+        try:
+            entry = exports.render_and_record(info, quality, overrides)
+            out(f"    -> {entry['export']} in {entry['render_time']}s")
+        except Exception:
+            traceback.print_exc()
+            failed.append(info)
+            if not keep_going:
+                break
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("targets", nargs="*", help="scene names, FILE:Scene, files or folders (default: all)")
+    parser.add_argument("-q", "--quality", default="l", choices=sorted(scenes.QUALITIES))
+    parser.add_argument("--dry-run", action="store_true", help="only say what is stale and why")
+    parser.add_argument("--no-narration", action="store_true")
+    parser.add_argument("-k", "--keep-going", action="store_true", help="continue after a failed render")
+    parser.add_argument("-B", "--force", action="store_true", help="render even up-to-date scenes")
+    args = parser.parse_args(argv)
+
+    try:
+        infos = resolve_targets(args.targets)
+    except LookupError as err:
+        parser.error(str(err))
+    overrides = {"INCLUDE_NARRATION": False} if args.no_narration else None
+    failed = build(infos, args.quality, overrides, args.dry_run, args.keep_going, args.force)
+    if failed:
+        print(f"{len(failed)} scene(s) failed: " + ", ".join(i.name for i in failed), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
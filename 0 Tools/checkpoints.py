@@ -0,0 +1,582 @@
+"""
+Scene checkpoints: save the scene state at every section boundary, then
+render starting from any of them without running the earlier construct code.
+
+Boundaries are
+    - self.next_section("name") calls (manim's own section API), and
+    - top-level self.some_method() calls in construct, named after the
+      method (FibonacciExplainer's show_introduction, recursion_vs_dp, ...).
+
+A checkpoint holds the mobjects on screen, foreground mobjects, the camera
+frame, attributes construct set on the scene, the sounds added so far with
+their start times, and the local variables of every construct/method frame
+active at the boundary, all in one pickle so
+shared references stay shared. Updaters are lambdas, so `dill` is used when
+it is installed (plain pickle can't store them).
+
+Resuming compiles the rest of each active function (the statements after the
+boundary) from the scene's source and runs it with the saved locals. The
+movie then starts at the section, so the timeline restarts at 0 and sounds
+added later line up with it. Sounds added before the boundary and still
+playing there (a music bed like Zeta.mp3, a voiceover running across it)
+are added again at 0 with their first (boundary - start) seconds cut off,
+so the resumed section sounds as it does in the full render.
+A checkpoint is refused when code that ran before its boundary has changed:
+the functions on the stack up to the boundary and the methods they reached.
+The rest of each function runs outside its class, so a section that calls
+super() without arguments (or uses __class__ / nonlocal) after the boundary
+can't be resumed; spell it super(ClassName, self).
+
+Usage:
+    python "0 Tools/checkpoints.py" save BoundedFunctionsWithNarration
+    python "0 Tools/checkpoints.py" list BoundedFunctionsWithNarration
+    python "0 Tools/checkpoints.py" resume BoundedFunctionsWithNarration supremum -q l
+    python "0 Tools/checkpoints.py" check      # fingerprint self-check, no scene needed
+"""
+import argparse
+import ast
+import copy
+import hashlib
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import deps
+import scenes
+
+
+def checkpoint_dir(info):
+    return info.path.parent / "media" / "checkpoints" / info.path.stem / info.name
+
+
+def _pickler():
+    try:
+        import dill
+        dill.settings["recurse"] = True
+        return dill
+    except ImportError:
+        return pickle
+
+
+# ---------------------------------- #
+#  Source bookkeeping
+# ---------------------------------- #
+def _function_node(tree, code):
+    """The FunctionDef a running code object was compiled from."""
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == code.co_name:
+            first = min([node.lineno] + [d.lineno for d in node.decorator_list])
+            if first == code.co_firstlineno or node.lineno == code.co_firstlineno:
+                return node
+    return None
+
+
+def _named_function(tree, class_name, func_name):
+    """
+    A method of the scene class (or a module-level function) by name. Frames
+    are stored by name, not line, so edits elsewhere in the file don't break them.
+    """
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            for stmt in node.body:
+                if isinstance(stmt, ast.FunctionDef) and stmt.name == func_name:
+                    return stmt
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == func_name:
+            return node
+    raise LookupError(f"{func_name} is no longer in {class_name}'s file")
+
+
+def _statement_index(func, lineno):
+    """Index of the top-level statement of `func` that contains line `lineno`."""
+    for i, stmt in enumerate(func.body):
+        if stmt.lineno <= lineno <= stmt.end_lineno:
+            return i
+    return None
+
+
+def section_methods(tree, class_name):
+    """Methods called as top-level self.<name>() statements in the class's construct."""
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            methods = {n.name for n in node.body if isinstance(n, ast.FunctionDef)}
+            construct = next((n for n in node.body if getattr(n, "name", None) == "construct"), None)
+            names = []
+            for stmt in construct.body if construct else []:
+                call = stmt.value if isinstance(stmt, ast.Expr) else None
+                if (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+                        and isinstance(call.func.value, ast.Name) and call.func.value.id == "self"
+                        and call.func.attr in methods):
+                    names.append(call.func.attr)
+            return names
+    return []
+
+
+def _self_methods(node, methods):
+    """Names of the class's methods that `node` refers to as self.<name>."""
+    return {n.attr for n in ast.walk(node)
+            if isinstance(n, ast.Attribute) and isinstance(n.value, ast.Name)
+            and n.value.id == "self" and n.attr in methods}
+
+
+def prefix_nodes(tree, class_name, frames):
+    """
+    The parts of the scene class that ran before the boundary: its class-level
+    statements, __init__/setup, the functions on the frame stack cut off at
+    the boundary statement, and every method those reach through self.<name>,
+    transitively. Methods only called after the boundary are left out.
+    """
+    cls = next((n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == class_name), None)
+    if cls is None:
+        return []
+    methods = {n.name: n for n in cls.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))}
+    ran = [stmt for stmt in cls.body if getattr(stmt, "name", None) not in methods]
+    reached = {name for name in ("__init__", "setup") if name in methods}
+    for depth, (name, start, _) in enumerate(frames):
+        if name in methods:
+            stmt = copy.copy(methods[name])
+            stmt.body = stmt.body[:start]
+            ran.append(stmt)
+            reached |= _self_methods(stmt, methods)
+            if depth + 1 < len(frames):
+                # the last statement is the call still running below it, which isn't finished
+                reached -= {frames[depth + 1][0]} - _self_methods(ast.Module(stmt.body[:-1], []), methods)
+    todo = list(reached)
+    while todo:
+        for name in _self_methods(methods[todo.pop()], methods) - reached:
+            reached.add(name)
+            todo.append(name)
+    return ran + [methods[name] for name in sorted(reached)]
+
+
+def prefix_fingerprint(info, frames):
+    """
+    Hash of everything that ran before the boundary: the scene's dependencies
+    and prefix_nodes() of its class. Editing a section after the boundary
+    (the one being resumed into included) leaves the checkpoint valid.
+    """
+    tree = deps.parse(info.path)
+    ran = prefix_nodes(tree, info.name, frames)
+    digest = hashlib.sha256()
+    # narration clips count only for the text that was spoken before the boundary
+    found = {k: v for k, v in deps.scene_deps(info).items()
+             if k != f"code:{info.name}" and not k.startswith("audio:")}
+    plain, patterns = deps._strings(ran)
+    for text, audio in deps.voiceover_entries(info.path.parent):
+        if text in plain or any(p.fullmatch(text) for p in patterns):
+            found[f"audio:{audio.name}"] = deps.file_digest(audio)
+    digest.update(repr(sorted(found.items())).encode())
+    for node in ran:
+        digest.update(ast.dump(node, annotate_fields=False).encode())
+    return digest.hexdigest()[:16]
+
+
+_CHECK_SOURCE = """
+class Demo(Scene):
+    def construct(self):
+        self.intro()
+        self.middle()
+        self.outro()
+
+    def intro(self):
+        self.helper()
+
+    def helper(self):
+        self.wait(1)
+
+    def middle(self):
+        self.wait(2)
+        self.next_section("half")
+        self.wait(3)
+
+    def outro(self):
+        self.wait(4)
+"""
+
+
+def check_fingerprint():
+    """
+    Edits a sample scene around the "half" boundary inside middle(): code
+    after it (outro, the rest of middle) must keep the prefix the same,
+    code before it (helper, reached from intro) must change it.
+    """
+    frames = [("construct", 2, {}), ("middle", 2, {})]
+
+    def prefix(source):
+        nodes = prefix_nodes(ast.parse(source), "Demo", frames)
+        return [ast.dump(node) for node in nodes]
+
+    base = prefix(_CHECK_SOURCE)
+    after = [_CHECK_SOURCE.replace("self.wait(4)", "self.wait(40)"),
+             _CHECK_SOURCE.replace("self.wait(3)", "self.wait(30)")]
+    before = [_CHECK_SOURCE.replace("self.wait(1)", "self.wait(10)"),
+              _CHECK_SOURCE.replace("self.wait(2)", "self.wait(20)")]
+    for source in after:
+        if prefix(source) != base:
+            raise AssertionError("an edit after the boundary changed the fingerprint")
+    for source in before:
+        if prefix(source) == base:
+            raise AssertionError("an edit before the boundary left the fingerprint unchanged")
+
+
+# ---------------------------------- #
+#  The mixin
+# ---------------------------------- #
+class StopRange(Exception):
+    """Raised at stop_section to end construct early (parallel.py renders one range per worker)."""
+
+
+class CheckpointMixin:
+    """
+    Mixed in front of a scene class by checkpointed_class(). With
+    resume_section set it restores that checkpoint instead of running
+    construct from the top; with save_checkpoints set it writes one at
+    every boundary it passes; with stop_section set the render ends when
+    that boundary is reached.
+    """
+    scene_info = None
+    save_checkpoints = True
+    resume_section = None
+    stop_section = None
+
+    def setup(self):
+        super().setup()
+        self._base_attrs = set(vars(self))
+        self._tree = deps.parse(self.scene_info.path)
+        self._sounds = []       # (path, start time, gain) of every add_sound so far
+        self._boundary_counts = {}
+        self._counts_before = {}
+
+    def add_sound(self, sound_file, time_offset=0, gain=None, **kwargs):
+        self._sounds.append((str(Path(sound_file).resolve()), self.renderer.time + time_offset, gain))
+        return super().add_sound(sound_file, time_offset, gain, **kwargs)
+
+    def construct(self):
+        if self.save_checkpoints or self.stop_section:
+            for name in section_methods(self._tree, self.scene_info.name):
+                self._wrap_section_method(name)
+                self._base_attrs.add(name)
+        try:
+            if self.resume_section:
+                self._resume(self.resume_section)
+            else:
+                super().construct()
+        except StopRange:
+            pass
+
+    def next_section(self, name="unnamed", *args, **kwargs):
+        self._boundary(name, sys._getframe(1), resume_after=True)
+        return super().next_section(name, *args, **kwargs)
+
+    def _wrap_section_method(self, name):
+        method = getattr(self, name)
+
+        def section(*args, **kwargs):
+            self._boundary(name, sys._getframe(1), resume_after=False)
+            return method(*args, **kwargs)
+
+        setattr(self, name, section)
+
+    def _boundary(self, name, frame, resume_after):
+        # a name seen before ("unnamed", a method called twice) becomes name.2, name.3, ...
+        self._counts_before = dict(self._boundary_counts)
+        count = self._boundary_counts[name] = self._boundary_counts.get(name, 0) + 1
+        key = name if count == 1 else f"{name}.{count}"
+        if key == self.stop_section:
+            raise StopRange(key)
+        if self.save_checkpoints and not self.resume_section:
+            self.save_checkpoint(key, frame, resume_after)
+
+    # Saving ----------------------------------------------------------- #
+    def _frame_stack(self, frame, resume_after):
+        """
+        [(function name, first statement to resume at, locals)]
+        from construct down to `frame`, or None if some frame is not at a
+        top-level statement (inside a loop or with block) and can't be resumed.
+        """
+        stack = []
+        path = str(self.scene_info.path)
+        innermost = True
+        while frame is not None:
+            if frame.f_code.co_filename == __file__:
+                frame = frame.f_back     # a section-method wrapper
+                continue
+            if frame.f_code.co_filename != path:
+                return None
+            func = _function_node(self._tree, frame.f_code)
+            index = _statement_index(func, frame.f_lineno) if func else None
+            if index is None:
+                return None
+            stmt = func.body[index]
+            if not (isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call)):
+                return None
+            start = index + 1 if (resume_after or not innermost) else index
+            local_vars = {k: v for k, v in frame.f_locals.items() if k != "self"}
+            stack.append((func.name, start, local_vars))
+            if func.name == "construct" and frame.f_locals.get("self") is self:
+                return stack[::-1]
+            frame = frame.f_back
+            innermost = False
+        return None
+
+    def save_checkpoint(self, name, frame, resume_after=True):
+        frames = self._frame_stack(frame, resume_after)
+        if frames is None:
+            print(f"checkpoint {name!r} skipped: not at a top-level statement", file=sys.stderr)
+            return None
+        for func_name, start, _ in frames:
+            try:
+                problem = _tail_problem(_named_function(self._tree, self.scene_info.name, func_name), start)
+            except LookupError:
+                problem = "is not a method of the scene or a module-level function"
+            if problem:
+                print(f"checkpoint {name!r} skipped: {func_name} {problem}", file=sys.stderr)
+                return None
+        camera_frame = getattr(self.camera, "frame", None)
+        attrs = {k: v for k, v in vars(self).items()
+                 if k not in self._base_attrs and not k.startswith("_")}
+        state = {
+            "mobjects": list(self.mobjects),
+            "foreground": list(self.foreground_mobjects),
+            "camera_frame": camera_frame,
+            "attrs": attrs,
+            "frames": frames,
+        }
+        pickler = _pickler()
+        dropped = _drop_unpicklable(pickler, state)
+        meta = {
+            "section": name,
+            "time": self.renderer.time,
+            "num_plays": self.renderer.num_plays,
+            "sounds": list(self._sounds),
+            # boundary counts as a resumed run must see them, so name.N keys stay the same
+            "boundaries": self._counts_before if not resume_after else dict(self._boundary_counts),
+            "fingerprint": prefix_fingerprint(self.scene_info, frames),
+            "dropped": dropped,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        target = checkpoint_dir(self.scene_info) / f"{name}.pkl"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(target, "wb") as f:
+                pickle.dump(meta, f)
+                pickler.dump(state, f)
+        except Exception as err:
+            target.unlink(missing_ok=True)
+            print(f"checkpoint {name!r} skipped: {err}", file=sys.stderr)
+            return None
+        return target
+
+    # Resuming --------------------------------------------------------- #
+    def _resume(self, name):
+        meta, state = load_checkpoint(self.scene_info, name)
+        current = prefix_fingerprint(self.scene_info, state["frames"])
+        if current != meta["fingerprint"]:
+            raise RuntimeError(
+                f"checkpoint {name!r} is stale: code before it changed; run `save` again"
+            )
+        self.mobjects = state["mobjects"]
+        self.foreground_mobjects = state["foreground"]
+        if state["camera_frame"] is not None:
+            self.camera.frame = state["camera_frame"]
+        for key, value in state["attrs"].items():
+            setattr(self, key, value)
+        self._restore_dropped(meta["dropped"])
+        self._restore_sounds(meta.get("sounds", []), meta["time"])
+        self._boundary_counts = dict(meta.get("boundaries", {}))
+
+        module = scenes.load_module(self.scene_info.path)
+        for func_name, start, local_vars in reversed(state["frames"]):
+            func = _named_function(self._tree, self.scene_info.name, func_name)
+            tail = _compile_tail(module, func, start, local_vars)
+            tail(self, **local_vars)
+
+    def _restore_sounds(self, sounds, at):
+        """Re-adds the sounds still playing at time `at`, trimmed so they continue from there."""
+        if not sounds:
+            return
+        from pydub import AudioSegment
+
+        for path, start, gain in sounds:
+            segment = AudioSegment.from_file(path)
+            if gain:
+                segment = segment.apply_gain(gain)
+            if start >= at:
+                # added with a time_offset that reaches past the boundary
+                self.renderer.file_writer.add_audio_segment(segment, start - at)
+                continue
+            elapsed_ms = int((at - start) * 1000)
+            if elapsed_ms < len(segment):
+                self.renderer.file_writer.add_audio_segment(segment[elapsed_ms:], 0)
+
+    def _restore_dropped(self, dropped):
+        """
+        Things that can't be pickled are rebuilt where the repo has a way to:
+        the speech service, via the scene module's make_speech_service().
+        """
+        if "attrs.speech_service" in dropped:
+            module = scenes.load_module(self.scene_info.path)
+            if getattr(module, "INCLUDE_NARRATION", False) and hasattr(module, "make_speech_service"):
+                self.set_speech_service(module.make_speech_service())
+
+
+def _drop_unpicklable(pickler, state):
+    """Removes attrs/locals that can't be pickled (open clients, generators). Returns their names."""
+    try:
+        pickler.dumps(state)
+        return []
+    except Exception:
+        pass
+    dropped = []
+    for key in list(state["attrs"]):
+        try:
+            pickler.dumps(state["attrs"][key])
+        except Exception:
+            del state["attrs"][key]
+            dropped.append(f"attrs.{key}")
+    for func_name, _, local_vars in state["frames"]:
+        for key in list(local_vars):
+            try:
+                pickler.dumps(local_vars[key])
+            except Exception:
+                del local_vars[key]
+                dropped.append(f"{func_name}.{key}")
+    return dropped
+
+
+def _tail_problem(func, start):
+    """
+    Why statements start.. of `func` can't run as a module-level function,
+    or None. Zero-argument super() and __class__ need the class cell, and
+    nonlocal names belong to a function that isn't running any more.
+    """
+    for stmt in func.body[start:]:
+        for node in ast.walk(stmt):
+            if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                    and node.func.id == "super" and not node.args):
+                return f"line {node.lineno} calls super() without arguments"
+            if isinstance(node, ast.Name) and node.id == "__class__":
+                return f"line {node.lineno} uses __class__"
+            if isinstance(node, ast.Nonlocal):
+                return f"line {node.lineno} declares nonlocal {', '.join(node.names)}"
+    return None
+
+
+def _compile_tail(module, func, start, local_vars):
+    """A function running statements start.. of `func`, taking its locals as arguments."""
+    problem = _tail_problem(func, start)
+    if problem:
+        raise ValueError(
+            f"can't resume inside {func.name}: {problem}; write super(ClassName, self) instead"
+            if "super" in problem else f"can't resume inside {func.name}: {problem}"
+        )
+    body = copy.deepcopy(func.body[start:]) or [ast.Pass()]
+    params = [ast.arg(arg="self")] + [ast.arg(arg=k) for k in local_vars]
+    tail = ast.FunctionDef(
+        name=f"{func.name}__from_checkpoint",
+        args=ast.arguments(posonlyargs=[], args=params, kwonlyargs=[], kw_defaults=[], defaults=[]),
+        body=body, decorator_list=[], lineno=func.lineno, end_lineno=func.end_lineno, col_offset=0,
+    )
+    wrapper = ast.Module(body=[tail], type_ignores=[])
+    ast.fix_missing_locations(wrapper)
+    namespace = {}
+    exec(compile(wrapper, str(module.__file__), "exec"), module.__dict__, namespace)
+    return namespace[tail.name]
+
+
+def load_checkpoint(info, name):
+    path = checkpoint_dir(info) / f"{name}.pkl"
+    if not path.exists():
+        raise LookupError(f"no checkpoint {name!r} for {info.name}; run `save` first")
+    with open(path, "rb") as f:
+        meta = pickle.load(f)
+        state = _pickler().load(f)
+    return meta, state
+
+
+def clear_checkpoints(info):
+    """Deletes a scene's checkpoints (before a new save pass, so renamed sections don't linger)."""
+    for path in checkpoint_dir(info).glob("*.pkl"):
+        path.unlink()
+
+
+def list_checkpoints(info):
+    """[(name, meta)] oldest first, reading only the small header of each file."""
+    found = []
+    for path in checkpoint_dir(info).glob("*.pkl"):
+        with open(path, "rb") as f:
+            found.append((path.stem, pickle.load(f)))
+    return sorted(found, key=lambda item: item[1]["time"])
+
+
+def checkpointed_class(info, overrides=None, resume_section=None, stop_section=None,
+                       save=True, name=None):
+    """
+    A subclass of the scene with checkpoints. Resumed renders get their own
+    movie name unless `name` is given.
+    """
+    scene_cls = scenes.load_scene(info, overrides)
+    if name is None:
+        name = f"{info.name}_from_{resume_section}" if resume_section else info.name
+    return type(name, (CheckpointMixin, scene_cls), {
+        "scene_info": info,
+        "resume_section": resume_section,
+        "stop_section": stop_section,
+        "save_checkpoints": save and not resume_section and not stop_section,
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    save_cmd = sub.add_parser("save", help="run the scene once, writing a checkpoint at every boundary")
+    save_cmd.add_argument("scene")
+    save_cmd.add_argument("-q", "--quality", default="l", choices=sorted(scenes.QUALITIES))
+    save_cmd.add_argument("--render", action="store_true", help="also write the movie (default: dry run)")
+    save_cmd.add_argument("--no-narration", action="store_true")
+
+    list_cmd = sub.add_parser("list", help="show a scene's checkpoints")
+    list_cmd.add_argument("scene")
+
+    resume_cmd = sub.add_parser("resume", help="render from a checkpoint to the end")
+    resume_cmd.add_argument("scene")
+    resume_cmd.add_argument("section")
+    resume_cmd.add_argument("-q", "--quality", default="l", choices=sorted(scenes.QUALITIES))
+    resume_cmd.add_argument("-p", "--preview", action="store_true")
+    resume_cmd.add_argument("--no-narration", action="store_true")
+
+    sub.add_parser("check", help="check that only edits before a boundary invalidate it")
+
+    args = parser.parse_args(argv)
+    if args.command == "check":
+        check_fingerprint()
+        print("fingerprint check passed")
+        return
+    try:
+        info = scenes.find_scene(args.scene)
+    except LookupError as err:
+        parser.error(str(err))
+    overrides = {"INCLUDE_NARRATION": False} if getattr(args, "no_narration", False) else None
+
+    if args.command == "save":
+        clear_checkpoints(info)
+        scene_cls = checkpointed_class(info, overrides)
+        scenes.render(info, args.quality, overrides=overrides, scene_cls=scene_cls,
+                      dry_run=not args.render)
+        for name, meta in list_checkpoints(info):
+            print(f"{name:<28} t={meta['time']:.1f}s")
+    elif args.command == "list":
+        for name, meta in list_checkpoints(info):
+            dropped = f"  (not saved: {', '.join(meta['dropped'])})" if meta["dropped"] else ""
+            sounds = len(meta.get("sounds", []))
+            print(f"{name:<28} t={meta['time']:7.1f}s  plays={meta['num_plays']:<4} sounds={sounds:<3} "
+                  f"{meta['created']}{dropped}")
+    elif args.command == "resume":
+        scene_cls = checkpointed_class(info, overrides, resume_section=args.section)
+        scenes.render(info, args.quality, args.preview, overrides, scene_cls=scene_cls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Dependency fingerprints for scenes, found statically (nothing is imported).
+
+A scene depends on:
+    code:<Name>      its own class, its base classes in the same file, and
+                     every module-level function, class or constant it
+                     references, transitively (create_tile, INCLUDE_NARRATION,
+                     NARRATOR_VOICE, ...). Hashed as AST, so comments and
+                     formatting don't count.
+    module:<file>    sibling helper modules it imports (code_listing.py,
+                     fibonacci.py, ...), whole file, and their own imports
+    asset:<file>     files named in string literals that exist next to the
+                     scene (Zeta.mp3, images, ...)
+    audio:<file>     narration clips in media/voiceovers whose text matches
+                     one of the scene's narration strings
+    override:<FLAG>  flags forced for this build (e.g. --no-narration)
+    lib:manim        the installed manim version
+
+scene_deps() returns {key: digest}; fingerprint() folds that into one hash;
+explain() turns two dep dicts into human-readable reasons.
+"""
+import ast
+import hashlib
+import json
+import re
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+
+ASSET_SUFFIXES = (".mp3", ".wav", ".ogg", ".png", ".jpg", ".jpeg", ".svg", ".gif", ".mp4")
+AUDIO_SUFFIXES = (".mp3", ".wav", ".ogg")
+
+
+# ---------------------------------- #
+#  Helpers
+# ---------------------------------- #
+def _digest(data):
+    return hashlib.sha256(data.encode() if isinstance(data, str) else data).hexdigest()[:16]
+
+
+def _node_digest(node):
+    return _digest(ast.dump(node, annotate_fields=False))
+
+
+@lru_cache(maxsize=None)
+def _file_digest(path, size, mtime_ns):
+    # size/mtime are part of the cache key so an edited file is re-hashed
+    return _digest(Path(path).read_bytes())
+
+
+def file_digest(path):
+    """Short sha256 of a file, cached until the file changes."""
+    stat = Path(path).stat()
+    return _file_digest(str(path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _parse(path, size, mtime_ns):
+    return ast.parse(Path(path).read_bytes(), filename=str(path))
+
+
+def parse(path):
+    stat = Path(path).stat()
+    return _parse(str(path), stat.st_size, stat.st_mtime_ns)
+
+
+def module_symbols(tree):
+    """
+    {name: top-level statement defining it} for a module: functions,
+    classes, assignments and imports, including those inside top-level
+    if/try blocks.
+    """
+    symbols = {}
+
+    def visit(statements):
+        for node in statements:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                symbols[node.name] = node
+            elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                for target in targets:
+                    for name in ast.walk(target):
+                        if isinstance(name, ast.Name):
+                            symbols[name.id] = node
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                for alias in node.names:
+                    if alias.name != "*":
+                        symbols[(alias.asname or alias.name).split(".")[0]] = node
+            elif isinstance(node, (ast.If, ast.Try, ast.With)):
+                visit(getattr(node, "body", []))
+                visit(getattr(node, "orelse", []))
+                visit(getattr(node, "finalbody", []))
+                for handler in getattr(node, "handlers", []):
+                    visit(handler.body)
+
+    visit(tree.body)
+    return symbols
+
+
+def _sibling_module(folder, node):
+    """The .py file next to the scene an import statement refers to, if any."""
+    if isinstance(node, ast.ImportFrom):
+        names = [node.module] if node.module and not node.level else []
+    else:
+        names = [alias.name for alias in node.names]
+    for name in names:
+        path = folder / (name.split(".")[0] + ".py")
+        if path.is_file():
+            yield path
+
+
+def _strings(nodes):
+    """Plain string literals, and f-strings as regexes of their fixed parts."""
+    plain, patterns = set(), []
+    for root in nodes:
+        for node in ast.walk(root):
+            if isinstance(node, ast.JoinedStr):
+                parts = [re.escape(v.value) if isinstance(v, ast.Constant) else ".*?"
+                         for v in node.values]
+                patterns.append(re.compile("".join(parts), re.S))
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                plain.add(node.value)
+    return plain, patterns
+
+
+# ---------------------------------- #
+#  Dependencies of one scene
+# ---------------------------------- #
+def code_closure(tree, roots):
+    """Module-level statements reachable from the named roots by name references."""
+    symbols = module_symbols(tree)
+    seen = {}
+    todo = [name for name in roots if name in symbols]
+    while todo:
+        name = todo.pop()
+        node = symbols[name]
+        if name in seen:
+            continue
+        seen[name] = node
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and child.id in symbols and child.id not in seen:
+                todo.append(child.id)
+    return seen
+
+
+def module_deps(path, deps=None):
+    """Whole-file digests of a helper module and every sibling module it imports."""
+    deps = {} if deps is None else deps
+    key = f"module:{path.name}"
+    if key in deps:
+        return deps
+    deps[key] = file_digest(path)
+    for node in ast.walk(parse(path)):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            for sibling in _sibling_module(path.parent, node):
+                if sibling != path:
+                    module_deps(sibling, deps)
+    return deps
+
+
+def voiceover_entries(folder):
+    """(text, audio path) pairs from manim-voiceover's cache.json under media/voiceovers."""
+    voiceovers = folder / "media" / "voiceovers"
+    cache = voiceovers / "cache.json"
+    if not cache.is_file():
+        return []
+    try:
+        entries = json.loads(cache.read_text(encoding="utf-8"))
+    except ValueError:
+        return []
+    pairs = []
+    for entry in entries if isinstance(entries, list) else []:
+        text = entry.get("input_text") or (entry.get("input_data") or {}).get("input_text")
+        for value in entry.values():
+            if isinstance(value, str) and value.endswith(AUDIO_SUFFIXES):
+                audio = voiceovers / value
+                if text and audio.is_file():
+                    pairs.append((text, audio))
+    return pairs
+
+
+def scene_deps(info, overrides=None):
+    """{dependency key: digest} for one scenes.SceneInfo."""
+    tree = parse(info.path)
+    folder = info.path.parent
+    closure = code_closure(tree, [info.name])
+    deps = {}
+
+    for name, node in closure.items():
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            continue
+        deps[f"code:{name}"] = _node_digest(node)
+
+    # Sibling modules: top-level imports the scene uses, star imports, and
+    # imports inside the functions it calls (the lazy speech-service ones)
+    imports = [n for n in tree.body if isinstance(n, ast.ImportFrom)
+               and any(a.name == "*" for a in n.names)]
+    for node in closure.values():
+        imports.extend(n for n in ast.walk(node) if isinstance(n, (ast.Import, ast.ImportFrom)))
+    for node in imports:
+        for path in _sibling_module(folder, node):
+            module_deps(path, deps)
+
+    plain, patterns = _strings(closure.values())
+    for text in plain:
+        if text.lower().endswith(ASSET_SUFFIXES):
+            asset = folder / text
+            if asset.is_file():
+                deps[f"asset:{text}"] = file_digest(asset)
+
+    for text, audio in voiceover_entries(folder):
+        if text in plain or any(p.fullmatch(text) for p in patterns):
+            deps[f"audio:{audio.name}"] = file_digest(audio)
+
+    for flag, value in sorted((overrides or {}).items()):
+        deps[f"override:{flag}"] = repr(value)
+    deps["lib:manim"] = manim_version()
+    return dict(sorted(deps.items()))
+
+
+@lru_cache(maxsize=None)
+def manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "not installed"
+
+
+def fingerprint(deps):
+    """One short hash for a dep dict."""
+    return _digest(json.dumps(deps, sort_keys=True))
+
+
+def explain(old, new):
+    """Reasons `new` differs from `old`, one string per changed dependency."""
+    reasons = []
+    for key in sorted(set(old) | set(new)):
+        if key not in old:
+            reasons.append(f"new dependency {key}")
+        elif key not in new:
+            reasons.append(f"no longer depends on {key}")
+        elif old[key] != new[key]:
+            reasons.append(f"{key} changed")
+    return reasons
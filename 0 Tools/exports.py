@@ -0,0 +1,309 @@
+"""
+Render-output manifest and partial-movie dedup store for "0 Exports".
+
+    render   render a scene, copy the final video into "0 Exports/<folder>/<file>/"
+             and record it in "0 Exports/manifest.json"
+    dedup    hard-link identical partial movies (across scenes and quality
+             levels) to one copy in "0 Exports/.store"
+    gc       delete partial movies no final video uses, by age and/or size budget
+    list     show the manifest
+
+Usage:
+    python "0 Tools/exports.py" render LPSPart2NaiveExpandSolutions -q h
+    python "0 Tools/exports.py" dedup
+    python "0 Tools/exports.py" gc --max-age-days 7 --budget-gb 20 --dry-run
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import deps
+import scenes
+
+EXPORTS_DIR = scenes.ROOT / "0 Exports"
+MANIFEST = EXPORTS_DIR / "manifest.json"
+STORE_DIR = EXPORTS_DIR / ".store"
+
+
+# ---------------------------------- #
+#  Helpers
+# ---------------------------------- #
+def file_digest(path, chunk_size=1 << 20):
+    """sha256 of a file, read in 1 MB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def video_duration(path):
+    """Duration in seconds according to ffprobe, or None if it is unavailable."""
+    try:
+        out = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+             "-of", "default=noprint_wrappers=1:nokey=1", str(path)],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        return round(float(out), 3)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+
+
+def load_manifest():
+    if MANIFEST.exists():
+        return json.loads(MANIFEST.read_text(encoding="utf-8"))
+    return []
+
+
+def save_manifest(entries):
+    """Writes to a temp file first so a crash never leaves half a manifest."""
+    EXPORTS_DIR.mkdir(exist_ok=True)
+    tmp = MANIFEST.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(entries, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, MANIFEST)
+
+
+def link_or_copy(src, dst):
+    """Hard-links src to dst, falling back to a copy across filesystems."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _rel(path):
+    try:
+        return str(Path(path).resolve().relative_to(scenes.ROOT))
+    except ValueError:
+        return str(path)
+
+
+# ---------------------------------- #
+#  Manifest
+# ---------------------------------- #
+def export_path(info, quality, suffix=".mp4"):
+    """
+    "0 Exports/<folder>/<file stem>/<Scene>_<quality><suffix>". The file
+    stem is part of it because class names repeat within a folder
+    (ColorChangingShape is in both test.py and test blue.py).
+    """
+    return EXPORTS_DIR / info.path.parent.name / info.path.stem / f"{info.name}_{quality}{suffix}"
+
+
+def record(info, movie_path, quality, render_time, partials=(), overrides=None):
+    """
+    Publishes a finished movie at export_path() and appends a manifest entry for it, including the scene's dependency
+    digests (see deps.py) so build.py can tell later what went stale.
+    Returns the entry.
+    """
+    movie_path = Path(movie_path)
+    scene_deps = deps.scene_deps(info, overrides)
+    target = export_path(info, quality, movie_path.suffix)
+    link_or_copy(movie_path, target)
+
+    entry = {
+        "scene": info.name,
+        "file": _rel(info.path),
+        "fingerprint": deps.fingerprint(scene_deps),
+        "quality": quality,
+        "duration": video_duration(target),
+        "render_time": round(render_time, 3),
+        "bytes": target.stat().st_size,
+        "sha256": file_digest(target),
+        "export": _rel(target),
+        "source": _rel(movie_path),
+        "partials": [_rel(p) for p in partials],
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "deps": scene_deps,
+    }
+    entries = load_manifest()
+    entries.append(entry)
+    save_manifest(entries)
+    return entry
+
+
+def latest_entries(entries=None):
+    """The newest manifest entry for every (file, scene, quality)."""
+    latest = {}
+    for entry in entries if entries is not None else load_manifest():
+        latest[entry["file"], entry["scene"], entry["quality"]] = entry
+    return list(latest.values())
+
+
+def render_and_record(info, quality="l", overrides=None):
+    """Renders a scene with scenes.render, then records it."""
+    start = time.perf_counter()
+    scene = scenes.render(info, quality, overrides=overrides)
+    elapsed = time.perf_counter() - start
+    writer = scene.renderer.file_writer
+    partials = [p for p in getattr(writer, "partial_movie_files", []) if p]
+    entry = record(info, writer.movie_file_path, quality, elapsed, partials, overrides)
+    if entry["duration"] is None:
+        entry["duration"] = round(scene.renderer.time, 3)
+        entries = load_manifest()
+        entries[-1] = entry
+        save_manifest(entries)
+    return entry
+
+
+# ---------------------------------- #
+#  Partial movies: dedup and GC
+# ---------------------------------- #
+def media_dirs():
+    """Every manim media folder in the repo (one per scene folder)."""
+    return sorted(p for p in scenes.ROOT.glob("*/media") if p.is_dir())
+
+
+def partial_movies(roots=None):
+    """All partial movie files under the media folders."""
+    for root in roots or media_dirs():
+        for path in Path(root).rglob("partial_movie_files/*/*"):
+            if path.is_file() and path.suffix in (".mp4", ".mov", ".webm"):
+                yield path
+
+
+def referenced_partials(roots=None):
+    """
+    Partials some final video still needs: those listed in the manifest
+    plus those in manim's own partial_movie_file_list.txt (the last render
+    of each scene at each quality).
+    """
+    referenced = set()
+    for entry in latest_entries():
+        referenced.update((scenes.ROOT / p).resolve() for p in entry["partials"])
+    for root in roots or media_dirs():
+        for listing in Path(root).rglob("partial_movie_file_list.txt"):
+            for line in listing.read_text(encoding="utf-8").splitlines():
+                # Lines look like: file 'file:/abs/path/123_abc.mp4'
+                if line.startswith("file "):
+                    name = line[5:].strip().strip("'")
+                    name = name[5:] if name.startswith("file:") else name
+                    referenced.add(Path(name).resolve())
+    return referenced
+
+
+def dedup(roots=None, dry_run=False):
+    """
+    Content-addressed dedup: every partial is hashed and replaced by a hard
+    link to ".store/<aa>/<hash><ext>". Identical partials (the same play
+    rendered in two scenes, or untouched sections re-rendered) then share
+    one copy on disk. Returns (files seen, bytes saved).
+    """
+    seen = saved = 0
+    for path in partial_movies(roots):
+        seen += 1
+        digest = file_digest(path)
+        obj = STORE_DIR / digest[:2] / (digest + path.suffix)
+        if not obj.exists():
+            if not dry_run:
+                link_or_copy(path, obj)
+            continue
+        if obj.stat().st_ino == path.stat().st_ino:
+            continue
+        saved += path.stat().st_size
+        if not dry_run:
+            try:
+                tmp = path.with_suffix(path.suffix + ".tmp")
+                os.link(obj, tmp)
+                os.replace(tmp, path)
+            except OSError:
+                saved -= path.stat().st_size
+    return seen, saved
+
+
+def gc(roots=None, max_age_days=None, budget_bytes=None, dry_run=False):
+    """
+    Removes unreferenced partial movies:
+      - any older than max_age_days, then
+      - oldest first until all partials fit in budget_bytes.
+    Store objects nothing links to any more are removed as well.
+    Returns the list of removed paths.
+    """
+    referenced = referenced_partials(roots)
+    now = time.time()
+    candidates = []
+    total = 0
+    for path in partial_movies(roots):
+        stat = path.stat()
+        total += stat.st_size
+        if path.resolve() not in referenced:
+            candidates.append((stat.st_mtime, stat.st_size, path))
+    candidates.sort()
+
+    removed = []
+    for mtime, size, path in candidates:
+        too_old = max_age_days is not None and now - mtime > max_age_days * 86400
+        over_budget = budget_bytes is not None and total > budget_bytes
+        if not (too_old or over_budget):
+            continue
+        removed.append(path)
+        total -= size
+        if not dry_run:
+            path.unlink()
+
+    if STORE_DIR.exists() and not dry_run:
+        for obj in STORE_DIR.glob("*/*"):
+            if obj.stat().st_nlink == 1:
+                obj.unlink()
+                removed.append(obj)
+    return removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    render_cmd = sub.add_parser("render", help="render a scene and record it")
+    render_cmd.add_argument("scene", help="ClassName or FILE:ClassName")
+    render_cmd.add_argument("-q", "--quality", default="l", choices=sorted(scenes.QUALITIES))
+    render_cmd.add_argument("--no-narration", action="store_true")
+
+    dedup_cmd = sub.add_parser("dedup", help="hard-link identical partial movies")
+    dedup_cmd.add_argument("--dry-run", action="store_true")
+
+    gc_cmd = sub.add_parser("gc", help="delete unreferenced partial movies")
+    gc_cmd.add_argument("--max-age-days", type=float)
+    gc_cmd.add_argument("--budget-gb", type=float)
+    gc_cmd.add_argument("--dry-run", action="store_true")
+
+    sub.add_parser("list", help="show the newest export of every scene")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "render":
+        try:
+            info = scenes.find_scene(args.scene)
+        except LookupError as err:
+            parser.error(str(err))
+        overrides = {"INCLUDE_NARRATION": False} if args.no_narration else None
+        entry = render_and_record(info, args.quality, overrides)
+        print(f"{entry['export']}  {entry['duration']}s  rendered in {entry['render_time']}s")
+    elif args.command == "dedup":
+        seen, saved = dedup(dry_run=args.dry_run)
+        print(f"{seen} partial movies, {saved / 1e6:.1f} MB saved")
+    elif args.command == "gc":
+        if args.max_age_days is None and args.budget_gb is None:
+            parser.error("give --max-age-days and/or --budget-gb")
+        budget = None if args.budget_gb is None else int(args.budget_gb * 1e9)
+        removed = gc(max_age_days=args.max_age_days, budget_bytes=budget, dry_run=args.dry_run)
+        for path in removed:
+            print(("would remove " if args.dry_run else "removed ") + _rel(path))
+        print(f"{len(removed)} files")
+    elif args.command == "list":
+        for entry in latest_entries():
+            print(f"{entry['scene']:<36} {entry['quality']}  {entry['fingerprint']}  "
+                  f"{entry['duration']}s  {entry['created']}  {entry['export']}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
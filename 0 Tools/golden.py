@@ -0,0 +1,294 @@
+"""
+Golden-frame regression check: did a manim upgrade or a helper refactor
+(create_tile, voiceover_or_play, ...) change what the scenes look like?
+
+Every scene is run at low quality with animations skipped (each play jumps
+straight to its end state, nothing is encoded) and the frame on screen is
+grabbed at every section boundary (the ones checkpoints.py knows:
+next_section calls and top-level method calls in construct), after every
+--every-th play (waits count), and at the end. Most scenes have no sections
+and end on an empty screen, so the play samples are what actually covers
+them; an empty play sample carries nothing and is not kept. A scene whose
+frames are all empty fails, and so does a frame that was drawn in the
+golden set and is empty now.
+Each grab is reduced to a 64-bit perceptual hash, the sign pattern of the
+lowest 8x8 DCT coefficients of a 32x32 grayscale thumbnail, so antialiasing
+and font hinting noise don't count but a moved or recoloured shape does.
+
+    update   record the current frames as golden ("0 Exports/golden/")
+    check    compare against golden; a frame whose hash is more than
+             --tolerance bits away fails and gets a golden | new | diff
+             image in "0 Exports/golden/diff/"
+
+Scenes run one per process, narration off. All scenes on 8 cores take
+well under a minute, since only the grabbed frames are ever drawn.
+
+Usage:
+    python "0 Tools/golden.py" update
+    python "0 Tools/golden.py" check
+    python "0 Tools/golden.py" check "6 Manachers" FibonacciExplainer -t 4
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import build
+import checkpoints
+import exports
+import scenes
+
+GOLDEN_DIR = exports.EXPORTS_DIR / "golden"
+GOLDEN_FILE = GOLDEN_DIR / "golden.json"
+DIFF_DIR = GOLDEN_DIR / "diff"
+HASH_SIZE = 8           # 8x8 DCT coefficients -> 64-bit hash
+THUMBNAIL_SIZE = 32
+TOLERANCE = 6           # bits out of 64
+SAMPLE_EVERY = 8        # grab after every 8th play
+EMPTY_RANGE = 8         # a frame whose channel values span less than this is empty
+
+
+# ---------------------------------- #
+#  Perceptual hash
+# ---------------------------------- #
+def _dct_matrix(n):
+    k = np.arange(n)[:, None]
+    x = np.arange(n)[None, :]
+    return np.cos(np.pi * (2 * x + 1) * k / (2 * n))
+
+
+_DCT = _dct_matrix(THUMBNAIL_SIZE)
+
+
+def thumbnail(frame, size=THUMBNAIL_SIZE):
+    """Grayscale area-average downscale of an RGB(A) frame to size x size."""
+    gray = np.asarray(frame, dtype=np.float64)[..., :3] @ (0.299, 0.587, 0.114)
+    rows = np.linspace(0, gray.shape[0], size + 1).astype(int)
+    cols = np.linspace(0, gray.shape[1], size + 1).astype(int)
+    sums = np.add.reduceat(np.add.reduceat(gray, rows[:-1], axis=0), cols[:-1], axis=1)
+    return sums / np.outer(np.diff(rows), np.diff(cols))
+
+
+def perceptual_hash(frame):
+    """64-bit pHash of a frame as 16 hex digits."""
+    coefficients = (_DCT @ thumbnail(frame) @ _DCT.T)[:HASH_SIZE, :HASH_SIZE].ravel()
+    bits = coefficients > np.median(coefficients[1:])   # the DC term is just brightness
+    return f"{int(''.join('1' if b else '0' for b in bits), 2):016x}"
+
+
+def hash_distance(a, b):
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+def is_empty(frame):
+    """True for a frame that is just the background color."""
+    return int(np.ptp(np.asarray(frame)[..., :3])) < EMPTY_RANGE
+
+
+# ---------------------------------- #
+#  Grabbing frames
+# ---------------------------------- #
+class GoldenMixin(checkpoints.CheckpointMixin):
+    """
+    Grabs the frame at every checkpoint boundary instead of saving a
+    checkpoint, and after every sample_every-th play.
+    """
+    sample_every = SAMPLE_EVERY
+
+    def setup(self):
+        super().setup()
+        self.golden_frames = []
+        self.golden_plays = 0
+
+    def play(self, *args, **kwargs):
+        super().play(*args, **kwargs)
+        self.golden_plays += 1
+        if self.sample_every and self.golden_plays % self.sample_every == 0:
+            self.grab(f"play {self.golden_plays}", keep_empty=False)
+
+    def construct(self):
+        super().construct()
+        self.grab("end")
+
+    def save_checkpoint(self, name, frame, resume_after=True):
+        self.grab(name)
+
+    def grab(self, name, keep_empty=True):
+        self.renderer.update_frame(self, ignore_skipping=True)
+        frame = np.array(self.renderer.get_frame())
+        if not keep_empty and is_empty(frame):
+            return
+        taken = sum(1 for n, _ in self.golden_frames if n.split("#")[0] == name)
+        if taken:
+            name = f"{name}#{taken + 1}"
+        self.golden_frames.append((name, frame))
+
+
+def scene_key(info):
+    return f"{exports._rel(info.path)}:{info.name}"
+
+
+def capture(info, quality="l", overrides=None, every=SAMPLE_EVERY):
+    """Worker: runs one scene with animations skipped, returns [(boundary, RGBA frame)]."""
+    scene_cls = type(info.name, (GoldenMixin, scenes.load_scene(info, overrides)),
+                     {"scene_info": info, "sample_every": every})
+    scene = scenes.render(info, quality, overrides=overrides, scene_cls=scene_cls,
+                          skip_animations=True, dry_run=True, disable_caching=True)
+    return scene.golden_frames
+
+
+def capture_all(infos, quality="l", overrides=None, jobs=None, every=SAMPLE_EVERY):
+    """Yields (SceneInfo, frames or None, error text) as the workers finish."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(), mp_context=context) as pool:
+        futures = {pool.submit(capture, info, quality, overrides, every): info for info in infos}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception:
+                yield futures[future], None, traceback.format_exc()
+
+
+# ---------------------------------- #
+#  Golden store
+# ---------------------------------- #
+def load_golden():
+    if GOLDEN_FILE.exists():
+        return json.loads(GOLDEN_FILE.read_text(encoding="utf-8"))
+    return {}
+
+
+def save_golden(golden):
+    GOLDEN_FILE.parent.mkdir(parents=True, exist_ok=True)
+    GOLDEN_FILE.write_text(json.dumps(dict(sorted(golden.items())), indent=1) + "\n", encoding="utf-8")
+
+
+def _image_path(info, index, name, root=GOLDEN_DIR):
+    safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+    return root / info.path.parent.name / info.path.stem / info.name / f"{index:02d}_{safe}.png"
+
+
+def record(info, frames, quality):
+    """Writes the reference PNGs for one scene and returns its golden entry."""
+    from PIL import Image
+
+    folder = _image_path(info, 0, "x").parent
+    for old in folder.glob("*.png"):
+        old.unlink()
+    entry = {"quality": quality, "frames": []}
+    for index, (name, frame) in enumerate(frames):
+        path = _image_path(info, index, name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        Image.fromarray(frame).save(path)
+        entry["frames"].append({
+            "section": name,
+            "hash": perceptual_hash(frame),
+            "empty": is_empty(frame),
+            "image": str(path.relative_to(GOLDEN_DIR)),
+        })
+    return entry
+
+
+def diff_image(golden_path, frame, target):
+    """golden | new | amplified absolute difference, side by side."""
+    from PIL import Image
+
+    new = Image.fromarray(frame).convert("RGB")
+    if golden_path.exists():
+        old = Image.open(golden_path).convert("RGB").resize(new.size)
+    else:
+        old = Image.new("RGB", new.size)
+    a, b = np.asarray(old, dtype=np.int16), np.asarray(new, dtype=np.int16)
+    delta = np.clip(np.abs(a - b) * 4, 0, 255).astype(np.uint8)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(np.hstack([a.astype(np.uint8), b.astype(np.uint8), delta])).save(target)
+    return target
+
+
+def compare(info, frames, entry, tolerance=TOLERANCE):
+    """Failure messages for one scene; writes a diff image for each failing frame."""
+    if entry is None:
+        return ["no golden frames (run update)"]
+    failures = []
+    if all(is_empty(frame) for _, frame in frames):
+        failures.append("every sampled frame is empty")
+    expected = {f["section"]: f for f in entry["frames"]}
+    got = [name for name, _ in frames]
+    for name in expected:
+        if name not in got:
+            failures.append(f"{name}: no longer reached (or now empty)")
+    for index, (name, frame) in enumerate(frames):
+        reference = expected.get(name)
+        if reference is None:
+            failures.append(f"{name}: new frame")
+            continue
+        if is_empty(frame) and not reference.get("empty", False):
+            target = _image_path(info, index, name, DIFF_DIR)
+            diff_image(GOLDEN_DIR / reference["image"], frame, target)
+            failures.append(f"{name}: empty, golden was drawn -> {target.relative_to(scenes.ROOT)}")
+            continue
+        distance = hash_distance(reference["hash"], perceptual_hash(frame))
+        if distance > tolerance:
+            target = _image_path(info, index, name, DIFF_DIR)
+            diff_image(GOLDEN_DIR / reference["image"], frame, target)
+            failures.append(f"{name}: {distance} bits off -> {target.relative_to(scenes.ROOT)}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("command", choices=("check", "update"))
+    parser.add_argument("targets", nargs="*", help="scene names, FILE:Scene, files or folders (default: all)")
+    parser.add_argument("-q", "--quality", default="l", choices=sorted(scenes.QUALITIES))
+    parser.add_argument("-t", "--tolerance", type=int, default=TOLERANCE, help="allowed differing hash bits")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--every", type=int, default=SAMPLE_EVERY,
+                        help="also grab after every N-th play (0: boundaries only)")
+    args = parser.parse_args(argv)
+
+    try:
+        infos = build.resolve_targets(args.targets)
+    except LookupError as err:
+        parser.error(str(err))
+    overrides = {"INCLUDE_NARRATION": False}
+    golden = load_golden()
+    start = time.perf_counter()
+    failed = 0
+
+    for info, frames, error in capture_all(infos, args.quality, overrides, args.jobs, args.every):
+        key = scene_key(info)
+        if error:
+            failed += 1
+            print(f"ERROR {key}\n{error}", file=sys.stderr)
+            continue
+        if args.command == "update":
+            if all(is_empty(frame) for _, frame in frames):
+                failed += 1
+                print(f"FAIL  {key}: every sampled frame is empty, nothing to record")
+                continue
+            golden[key] = record(info, frames, args.quality)
+            print(f"recorded {key} ({len(frames)} frames)")
+            continue
+        failures = compare(info, frames, golden.get(key), args.tolerance)
+        if failures:
+            failed += 1
+            print(f"FAIL  {key}")
+            for failure in failures:
+                print(f"    {failure}")
+        else:
+            print(f"ok    {key} ({len(frames)} frames)")
+
+    if args.command == "update":
+        save_golden(golden)
+    print(f"{len(infos)} scenes, {failed} failed, {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+"""
+Loudness-normalized audio mix for a rendered scene, without re-rendering.
+
+Narration clips from Azure, gTTS and the recorder all come in at different
+levels, and the music bed is set with a hand-tuned add_sound(..., gain=-23).
+Here every clip is instead brought to a loudness target and the music is
+ducked under the narration:
+
+    1. `render` renders the scene while logging every add_sound call
+       (file, start time, gain) to "<movie>.sounds.json"
+    2. each clip's integrated loudness (BS.1770 K-weighting with EBU R128
+       gating) is measured once and cached by file digest in
+       "0 Exports/loudness.json"
+    3. the timeline is mixed at 48 kHz: narration to -23 LUFS, music to
+       -35 LUFS, music ducked by 9 dB wherever narration is active (with
+       lead-in and release), peaks held below -1 dBFS
+    4. the mix replaces the movie's audio track ("<movie>_mixed.mp4",
+       video stream copied)
+
+`mix` repeats steps 2-4 from an existing log with other targets, so trying
+a different duck depth or music level takes seconds instead of a render.
+The hand-set gains in the log are ignored; the targets replace them.
+
+Usage:
+    python "0 Tools/mixdown.py" render BoundedFunctionsWithNarration -q h
+    python "0 Tools/mixdown.py" mix "3 Bounded Functions/media/videos/Math Class/1080p60/BoundedFunctionsWithNarration.mp4" --duck-db -12
+    python "0 Tools/mixdown.py" loudness "3 Bounded Functions/Zeta.mp3"
+"""
+import argparse
+import json
+import subprocess
+import sys
+import wave
+from pathlib import Path
+
+import numpy as np
+
+import deps
+import exports
+import scenes
+
+SAMPLE_RATE = 48000
+LOUDNESS_CACHE = exports.EXPORTS_DIR / "loudness.json"
+NARRATION_LUFS = -23.0      # EBU R128 programme target
+MUSIC_LUFS = -35.0          # bed sits well under the voice
+DUCK_DB = -9.0
+DUCK_THRESHOLD_DB = -50.0   # narration energy above this counts as speech
+PEAK_DBFS = -1.0
+
+# BS.1770 K-weighting at 48 kHz: high-shelf, then high-pass (b, a)
+K_WEIGHTING = (
+    ((1.53512485958697, -2.69169618940638, 1.19839281085285),
+     (1.0, -1.69065929318241, 0.73248077421585)),
+    ((1.0, -2.0, 1.0),
+     (1.0, -1.99004745483398, 0.99007225036621)),
+)
+
+
+# ---------------------------------- #
+#  Logging sounds at render time
+# ---------------------------------- #
+class SoundLogMixin:
+    """Records every add_sound call (voiceovers included) to <movie>.sounds.json."""
+    def setup(self):
+        super().setup()
+        self.sound_log = []
+
+    def add_sound(self, sound_file, time_offset=0, gain=None, **kwargs):
+        if not self.renderer.skip_animations:
+            path = Path(sound_file).resolve()
+            self.sound_log.append({
+                "file": str(path),
+                "start": round(self.renderer.time + time_offset, 4),
+                "gain": gain,
+                "kind": "narration" if "voiceovers" in path.parts else "music",
+            })
+        return super().add_sound(sound_file, time_offset, gain, **kwargs)
+
+    def tear_down(self):
+        super().tear_down()
+        log = sound_log_path(self.renderer.file_writer.movie_file_path)
+        log.parent.mkdir(parents=True, exist_ok=True)
+        log.write_text(json.dumps(self.sound_log, indent=1) + "\n", encoding="utf-8")
+
+
+def sound_log_path(movie):
+    movie = Path(movie)
+    return movie.with_name(movie.stem + ".sounds.json")
+
+
+# ---------------------------------- #
+#  Loudness
+# ---------------------------------- #
+def load_audio(path, rate=SAMPLE_RATE):
+    """A clip as float samples in [-1, 1], shape (n, 2), at `rate`."""
+    from pydub import AudioSegment
+
+    clip = AudioSegment.from_file(str(path)).set_frame_rate(rate).set_channels(2).set_sample_width(2)
+    return np.frombuffer(clip.raw_data, dtype=np.int16).reshape(-1, 2) / 32768.0
+
+
+def k_weight(samples, rate=SAMPLE_RATE):
+    """K-weighted copy of (n, channels) samples, filtered in the frequency domain."""
+    n = len(samples)
+    size = 1 << int(np.ceil(np.log2(n + rate)))      # a second of padding keeps the IIR tail from wrapping
+    z = np.exp(-1j * 2 * np.pi * np.fft.rfftfreq(size, 1 / rate) / rate)
+    response = np.ones_like(z)
+    for b, a in K_WEIGHTING:
+        response *= np.polyval(b[::-1], z) / np.polyval(a[::-1], z)
+    return np.fft.irfft(np.fft.rfft(samples, size, axis=0) * response[:, None], size, axis=0)[:n]
+
+
+def integrated_loudness(samples, rate=SAMPLE_RATE):
+    """Integrated loudness in LUFS (400 ms blocks, 75% overlap, -70 LUFS and -10 LU gates), None if silent."""
+    weighted = k_weight(samples, rate)
+    block, step = int(0.4 * rate), int(0.1 * rate)
+    energy = np.concatenate([np.zeros((1, weighted.shape[1])), np.cumsum(weighted ** 2, axis=0)])
+    if len(weighted) < block:
+        powers = (energy[-1] / max(len(weighted), 1)).sum(keepdims=True)
+    else:
+        starts = np.arange(0, len(weighted) - block + 1, step)
+        powers = ((energy[starts + block] - energy[starts]) / block).sum(axis=1)
+    with np.errstate(divide="ignore"):
+        loudness = -0.691 + 10 * np.log10(powers)
+    gated = powers[loudness > -70]
+    if not len(gated):
+        return None
+    relative = -0.691 + 10 * np.log10(gated.mean()) - 10
+    gated = powers[(loudness > -70) & (loudness > relative)]
+    return float(-0.691 + 10 * np.log10(gated.mean()))
+
+
+def load_loudness_cache():
+    if LOUDNESS_CACHE.exists():
+        return json.loads(LOUDNESS_CACHE.read_text(encoding="utf-8"))
+    return {}
+
+
+def clip_loudness(path, samples=None, cache=None):
+    """Cached integrated loudness of a file; measured (and stored) only the first time."""
+    cache = load_loudness_cache() if cache is None else cache
+    digest = deps.file_digest(path)
+    if digest not in cache:
+        if samples is None:
+            samples = load_audio(path)
+        cache[digest] = integrated_loudness(samples)
+        LOUDNESS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        LOUDNESS_CACHE.write_text(json.dumps(cache, indent=1) + "\n", encoding="utf-8")
+    return cache[digest]
+
+
+# ---------------------------------- #
+#  Mixing
+# ---------------------------------- #
+def duck_envelope(narration, duck_db=DUCK_DB, threshold_db=DUCK_THRESHOLD_DB,
+                  lead=0.25, release=0.6, ramp=0.15, rate=SAMPLE_RATE):
+    """
+    Per-sample gain for the music bed: 1 where nobody speaks, duck_db under
+    speech. Decided on 10 ms hops; speech holds the duck from `lead`
+    seconds before it to `release` after it, with `ramp`-long fades.
+    """
+    hop = rate // 100
+    hops = -(-len(narration) // hop)
+    if not hops:
+        return np.ones(0)
+    padded = np.zeros((hops * hop, narration.shape[1]))
+    padded[:len(narration)] = narration
+    power = (padded ** 2).reshape(hops, -1).mean(axis=1)
+    active = power > 10 ** (threshold_db / 10)
+
+    before, after = round(lead * 100), round(release * 100)
+    held = np.convolve(active, np.ones(before + after + 1))[before:before + hops] > 0
+    fade = max(round(ramp * 100), 1)
+    smooth = np.convolve(held.astype(float), np.ones(fade) / fade, mode="same")
+    envelope = 1 - (1 - 10 ** (duck_db / 20)) * smooth
+    return np.repeat(envelope, hop)[:len(narration)]
+
+
+def mix(log, narration_lufs=NARRATION_LUFS, music_lufs=MUSIC_LUFS, duck_db=DUCK_DB,
+        rate=SAMPLE_RATE, out=print):
+    """Mixes a sound log into one (n, 2) float timeline."""
+    cache = load_loudness_cache()
+    clips = []
+    for entry in log:
+        samples = load_audio(entry["file"], rate)
+        lufs = clip_loudness(entry["file"], samples, cache)
+        target = narration_lufs if entry["kind"] == "narration" else music_lufs
+        gain_db = 0.0 if lufs is None else target - lufs
+        clips.append((entry, samples, gain_db))
+        out(f"  {entry['kind']:<9} {entry['start']:8.2f}s  "
+            f"{'silent' if lufs is None else f'{lufs:6.1f} LUFS'} -> {gain_db:+6.1f} dB  {Path(entry['file']).name}")
+
+    length = max((round(e["start"] * rate) + len(s) for e, s, _ in clips), default=0)
+    buses = {"narration": np.zeros((length, 2)), "music": np.zeros((length, 2))}
+    for entry, samples, gain_db in clips:
+        start = round(entry["start"] * rate)
+        buses[entry["kind"]][start:start + len(samples)] += samples * 10 ** (gain_db / 20)
+
+    timeline = buses["narration"] + buses["music"] * duck_envelope(buses["narration"], duck_db, rate=rate)[:, None]
+    peak = np.abs(timeline).max(initial=0)
+    limit = 10 ** (PEAK_DBFS / 20)
+    if peak > limit:
+        timeline *= limit / peak
+        out(f"  peak {20 * np.log10(peak):+.1f} dBFS, whole mix lowered {20 * np.log10(limit / peak):.1f} dB")
+    return timeline
+
+
+def write_wav(path, timeline, rate=SAMPLE_RATE):
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(timeline.shape[1])
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(np.round(np.clip(timeline, -1, 1) * 32767).astype("<i2").tobytes())
+
+
+def remix(movie, narration_lufs=NARRATION_LUFS, music_lufs=MUSIC_LUFS, duck_db=DUCK_DB, out=print):
+    """Mixes a rendered movie's sound log and muxes it in as <movie>_mixed.mp4."""
+    movie = Path(movie)
+    log_file = sound_log_path(movie)
+    if not log_file.exists():
+        raise FileNotFoundError(f"{log_file.name} not found; render with `mixdown.py render` first")
+    log = json.loads(log_file.read_text(encoding="utf-8"))
+    out(f"{movie.name}: {len(log)} sounds")
+    wav = movie.with_name(movie.stem + "_mix.wav")
+    write_wav(wav, mix(log, narration_lufs, music_lufs, duck_db, out=out))
+    target = movie.with_name(movie.stem + "_mixed" + movie.suffix)
+    try:
+        subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-i", str(movie), "-i", str(wav),
+             "-map", "0:v", "-map", "1:a", "-c:v", "copy", "-c:a", "aac", "-b:a", "192k", str(target)],
+            check=True,
+        )
+    finally:
+        wav.unlink(missing_ok=True)
+    out(f"-> {target}")
+    return target
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    levels = argparse.ArgumentParser(add_help=False)
+    levels.add_argument("--narration-lufs", type=float, default=NARRATION_LUFS)
+    levels.add_argument("--music-lufs", type=float, default=MUSIC_LUFS)
+    levels.add_argument("--duck-db", type=float, default=DUCK_DB)
+
+    render_cmd = sub.add_parser("render", parents=[levels], help="render with a sound log, then mix")
+    render_cmd.add_argument("scene", help="ClassName or FILE:ClassName")
+    render_cmd.add_argument("-q", "--quality", default="l", choices=sorted(scenes.QUALITIES))
+
+    mix_cmd = sub.add_parser("mix", parents=[levels], help="mix again from an existing sound log")
+    mix_cmd.add_argument("movie")
+
+    loudness_cmd = sub.add_parser("loudness", help="integrated loudness of audio files")
+    loudness_cmd.add_argument("files", nargs="+")
+
+    args = parser.parse_args(argv)
+    if args.command == "loudness":
+        cache = load_loudness_cache()
+        for path in args.files:
+            lufs = clip_loudness(path, cache=cache)
+            print(f"{'silent' if lufs is None else f'{lufs:6.1f} LUFS'}  {path}")
+        return 0
+
+    levels = (args.narration_lufs, args.music_lufs, args.duck_db)
+    if args.command == "render":
+        try:
+            info = scenes.find_scene(args.scene)
+        except LookupError as err:
+            parser.error(str(err))
+        scene_cls = type(info.name, (SoundLogMixin, scenes.load_scene(info)), {})
+        scene = scenes.render(info, args.quality, scene_cls=scene_cls)
+        movie = Path(scene.renderer.file_writer.movie_file_path)
+        remix(movie if movie.is_absolute() else info.path.parent / movie, *levels)
+    else:
+        remix(args.movie, *levels)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,442 @@
+"""
+Every narration line in the series, found statically (no scene is run), with
+a duration estimate per line, section and video.
+
+A narration line is the text of a voiceover_or_play(..., text=...) or
+self.voiceover(text=...) call, in any of its forms (scene method, module
+helper, helper nested in construct). The text may be a literal, a string
+variable assigned earlier in the same function, or an f-string (kept with
+its {placeholders} and marked ~, since its exact wording is only known at
+render time). Names bound by an enclosing for loop over a list or tuple
+(also through zip, enumerate and constant slices) and constant subscripts
+of one give one line per item. Text that still can't be read is listed as
+an unresolved line (marked ?, its source expression as the text) rather
+than dropped. Lines are listed in the order construct reaches them,
+following top-level self.method() calls, so sections match checkpoints.py.
+
+Durations come from the voiceover cache when the line was already
+synthesized or recorded (media/voiceovers), else from a words-per-minute
+model. Only narration is counted, not the silent plays and waits between
+lines, so the totals are a lower bound on video length.
+
+    plan   per-video and per-section timeline (default)
+    list   every line with its source line and duration
+    warm   synthesize the lines that are not cached yet with the scene's own
+           make_speech_service(), so renders don't wait on TTS
+
+Usage:
+    python "0 Tools/narration.py" plan
+    python "0 Tools/narration.py" list "6 Manachers" --wpm 140
+    python "0 Tools/narration.py" warm FibonacciExplainer
+"""
+import argparse
+import ast
+import re
+import sys
+import wave
+from collections import namedtuple
+
+import build
+import checkpoints
+import deps
+import scenes
+
+WORDS_PER_MINUTE = 150
+NARRATION_CALLS = ("voiceover_or_play", "voiceover")
+
+NarrationLine = namedtuple("NarrationLine", "scene section lineno text exact resolved", defaults=(True,))
+
+
+# ---------------------------------- #
+#  Extracting lines
+# ---------------------------------- #
+def _calls_in_order(func):
+    """
+    [(call, loops)] for the calls in a function body in source order, not
+    descending into nested defs; loops are the enclosing for statements,
+    outermost first.
+    """
+    calls = []
+
+    def visit(node, loops):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+                continue
+            if isinstance(child, ast.Call):
+                calls.append((child, loops))
+            if isinstance(child, ast.For) and child is not node:
+                visit(child, loops + [child])
+            else:
+                visit(child, loops)
+
+    visit(func, [])
+    return sorted(calls, key=lambda found: (found[0].lineno, found[0].col_offset))
+
+
+def _call_name(call):
+    if isinstance(call.func, ast.Attribute):
+        return call.func.attr
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    return None
+
+
+def _is_self_call(call):
+    return (isinstance(call.func, ast.Attribute) and isinstance(call.func.value, ast.Name)
+            and call.func.value.id == "self")
+
+
+def _assignments(scopes):
+    """{name: [(lineno, value node)]} for plain assignments in the given nodes."""
+    found = {}
+    for scope in scopes:
+        for node in ast.walk(scope):
+            if isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        found.setdefault(target.id, []).append((node.lineno, node.value))
+    return found
+
+
+def _earlier(name, assignments, before):
+    earlier = [value for lineno, value in assignments.get(name, []) if lineno < before]
+    return earlier[-1] if earlier else None
+
+
+def _constant_int(node):
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _constant_int(node.operand)
+        return None if value is None else -value
+    if isinstance(node, ast.Constant) and isinstance(node.value, int):
+        return node.value
+    return None
+
+
+def resolve_sequence(node, assignments, before, bindings=None):
+    """
+    The items of a sequence expression we can read statically, or None:
+    list/tuple literals (or names bound to them), constant-bound slices of
+    those, and zip/enumerate/list/tuple over them. zip and enumerate items
+    are Python tuples of nodes (None for a zip argument we can't read).
+    """
+    bindings = bindings or {}
+    if isinstance(node, (ast.List, ast.Tuple)):
+        if any(isinstance(elt, ast.Starred) for elt in node.elts):
+            return None
+        return list(node.elts)
+    if isinstance(node, ast.Name):
+        if node.id in bindings:
+            bound = bindings[node.id]
+            return resolve_sequence(bound, assignments, before) if isinstance(bound, ast.AST) else None
+        value = _earlier(node.id, assignments, before)
+        return None if value is None else resolve_sequence(value, assignments, before, bindings)
+    if isinstance(node, ast.Subscript) and isinstance(node.slice, ast.Slice):
+        items = resolve_sequence(node.value, assignments, before, bindings)
+        bounds = [node.slice.lower, node.slice.upper, node.slice.step]
+        values = [None if b is None else _constant_int(b) for b in bounds]
+        if items is None or any(b is not None and v is None for b, v in zip(bounds, values)):
+            return None
+        return items[slice(*values)]
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+        parts = [resolve_sequence(arg, assignments, before, bindings) for arg in node.args]
+        if node.func.id == "zip" and any(part is not None for part in parts):
+            # unreadable arguments (mobject groups, say) give None items, as long
+            # as the readable ones say how many items there are
+            count = min(len(part) for part in parts if part is not None)
+            return list(zip(*(part if part is not None else [None] * count for part in parts)))
+        if any(part is None for part in parts):
+            return None
+        if node.func.id == "enumerate" and len(parts) == 1:
+            return [(ast.Constant(k), item) for k, item in enumerate(parts[0])]
+        if node.func.id in ("list", "tuple") and len(parts) == 1:
+            return parts[0]
+    return None
+
+
+def resolve_text(node, assignments, before, bindings=None):
+    """(text, exact) for a string expression, or None if it isn't one we can read."""
+    bindings = bindings or {}
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value, True
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        exact = True
+        for value in node.values:
+            bound = bindings.get(value.value.id) if isinstance(getattr(value, "value", None), ast.Name) else None
+            if isinstance(value, ast.Constant):
+                parts.append(value.value)
+            elif (isinstance(bound, ast.Constant) and isinstance(bound.value, (str, int))
+                    and value.conversion == -1 and value.format_spec is None):
+                parts.append(str(bound.value))      # a loop variable with a known value
+            else:
+                parts.append("{" + ast.unparse(value.value) + "}")
+                exact = False
+        return "".join(parts), exact
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left = resolve_text(node.left, assignments, before, bindings)
+        right = resolve_text(node.right, assignments, before, bindings)
+        if left and right:
+            return left[0] + right[0], left[1] and right[1]
+        return None
+    if isinstance(node, ast.Subscript) and not isinstance(node.slice, ast.Slice):
+        items = resolve_sequence(node.value, assignments, before, bindings)
+        index = _constant_int(node.slice)
+        if items is not None and index is not None and -len(items) <= index < len(items):
+            item = items[index]
+            return resolve_text(item, assignments, before, bindings) if isinstance(item, ast.AST) else None
+        return None
+    if isinstance(node, ast.Name):
+        if node.id in bindings:
+            bound = bindings[node.id]
+            return resolve_text(bound, assignments, before) if isinstance(bound, ast.AST) else None
+        value = _earlier(node.id, assignments, before)
+        if value is not None:
+            return resolve_text(value, assignments, before, bindings)
+    return None
+
+
+def _bind(target, item, bindings):
+    """Binds a for-loop target to one item; False if the shapes don't match."""
+    if isinstance(target, ast.Name):
+        bindings[target.id] = item
+        return True
+    if isinstance(target, (ast.Tuple, ast.List)):
+        if isinstance(item, ast.Tuple):
+            item = tuple(item.elts)
+        if not isinstance(item, tuple) or len(item) != len(target.elts):
+            return False
+        return all(_bind(t, i, bindings) for t, i in zip(target.elts, item))
+    return False
+
+
+def _target_names(target):
+    return {n.id for n in ast.walk(target) if isinstance(n, ast.Name)}
+
+
+def _expand(node, loops, assignments, before, bindings=None):
+    """
+    [(text, exact) or None] for a text expression inside for loops: one
+    entry per iteration of every enclosing loop whose target the text uses,
+    None where the text (or the loop it depends on) can't be read.
+    """
+    bindings = bindings or {}
+    used = {n.id for n in ast.walk(node) if isinstance(n, ast.Name)} - set(bindings)
+    for depth in range(len(loops) - 1, -1, -1):
+        loop = loops[depth]
+        if _target_names(loop.target) & used:
+            items = resolve_sequence(loop.iter, assignments, loop.lineno, bindings)
+            if items is None:
+                return [None]
+            expanded = []
+            for item in items:
+                bound = dict(bindings)
+                if not _bind(loop.target, item, bound):
+                    return [None]
+                expanded.extend(_expand(node, loops[:depth], assignments, before, bound))
+            return expanded
+    return [resolve_text(node, assignments, before, bindings)]
+
+
+def _narration_texts(call, loops, assignments):
+    """
+    The text argument of a narration call as [(text, exact) or None], one
+    per loop iteration: text=..., else the last readable positional arg.
+    None marks text that is there but can't be read statically.
+    """
+    for keyword in call.keywords:
+        if keyword.arg == "text":
+            return [(keyword.value, found) for found in _expand(keyword.value, loops, assignments, call.lineno)]
+    for arg in reversed(call.args):
+        found = _expand(arg, loops, assignments, call.lineno)
+        if all(found):
+            return [(arg, text) for text in found]
+    return []
+
+
+def scene_narration(info):
+    """
+    [NarrationLine] for one scene, in the order construct reaches them.
+    Text that can't be read statically still gets a line, with
+    resolved=False and its source expression as the text.
+    """
+    tree = deps.parse(info.path)
+    cls = next((n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == info.name), None)
+    if cls is None:
+        return []
+    methods = {n.name: n for n in cls.body if isinstance(n, ast.FunctionDef)}
+    if "construct" not in methods:
+        return []
+    sections = set(checkpoints.section_methods(tree, info.name))
+    module_assignments = _assignments([n for n in tree.body if isinstance(n, ast.Assign)])
+    lines = []
+    section = "start"
+
+    def visit(func, stack):
+        nonlocal section
+        assignments = {**module_assignments, **_assignments([func])}
+        for call, loops in _calls_in_order(func):
+            name = _call_name(call)
+            if name == "next_section" and _is_self_call(call):
+                title = call.args[0] if call.args else None
+                section = title.value if isinstance(title, ast.Constant) else "unnamed"
+            elif name in NARRATION_CALLS:
+                for node, found in _narration_texts(call, loops, assignments):
+                    if found is None:
+                        lines.append(NarrationLine(info.name, section, call.lineno, ast.unparse(node), False, False))
+                    elif found[0].strip():
+                        lines.append(NarrationLine(info.name, section, call.lineno, *found))
+            elif _is_self_call(call) and name in methods and name not in stack:
+                if len(stack) == 1 and name in sections:
+                    section = name
+                visit(methods[name], stack + [name])
+
+    visit(methods["construct"], ["construct"])
+    return lines
+
+
+def extract_all(infos):
+    """{SceneInfo: [NarrationLine]} for the scenes that have any narration."""
+    found = {}
+    for info in infos:
+        lines = scene_narration(info)
+        if lines:
+            found[info] = lines
+    return found
+
+
+# ---------------------------------- #
+#  Durations
+# ---------------------------------- #
+def audio_duration(path):
+    """Length of a cached clip in seconds, or None if it can't be read without ffmpeg."""
+    if path.suffix == ".wav":
+        with wave.open(str(path)) as clip:
+            return clip.getnframes() / clip.getframerate()
+    try:
+        import mutagen
+    except ImportError:
+        return None
+    clip = mutagen.File(str(path))
+    return clip.info.length if clip is not None else None
+
+
+def cached_durations(folder):
+    """{text: seconds} for every clip in a folder's voiceover cache."""
+    durations = {}
+    for text, audio in deps.voiceover_entries(folder):
+        seconds = audio_duration(audio)
+        if seconds is not None:
+            durations[text] = seconds
+    return durations
+
+
+def words_duration(text, wpm=WORDS_PER_MINUTE):
+    return len(re.findall(r"\S+", text)) * 60.0 / wpm
+
+
+def estimate(lines, folder, wpm=WORDS_PER_MINUTE, cache=None):
+    """
+    [(NarrationLine, seconds, source)] where source is "cache", "wpm", or
+    "?" for unresolved lines, which count as 0 seconds.
+    """
+    cache = cached_durations(folder) if cache is None else cache
+    estimated = []
+    for line in lines:
+        if not line.resolved:
+            estimated.append((line, 0.0, "?"))
+        elif line.exact and line.text in cache:
+            estimated.append((line, cache[line.text], "cache"))
+        else:
+            estimated.append((line, words_duration(line.text, wpm), "wpm"))
+    return estimated
+
+
+def _clock(seconds):
+    return f"{int(seconds // 60)}:{seconds % 60:04.1f}"
+
+
+def _scene_label(info):
+    return f"{info.path.parent.name}/{info.path.name}:{info.name}"
+
+
+# ---------------------------------- #
+#  Commands
+# ---------------------------------- #
+def plan(found, wpm=WORDS_PER_MINUTE, out=print):
+    caches = {}
+    series = 0.0
+    for info, lines in found.items():
+        folder = info.path.parent
+        if folder not in caches:
+            caches[folder] = cached_durations(folder)
+        estimated = estimate(lines, folder, wpm, caches[folder])
+        total = sum(seconds for _, seconds, _ in estimated)
+        cached = sum(1 for _, _, source in estimated if source == "cache")
+        unresolved = sum(1 for line in lines if not line.resolved)
+        missing = f", {unresolved} unresolved" if unresolved else ""
+        out(f"{_scene_label(info)}  {_clock(total)}  ({len(lines)} lines, {cached} cached{missing})")
+        clock = 0.0
+        for section in dict.fromkeys(line.section for line in lines):
+            part = [(l, s) for l, s, _ in estimated if l.section == section]
+            length = sum(s for _, s in part)
+            out(f"    {_clock(clock):>7}  {section:<32} {_clock(length):>7}  {len(part)} lines")
+            clock += length
+        series += total
+    out(f"series narration: {_clock(series)} in {len(found)} videos")
+
+
+def list_lines(found, wpm=WORDS_PER_MINUTE, out=print):
+    for info, lines in found.items():
+        out(_scene_label(info))
+        for line, seconds, source in estimate(lines, info.path.parent, wpm):
+            mark = "?" if not line.resolved else (" " if line.exact else "~")
+            out(f"  {line.lineno:>5} {seconds:5.1f}s {source:<5} {mark} [{line.section}] {line.text}")
+
+
+def warm(found, out=print):
+    """Generates every exact, uncached line with the scene module's own speech service."""
+    for info, lines in found.items():
+        module = scenes.load_module(info.path)
+        if not hasattr(module, "make_speech_service"):
+            out(f"skip {_scene_label(info)}: no make_speech_service()")
+            continue
+        with scenes.working_dir(info.path.parent):
+            service = module.make_speech_service()
+            if service is None:
+                out(f"skip {_scene_label(info)}: make_speech_service() returned None (narration off)")
+                continue
+            if type(service).__name__ == "RecorderService":
+                out(f"skip {_scene_label(info)}: RecorderService lines are recorded, not synthesized")
+                continue
+            cached = {text for text, _ in deps.voiceover_entries(info.path.parent)}
+            todo = list(dict.fromkeys(l.text for l in lines if l.exact and l.text not in cached))
+            for i, text in enumerate(todo, 1):
+                out(f"  [{i}/{len(todo)}] {text[:70]}")
+                service._wrap_generate_from_text(text)
+        unresolved = [str(l.lineno) for l in lines if not l.resolved]
+        left = f", unresolved text at line(s) {', '.join(unresolved)} left to the render" if unresolved else ""
+        out(f"warm {_scene_label(info)}: {len(todo)} generated{left}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("command", nargs="?", default="plan", choices=("plan", "list", "warm"))
+    parser.add_argument("targets", nargs="*", help="scene names, FILE:Scene, files or folders (default: all)")
+    parser.add_argument("--wpm", type=float, default=WORDS_PER_MINUTE, help="speaking rate for uncached lines")
+    args = parser.parse_args(argv)
+
+    try:
+        found = extract_all(build.resolve_targets(args.targets))
+    except LookupError as err:
+        parser.error(str(err))
+    if args.command == "plan":
+        plan(found, args.wpm)
+    elif args.command == "list":
+        list_lines(found, args.wpm)
+    else:
+        warm(found)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
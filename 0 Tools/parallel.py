@@ -0,0 +1,180 @@
+"""
+Render one long scene on several cores at once.
+
+The scene's timeline is cut at section boundaries (see checkpoints.py) into
+contiguous ranges of roughly equal length. Each worker process restores the
+checkpoint at its range start, renders until the next range's first section,
+and writes its own movie. The parts are then joined with ffmpeg's concat
+demuxer and `-c copy`, which needs every part to have the same streams: when
+any part has sound, each part's audio is first re-encoded to one format (a
+silent track for parts without any), the video is never re-encoded.
+
+    1. a checkpoint pass runs construct once without writing video
+       (skipped with --reuse-checkpoints)
+    2. ranges are chosen from the checkpoint times
+    3. one worker per range renders FibonacciExplainer_part00.mp4, _part01, ...
+    4. the parts (audio normalized) are stream-copied into FibonacciExplainer.mp4
+
+The speedup is bounded by the longest range, so it depends on how many
+sections the scene has: FibonacciExplainer has one per top-level method.
+A sound still playing when its range ends (a music bed started in the
+first section) is cut there and picked up by the next part, which re-adds it
+from the checkpoint trimmed to where it was. Sections that share a name get
+checkpoints name, name.2, ..., so every range starts at its own boundary.
+
+Usage:
+    python "0 Tools/parallel.py" FibonacciExplainer -q h -j 8
+    python "0 Tools/parallel.py" BoundedFunctionsWithNarration --reuse-checkpoints
+"""
+import argparse
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import checkpoints
+import scenes
+
+
+def save_pass(info, quality, overrides=None):
+    """Runs construct once without writing video, saving every checkpoint. Returns the total time."""
+    checkpoints.clear_checkpoints(info)
+    scene_cls = checkpoints.checkpointed_class(info, overrides)
+    scene = scenes.render(info, quality, overrides=overrides, scene_cls=scene_cls, dry_run=True)
+    return scene.renderer.time
+
+
+def plan_ranges(sections, total, workers):
+    """
+    Picks up to workers-1 cut points from [(name, start time)] so the ranges
+    are as even as possible. Returns [(start section or None, stop section or None)].
+    """
+    sections = [s for s in sections if 0 < s[1] < total]
+    cuts = []
+    for k in range(1, workers):
+        target = total * k / workers
+        candidates = [s for s in sections if s not in cuts and (not cuts or s[1] > cuts[-1][1])]
+        if not candidates:
+            break
+        cuts.append(min(candidates, key=lambda s: abs(s[1] - target)))
+    names = [None] + [name for name, _ in cuts] + [None]
+    return list(zip(names[:-1], names[1:]))
+
+
+def render_range(info, quality, overrides, start, stop, index):
+    """Worker: renders one range into <Scene>_partNN and returns the movie path."""
+    scene_cls = checkpoints.checkpointed_class(
+        info, overrides, resume_section=start, stop_section=stop,
+        save=False, name=f"{info.name}_part{index:02d}",
+    )
+    scene = scenes.render(info, quality, overrides=overrides, scene_cls=scene_cls)
+    return str(scene.renderer.file_writer.movie_file_path)
+
+
+AUDIO_RATE = 48000
+
+
+def has_audio(path):
+    out = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "a", "-show_entries", "stream=index",
+         "-of", "csv=p=0", str(path)],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return bool(out.strip())
+
+
+def normalize_audio(part, target):
+    """Copies the video and re-encodes the audio (silence if there is none) to one format."""
+    command = ["ffmpeg", "-y", "-loglevel", "error", "-i", str(part)]
+    if has_audio(part):
+        command += ["-map", "0:v", "-map", "0:a"]
+    else:
+        command += ["-f", "lavfi", "-i", f"anullsrc=channel_layout=stereo:sample_rate={AUDIO_RATE}",
+                    "-map", "0:v", "-map", "1:a", "-shortest"]
+    command += ["-c:v", "copy", "-c:a", "aac", "-ar", str(AUDIO_RATE), "-ac", "2", str(target)]
+    subprocess.run(command, check=True)
+    return target
+
+
+def concat(parts, output):
+    """
+    Joins movies with identical video encoding by stream copy. If any part
+    has sound, all parts get matching audio tracks first.
+    """
+    normalized = []
+    if any(has_audio(part) for part in parts):
+        for index, part in enumerate(parts):
+            target = Path(output).with_name(f"{Path(output).stem}.part{index:02d}.norm.mp4")
+            normalized.append(normalize_audio(part, target))
+        parts = normalized
+    listing = Path(output).with_suffix(".concat.txt")
+    with open(listing, "w", encoding="utf-8") as f:
+        for part in parts:
+            escaped = str(Path(part).resolve()).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+    try:
+        subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", str(listing), "-c", "copy", str(output)],
+            check=True,
+        )
+    finally:
+        listing.unlink(missing_ok=True)
+        for path in normalized:
+            path.unlink(missing_ok=True)
+    return Path(output)
+
+
+def render_parallel(info, quality="l", workers=None, overrides=None, reuse=False, out=print):
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    if reuse:
+        saved = checkpoints.list_checkpoints(info)
+        if not saved:
+            raise LookupError(f"no checkpoints for {info.name}; drop --reuse-checkpoints")
+        times = [meta["time"] for _, meta in saved]
+        total = times[-1] + (times[-1] / len(times))   # last section assumed average length
+    else:
+        total = save_pass(info, quality, overrides)
+        saved = checkpoints.list_checkpoints(info)
+        out(f"checkpoint pass: {len(saved)} sections, {total:.1f}s of video, "
+            f"{time.perf_counter() - start:.1f}s")
+
+    ranges = plan_ranges([(name, meta["time"]) for name, meta in saved], total, workers)
+    for i, (first, stop) in enumerate(ranges):
+        out(f"part {i:02d}: {first or 'start'} -> {stop or 'end'}")
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(ranges), mp_context=context) as pool:
+        futures = [pool.submit(render_range, info, quality, overrides, first, stop, i)
+                   for i, (first, stop) in enumerate(ranges)]
+        parts = [f.result() for f in futures]
+
+    output = concat(parts, Path(parts[0]).parent / f"{info.name}.mp4")
+    out(f"{output}  ({len(parts)} parts, {time.perf_counter() - start:.1f}s)")
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scene", help="ClassName or FILE:ClassName")
+    parser.add_argument("-q", "--quality", default="l", choices=sorted(scenes.QUALITIES))
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--no-narration", action="store_true")
+    parser.add_argument("--reuse-checkpoints", action="store_true",
+                        help="skip the checkpoint pass and use the saved ones")
+    args = parser.parse_args(argv)
+
+    try:
+        info = scenes.find_scene(args.scene)
+    except LookupError as err:
+        parser.error(str(err))
+    overrides = {"INCLUDE_NARRATION": False} if args.no_narration else None
+    render_parallel(info, args.quality, args.jobs, overrides, args.reuse_checkpoints)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
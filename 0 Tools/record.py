@@ -0,0 +1,273 @@
+"""
+Record every narration line of the RecorderService scenes in one sitting,
+before rendering, instead of one microphone prompt per line mid-render.
+
+With FANCY_NARRATION on, BoundedFunctionsWithNarration, CacheIndexingExplanation
+and the Manacher scenes narrate through RecorderService, which stops the
+render at each voiceover. This reads the lines up front (narration.py),
+then records the missing ones in scene order through the scene's own
+make_speech_service(). Each accepted take is written to media/voiceovers
+exactly as a render would write it, so the render later finds every line
+cached and never prompts.
+
+    - lines already recorded are skipped, so an interrupted session resumes
+    - --redo N drops line N's take (numbers from --status) and records it again
+    - retakes: the recorder's own [l]isten / [r]e-record / [a]ccept loop
+    - f-string lines can't be recorded ahead, their wording is only known
+      at render time; they and any unresolved lines (narration.py ?) are
+      listed and left to the render
+    - --fancy turns FANCY_NARRATION on for the session, for scene files
+      that ship with it off (6 Manachers/video.py)
+
+--from-folder takes WAV files from a folder instead of the microphone, named
+after the line (see --status for the names). When a line has several,
+"<name>.wav", "<name>.2.wav", ..., the last one is the accepted take. The
+scene's RecorderService is swapped for a stand-in for the session, so this
+mode needs no pyaudio.
+
+Usage:
+    python "0 Tools/record.py" BoundedFunctionsWithNarration --status
+    python "0 Tools/record.py" BoundedFunctionsWithNarration
+    python "0 Tools/record.py" "6 Manachers" --fancy --from-folder ~/takes/manacher
+    python "0 Tools/record.py" CacheIndexingExplanation --redo 4 --redo 5
+"""
+import argparse
+import json
+import re
+import shutil
+import sys
+import types
+from contextlib import contextmanager
+from pathlib import Path
+
+import build
+import deps
+import narration
+import scenes
+
+
+# ---------------------------------- #
+#  Lines and the voiceover cache
+# ---------------------------------- #
+def normalize(text):
+    """Whitespace as manim-voiceover stores it in cache.json."""
+    return " ".join(text.split())
+
+
+def take_name(text):
+    """File name stem for a line's WAV take in --from-folder mode."""
+    return re.sub(r"[^a-z0-9]+", "-", normalize(text).lower()).strip("-")[:60]
+
+
+def recorded_texts(folder):
+    return {normalize(text) for text, _ in deps.voiceover_entries(folder)}
+
+
+def session_lines(found):
+    """
+    {scene folder: [(number, NarrationLine)]} with each text once per folder
+    (scenes in one folder share a voiceover cache), numbered from 1.
+    """
+    by_folder = {}
+    for info, lines in found.items():
+        session = by_folder.setdefault(info.path.parent, [])
+        seen = {normalize(line.text) for _, line in session}
+        for line in lines:
+            if normalize(line.text) not in seen:
+                seen.add(normalize(line.text))
+                session.append((len(session) + 1, line))
+    return by_folder
+
+
+def drop_take(folder, text):
+    """Removes a line's cache.json entries and their audio so it is recorded again."""
+    voiceovers = folder / "media" / "voiceovers"
+    cache = voiceovers / "cache.json"
+    if not cache.is_file():
+        return 0
+    entries = json.loads(cache.read_text(encoding="utf-8"))
+    keep, dropped = [], 0
+    for entry in entries:
+        entry_text = entry.get("input_text") or (entry.get("input_data") or {}).get("input_text")
+        if entry_text and normalize(entry_text) == normalize(text):
+            dropped += 1
+            for value in entry.values():
+                if isinstance(value, str) and value.endswith(deps.AUDIO_SUFFIXES):
+                    (voiceovers / value).unlink(missing_ok=True)
+        else:
+            keep.append(entry)
+    cache.write_text(json.dumps(keep, indent=2), encoding="utf-8")
+    return dropped
+
+
+# ---------------------------------- #
+#  WAV folder instead of a microphone
+# ---------------------------------- #
+class FolderTakes:
+    """
+    Stands in for RecorderService's Recorder: "recording" a line copies its
+    WAV from a folder and converts it like the recorder does.
+    """
+    def __init__(self, folder):
+        self.folder = Path(folder).expanduser()
+        self.current_text = None
+
+    def _trigger_set_device(self):
+        pass
+
+    def take_for(self, text):
+        stem = take_name(text)
+        takes = {}
+        for path in self.folder.glob(f"{stem}*.wav"):
+            match = re.fullmatch(rf"{re.escape(stem)}(?:\.(\d+))?\.wav", path.name)
+            if match:
+                takes[int(match.group(1) or 1)] = path
+        if not takes:
+            raise FileNotFoundError(f"no take {stem}.wav in {self.folder}")
+        return takes[max(takes)]
+
+    def record(self, path, message=None):
+        from manim_voiceover.helper import wav2mp3
+
+        wav_path = Path(path).with_suffix(".wav")
+        shutil.copyfile(self.take_for(self.current_text), wav_path)
+        wav2mp3(wav_path)
+
+
+# RecorderService arguments that only configure the microphone
+RECORDER_ONLY = ("format", "channels", "rate", "chunk", "device_index", "trim_silence_threshold",
+                 "trim_buffer_start", "trim_buffer_end", "callback_delay")
+
+
+def folder_service(take_folder, transcription_model="base", **kwargs):
+    """
+    A RecorderService stand-in that takes every line from a WAV folder, so
+    --from-folder needs neither pyaudio nor a microphone. It writes the
+    same cache entry as RecorderService ({"input_text", "service":
+    "recorder"} as the key), so the render finds the takes.
+    """
+    from manim_voiceover.services.base import SpeechService
+
+    class FolderService(SpeechService):
+        def __init__(self):
+            SpeechService.__init__(
+                self, transcription_model=transcription_model,
+                **{k: v for k, v in kwargs.items() if k not in RECORDER_ONLY}
+            )
+            self.recorder = FolderTakes(take_folder)
+
+        def generate_from_text(self, text, cache_dir=None, path=None, **unused):
+            cache_dir = cache_dir or self.cache_dir
+            input_data = {"input_text": text, "service": "recorder"}
+            cached = self.get_cached_result(input_data, cache_dir)
+            if cached is not None:
+                return cached
+            audio_path = path or self.get_audio_basename(input_data) + ".mp3"
+            self.recorder.current_text = text
+            self.recorder.record(str(Path(cache_dir) / audio_path))
+            return {"input_text": text, "input_data": input_data, "original_audio": audio_path}
+
+    return FolderService()
+
+
+@contextmanager
+def _recorder_stand_in(take_folder):
+    """While active, `from manim_voiceover.services.recorder import RecorderService` gives folder_service."""
+    name = "manim_voiceover.services.recorder"
+    stand_in = types.ModuleType(name)
+    stand_in.RecorderService = lambda *args, **kwargs: folder_service(take_folder, **kwargs)
+    previous = sys.modules.get(name)
+    sys.modules[name] = stand_in
+    try:
+        yield
+    finally:
+        if previous is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = previous
+
+
+# ---------------------------------- #
+#  Session
+# ---------------------------------- #
+def recorder_service(info, fancy=False, take_folder=None):
+    """
+    The scene module's RecorderService (its folder stand-in with
+    take_folder), or None if the scene narrates some other way. fancy forces
+    the module's FANCY_NARRATION on first.
+    """
+    module = scenes.load_module(info.path)
+    if not hasattr(module, "make_speech_service"):
+        return None
+    if fancy:
+        module.FANCY_NARRATION = True
+    if take_folder:
+        with _recorder_stand_in(take_folder):
+            service = module.make_speech_service()
+    else:
+        service = module.make_speech_service()
+    return service if type(service).__name__ in ("RecorderService", "FolderService") else None
+
+
+def status(sessions, out=print):
+    for folder, lines in sessions.items():
+        done = recorded_texts(folder)
+        out(f"{folder.name}: {sum(normalize(l.text) in done for _, l in lines)}/{len(lines)} recorded")
+        for number, line in lines:
+            mark = "x" if normalize(line.text) in done else ("?" if not line.resolved else "~" if not line.exact else " ")
+            out(f"  [{mark}] {number:>3}  {line.scene}/{line.section}  {take_name(line.text)}.wav")
+            out(f"             {line.text}")
+
+
+def record_session(found, take_folder=None, redo=(), fancy=False, out=print):
+    """Records every missing exact line, folder by folder. Returns the number recorded."""
+    recorded = 0
+    for folder, lines in session_lines(found).items():
+        info = next(i for i in found if i.path.parent == folder)
+        with scenes.working_dir(folder):
+            service = recorder_service(info, fancy, take_folder)
+            if service is None:
+                out(f"skip {folder.name}: make_speech_service() is not a RecorderService "
+                    "(FANCY_NARRATION off? use --fancy; TTS lines are pre-generated with narration.py warm)")
+                continue
+            for number, line in lines:
+                if number in redo and drop_take(folder, line.text):
+                    out(f"  {number:>3}  dropped the old take")
+            done = recorded_texts(folder)
+            todo = [(n, l) for n, l in lines if l.exact and normalize(l.text) not in done]
+            later = [n for n, l in lines if not l.exact]
+            out(f"{folder.name}: {len(todo)} to record, {len(lines) - len(todo) - len(later)} already done")
+            for k, (number, line) in enumerate(todo, 1):
+                out(f"\n[{k}/{len(todo)}] line {number}, {line.scene}/{line.section}")
+                service._wrap_generate_from_text(line.text)
+                recorded += 1
+            if later:
+                out(f"left to the render (f-strings or unresolved text): lines {', '.join(map(str, later))}")
+    return recorded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("targets", nargs="+", help="scene names, FILE:Scene, files or folders")
+    parser.add_argument("--status", action="store_true", help="list the lines and which are recorded")
+    parser.add_argument("--from-folder", metavar="DIR", help="take WAV files from DIR instead of the microphone")
+    parser.add_argument("--redo", type=int, action="append", default=[], metavar="N",
+                        help="record line N again (repeatable)")
+    parser.add_argument("--fancy", action="store_true",
+                        help="force FANCY_NARRATION on, for scenes that ship with it off")
+    args = parser.parse_args(argv)
+
+    try:
+        found = narration.extract_all(build.resolve_targets(args.targets))
+    except LookupError as err:
+        parser.error(str(err))
+    if args.status:
+        status(session_lines(found))
+        return 0
+    count = record_session(found, args.from_folder, set(args.redo), args.fancy)
+    print(f"\n{count} line(s) recorded")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+Scene discovery and loading without paying for `from manim import *`.
+
+Listing scenes only parses the files (ast), it never imports them, so it
+takes milliseconds even though every scene file imports manim.  Modules
+are imported only when a scene is actually rendered, and because the scene
+files import their speech backends lazily (see make_speech_service in each
+file), a render with narration off never loads gTTS / Azure / the recorder.
+
+Usage:
+    python "0 Tools/scenes.py" list
+    python "0 Tools/scenes.py" list "6 Manachers"
+    python "0 Tools/scenes.py" render LPSPart4PythonCode -q l --no-narration
+"""
+import argparse
+import ast
+import importlib.util
+import os
+import sys
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+TOOLS_DIR = ROOT / "0 Tools"
+
+# Base classes that make a class a renderable scene
+SCENE_BASES = ("Scene", "VoiceoverScene", "MovingCameraScene", "ThreeDScene", "ZoomedScene")
+
+# Short quality flags, same letters as `manim -q`
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+SceneInfo = namedtuple("SceneInfo", "name path lineno bases")
+
+
+# ---------------------------------- #
+#  Discovery (static, no imports)
+# ---------------------------------- #
+def scene_files(paths=None):
+    """
+    All .py files that may hold scenes. With no paths, every project folder
+    in the repo is searched (the "0 ..." folders are exports/tools, not scenes).
+    """
+    if not paths:
+        paths = [p for p in sorted(ROOT.iterdir())
+                 if p.is_dir() and not p.name.startswith((".", "0 "))]
+    for path in map(Path, paths):
+        if path.is_file():
+            yield path.resolve()
+        elif path.is_dir():
+            yield from sorted(p.resolve() for p in path.rglob("*.py")
+                              if "__pycache__" not in p.parts)
+
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def parse_file(path):
+    """Parses a file, returning None (and a warning) if it does not parse."""
+    try:
+        return ast.parse(Path(path).read_bytes(), filename=str(path))
+    except SyntaxError as err:
+        print(f"warning: skipping {path}: {err}", file=sys.stderr)
+        return None
+
+
+def discover(path, tree=None):
+    """
+    Returns a SceneInfo for every module-level scene class in `path`.
+    A class counts as a scene if one of its bases is a manim scene class or
+    another scene class defined earlier in the same file.
+    """
+    tree = tree or parse_file(path)
+    if tree is None:
+        return []
+    scene_names = set(SCENE_BASES)
+    found = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = [b for b in map(_base_name, node.bases) if b]
+        if any(b in scene_names for b in bases):
+            scene_names.add(node.name)
+            found.append(SceneInfo(node.name, Path(path), node.lineno, tuple(bases)))
+    return found
+
+
+def discover_all(paths=None):
+    """SceneInfo for every scene in every file under `paths`."""
+    scenes = []
+    for path in scene_files(paths):
+        scenes.extend(discover(path))
+    return scenes
+
+
+def find_scene(name, paths=None):
+    """Looks up one scene by class name, or by "file.py:ClassName"."""
+    if ":" in name:
+        file_name, name = name.rsplit(":", 1)
+        paths = [file_name]
+    matches = [s for s in discover_all(paths) if s.name == name]
+    if not matches:
+        raise LookupError(f"no scene named {name!r}")
+    if len(matches) > 1:
+        where = ", ".join(str(s.path.relative_to(ROOT)) for s in matches)
+        raise LookupError(f"scene {name!r} is ambiguous ({where}); use FILE:{name}")
+    return matches[0]
+
+
+# ---------------------------------- #
+#  Loading (imports on demand)
+# ---------------------------------- #
+_modules = {}
+
+
+def _module_name(path):
+    """
+    "scene_" + the file's path under the repo, e.g. scene_4_Fibbinaci_test,
+    so the test.py files in different folders don't replace each other.
+    """
+    try:
+        parts = path.with_suffix("").relative_to(ROOT).parts
+    except ValueError:
+        parts = path.with_suffix("").parts[1:]
+    return "scene_" + "".join(c if c.isalnum() else "_" for c in "_".join(parts))
+
+
+def load_module(path):
+    """
+    Imports a scene file by path (folder names have spaces, so they are
+    not packages). The file's own folder goes on sys.path so its sibling
+    helper modules (e.g. code_listing.py) import the same way as under
+    the manim CLI. Modules are cached per path.
+    """
+    path = Path(path).resolve()
+    if path not in _modules:
+        folder = str(path.parent)
+        if folder not in sys.path:
+            sys.path.insert(0, folder)
+        module_name = _module_name(path)
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        # Registered so pickle/dill and worker processes can find it by name
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        _modules[path] = module
+    return _modules[path]
+
+
+def load_scene(info, overrides=None):
+    """
+    Imports the scene's module and returns the class. `overrides` replaces
+    module-level flags before construct runs, e.g. {"INCLUDE_NARRATION": False}.
+    """
+    module = load_module(info.path)
+    for flag, value in (overrides or {}).items():
+        setattr(module, flag, value)
+    return getattr(module, info.name)
+
+
+@contextmanager
+def working_dir(path):
+    """Renders run from the scene's folder, like the commands in commands.txt."""
+    old = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(old)
+
+
+def render(info, quality="l", preview=False, overrides=None, scene_cls=None,
+           file_writer_class=None, skip_animations=False, **config):
+    """
+    Renders one scene through manim's Python API and returns the scene
+    object (its renderer.file_writer knows where the movie went).
+    scene_cls renders a subclass instead (see checkpoints.py);
+    file_writer_class swaps manim's SceneFileWriter (see stream_writer.py);
+    skip_animations jumps every play to its end state (see golden.py).
+    """
+    from manim import tempconfig
+
+    if scene_cls is None:
+        scene_cls = load_scene(info, overrides)
+    settings = {"quality": QUALITIES.get(quality, quality), "preview": preview}
+    settings.update(config)
+    with working_dir(info.path.parent), tempconfig(settings):
+        if file_writer_class is None and not skip_animations:
+            scene = scene_cls()
+        else:
+            from manim.renderer.cairo_renderer import CairoRenderer
+            renderer_options = {"skip_animations": skip_animations}
+            if file_writer_class is not None:
+                renderer_options["file_writer_class"] = file_writer_class
+            scene = scene_cls(renderer=CairoRenderer(**renderer_options))
+        scene.render()
+    return scene
+
+
+def _narration_overrides(args):
+    return {"INCLUDE_NARRATION": False} if args.no_narration else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    list_cmd = sub.add_parser("list", help="list scene classes without importing anything")
+    list_cmd.add_argument("paths", nargs="*")
+
+    render_cmd = sub.add_parser("render", help="render one scene")
+    render_cmd.add_argument("scene", help="ClassName or FILE:ClassName")
+    render_cmd.add_argument("-q", "--quality", default="l", choices=sorted(QUALITIES))
+    render_cmd.add_argument("-p", "--preview", action="store_true")
+    render_cmd.add_argument("--no-narration", action="store_true",
+                            help="force INCLUDE_NARRATION = False for this render")
+    render_cmd.add_argument("--stream", action="store_true",
+                            help="one ffmpeg encoder for the whole scene instead of partial movies")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        start = time.perf_counter()
+        scenes = discover_all(args.paths)
+        current = None
+        for info in scenes:
+            if info.path != current:
+                current = info.path
+                print(current.relative_to(ROOT))
+            print(f"    {info.name:<40} line {info.lineno}")
+        elapsed = time.perf_counter() - start
+        print(f"{len(scenes)} scenes in {elapsed*1000:.0f} ms", file=sys.stderr)
+    elif args.command == "render":
+        try:
+            info = find_scene(args.scene)
+        except LookupError as err:
+            parser.error(str(err))
+        writer = None
+        if args.stream:
+            from stream_writer import StreamingFileWriter as writer
+        render(info, args.quality, args.preview, _narration_overrides(args), file_writer_class=writer)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+A SceneFileWriter that keeps ONE encoder open for the whole scene.
+
+manim normally opens a new partial movie (a new container and encoder)
+for every self.play / self.wait and concatenates them at the end; the
+Manacher Part 2 loops alone make well over a hundred. StreamingFileWriter
+starts a single ffmpeg process on the first play, pipes raw RGBA frames into
+its stdin, and records play boundaries as timestamps in "<movie>.plays.json"
+instead of as separate files. Audio is muxed in once at the end (-c:v copy).
+
+Frames are written straight from the renderer's array when it is already a
+contiguous uint8 buffer, otherwise through one preallocated buffer, so no
+per-frame allocation happens on the write path.
+
+Trade-offs: partial-movie caching is off (there are no partials to reuse),
+and transparent/webm/gif output and --save_sections fall back to manim's
+own writer.
+
+    python "0 Tools/scenes.py" render LPSPart2NaiveExpandSolutions -q h --stream
+"""
+import json
+import subprocess
+from pathlib import Path
+
+import numpy as np
+from manim import config, logger
+from manim.scene.scene_file_writer import SceneFileWriter
+
+
+class StreamingFileWriter(SceneFileWriter):
+    def __init__(self, *args, **kwargs):
+        # manim's constructor signature changed across versions; pass it through
+        super().__init__(*args, **kwargs)
+        self.streaming = (
+            config.format in (None, "mp4")
+            and not config.transparent
+            and not config.save_sections
+        )
+        self._encoder = None
+        self._buffer = None
+        self._video_path = None
+        self.frames_written = 0
+        self.plays = []
+
+    # Encoder ---------------------------------------------------------- #
+    def _start_encoder(self):
+        width, height = config.pixel_width, config.pixel_height
+        self._buffer = np.empty((height, width, 4), dtype=np.uint8)
+        movie = Path(self.movie_file_path)
+        movie.parent.mkdir(parents=True, exist_ok=True)
+        self._video_path = movie.with_name(movie.stem + ".video" + movie.suffix)
+        command = [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgba",
+            "-s", f"{width}x{height}", "-r", str(config.frame_rate),
+            "-i", "-",
+            "-an", "-c:v", "libx264", "-pix_fmt", "yuv420p",
+            "-movflags", "+faststart",
+            str(self._video_path),
+        ]
+        # A large pipe buffer keeps the renderer from stalling on every frame
+        self._encoder = subprocess.Popen(command, stdin=subprocess.PIPE, bufsize=1 << 24)
+
+    def _frame_view(self, frame):
+        """The frame as bytes for the pipe, copying only if it isn't already a packed uint8 RGBA array."""
+        if frame.dtype == np.uint8 and frame.flags.c_contiguous and frame.shape == self._buffer.shape:
+            return memoryview(frame).cast("B")
+        np.copyto(self._buffer, frame[..., :4], casting="unsafe")
+        return memoryview(self._buffer).cast("B")
+
+    # SceneFileWriter hooks -------------------------------------------- #
+    def is_already_cached(self, hash_invocation):
+        if not self.streaming:
+            return super().is_already_cached(hash_invocation)
+        return False
+
+    def begin_animation(self, allow_write=False, *args, **kwargs):
+        if not self.streaming:
+            return super().begin_animation(allow_write, *args, **kwargs)
+        if allow_write and config.write_to_movie:
+            if self._encoder is None:
+                self._start_encoder()
+            self.plays.append({"play": len(self.plays), "start": self.frames_written / config.frame_rate})
+
+    def end_animation(self, allow_write=False):
+        if not self.streaming:
+            return super().end_animation(allow_write)
+        if allow_write and config.write_to_movie and self.plays:
+            self.plays[-1]["end"] = self.frames_written / config.frame_rate
+
+    def write_frame(self, frame_or_renderer, num_frames=1, **kwargs):
+        if not self.streaming:
+            return super().write_frame(frame_or_renderer, num_frames, **kwargs)
+        num_frames = kwargs.get("repeat", num_frames)
+        if not config.write_to_movie or self._encoder is None:
+            return
+        frame = frame_or_renderer
+        if hasattr(frame, "get_frame"):
+            frame = frame.get_frame()
+        view = self._frame_view(np.asarray(frame))
+        for _ in range(num_frames):
+            self._encoder.stdin.write(view)
+        self.frames_written += num_frames
+
+    def combine_to_movie(self):
+        if not self.streaming:
+            return super().combine_to_movie()
+        if self._encoder is None:
+            logger.info("No animations in this scene, no movie written")
+            return
+        self._encoder.stdin.close()
+        if self._encoder.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with code {self._encoder.returncode}")
+        self._encoder = None
+
+        movie = Path(self.movie_file_path)
+        if self.includes_sound:
+            sound = movie.with_suffix(".wav")
+            self.audio_segment.export(sound, format="wav")
+            subprocess.run(
+                ["ffmpeg", "-y", "-loglevel", "error",
+                 "-i", str(self._video_path), "-i", str(sound),
+                 "-map", "0:v", "-map", "1:a", "-c:v", "copy", "-c:a", "aac",
+                 str(movie)],
+                check=True,
+            )
+            sound.unlink()
+            self._video_path.unlink()
+        else:
+            self._video_path.replace(movie)
+
+        plays_file = movie.with_suffix(".plays.json")
+        plays_file.write_text(json.dumps({
+            "fps": config.frame_rate,
+            "frames": self.frames_written,
+            "plays": self.plays,
+        }, indent=1) + "\n", encoding="utf-8")
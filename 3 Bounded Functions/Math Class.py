@@ -1,8 +1,5 @@
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
-from manim_voiceover.services.azure import AzureService
-from manim_voiceover.services.recorder import RecorderService
 import numpy as np  # For mathematical functions like np.sin
 
 # Flag to include or exclude narration
@@ -12,17 +9,21 @@ NARRARATOR_VOICE = "en-US-SteffanNeural"
 INTRO = 1
 DRAW_SIN = True
 
+
+def make_speech_service():
+    if FANCY_NARRATION:
+        from manim_voiceover.services.recorder import RecorderService
+        return RecorderService()
+        # from manim_voiceover.services.azure import AzureService
+        # return AzureService(voice=NARRARATOR_VOICE)
+    from manim_voiceover.services.gtts import GTTSService
+    return GTTSService(lang="en", tld="com")
+
 class BoundedFunctionsWithNarration(VoiceoverScene):
     def construct(self):            
-        # Initialize the gTTS voiceover service if narration is included
-        if FANCY_NARRATION:
-            service = RecorderService()
-            #service = AzureService(voice=NARRARATOR_VOICE)
-        else:
-            service = GTTSService(lang="en", tld="com")
-            
+        # Initialize the voiceover service if narration is included
         if INCLUDE_NARRATION:
-            self.set_speech_service(service)
+            self.set_speech_service(make_speech_service())
             self.add_sound("Zeta.mp3", gain=-23)
 
         if INTRO:
@@ -272,6 +273,7 @@ class BoundedFunctionsWithNarration(VoiceoverScene):
         )
 
         # --- Section 2: Bounds, Maximum, and Supremum ---
+        self.next_section("supremum")
         max_description = "Let's define some helpful terms to choose where the closest fitting boundary should go."
         max_description2 = 'To do this we will use the maximum and the supremum.'
         self.voiceover_or_play(None, text=max_description)
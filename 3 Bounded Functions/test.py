@@ -1,6 +1,5 @@
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 import numpy as np  # For mathematical functions like np.sin
 
 # Flag to include or exclude narration
@@ -16,9 +15,9 @@ class BoundedFunctionsWithNarration(VoiceoverScene):
         # --- Section 2: Bounds, Maximum, and Supremum ---
         new_heading_text = "Bounds, Maximum, and Supremum"
         new_heading = Text(new_heading_text, font_size=40).to_edge(UP)
-        service = GTTSService(lang="en", tld="com")
         if INCLUDE_NARRATION:
-            self.set_speech_service(service)
+            from manim_voiceover.services.gtts import GTTSService
+            self.set_speech_service(GTTSService(lang="en", tld="com"))
         self.voiceover_or_play(
             Create(new_heading),
             text=new_heading_text
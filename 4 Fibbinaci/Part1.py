@@ -1,19 +1,25 @@
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.azure import AzureService
+
+import fibonacci
+from bunny_population import PopulationCloud
 
 INCLUDE_NARRATION = True
 FANCY_NARRATION = True
 NARRATOR_VOICE = "en-US-SteffanNeural"
 
+
+def make_speech_service():
+    if FANCY_NARRATION:
+        from manim_voiceover.services.azure import AzureService
+        return AzureService(voice=NARRATOR_VOICE)
+    return None
+
 class FibonacciIntroBunny(VoiceoverScene):
     def construct(self):
         # Setup Voiceover
-        if FANCY_NARRATION:
-            service = AzureService(voice=NARRATOR_VOICE)
-        else:
-            service = None
-        if INCLUDE_NARRATION and service:
+        service = make_speech_service() if INCLUDE_NARRATION else None
+        if service:
             self.set_speech_service(service)
 
         # Introduction: Fibonacci and what we'll cover
@@ -59,10 +65,10 @@ class FibonacciIntroBunny(VoiceoverScene):
             self.play(Create(mark[0]), FadeIn(mark[1]), run_time=0.3)
         self.wait(1)
 
-        fib_vals = [1,1,2,3,5,8]
-        rabbits_groups = VGroup()
-        for i,val in enumerate(fib_vals):
-            group = VGroup(*[Dot(radius=0.1) for _ in range(val)]).arrange(UP, buff=0.15)
+        # One point cloud per month, newborn pairs in pink, mature pairs in white
+        rabbits_groups = Group()
+        for i in range(6):
+            group = PopulationCloud(months=i, layout="column", spacing=0.25)
             group.move_to(line.point_from_proportion(i/6)+UP*1)
             rabbits_groups.add(group)
 
@@ -83,7 +89,33 @@ class FibonacciIntroBunny(VoiceoverScene):
         self.play(
             FadeOut(rabbits_groups),
             FadeOut(line),
-            FadeOut(month_marks),
+            FadeOut(month_marks)
+        )
+
+        # Fast-forward two years: every pair in one point cloud
+        months = 24
+        population = PopulationCloud(months=months, radius=2.6).shift(DOWN*0.5)
+        month = ValueTracker(0)
+        population.add_updater(lambda m: m.set_month(month.get_value()))
+        pair_count = Integer(1).next_to(bunny_title, DOWN)
+        pair_count.add_updater(lambda m: m.set_value(population.count()))
+        self.add(population, pair_count)
+
+        fast_forward = (
+            "Let the rabbits breed for two years. "
+            f"By month {months} there are {fibonacci.fib(months + 1):,} pairs."
+        )
+        self.voiceover_or_play(
+            month.animate(rate_func=linear).set_value(months),
+            text=fast_forward
+        )
+        self.wait(2)
+        population.clear_updaters()
+        pair_count.clear_updaters()
+
+        self.play(
+            FadeOut(population),
+            FadeOut(pair_count),
             FadeOut(bunny_title)
         )
         self.wait(1)
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+BigNumber: thousands of digits on screen without a LaTeX call.
+
+The ten digits are typeset once per font/size (one Text, so they share a
+baseline) and cached as an outline atlas. A number is then laid out with
+numpy alone: every digit's cell position, a small gap between groups of
+three, a fixed number of digits per line, and each line's outlines stamped
+from the atlas into one VMobject. Cost is linear in the digit count;
+F(10000)'s 2,090 digits are 35 lines, i.e. 35 mobjects.
+
+    big = BigNumber(fibonacci.fib(10000), line_digits=60, window_lines=8)
+    self.play(big.reveal())              # line by line
+    self.play(big.scroll_to(20), run_time=4)
+"""
+import sys
+from functools import lru_cache
+
+import numpy as np
+from manim import *
+
+DIGITS = "0123456789"
+
+
+def digit_string(value):
+    """str(value) for ints of any size (Python 3.11+ refuses over 4300 digits by default)."""
+    if not hasattr(sys, "get_int_max_str_digits"):
+        return str(value)
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        return str(value)
+    finally:
+        sys.set_int_max_str_digits(limit)
+
+
+@lru_cache(maxsize=None)
+def _glyph_atlas(font_size, font):
+    """
+    Outlines of 0-9 from a single Text, each centered horizontally on 0 with
+    the shared baseline at y = 0. Returns (points of all digits back to back,
+    start index of each digit, point count of each digit, cell width, line height).
+    """
+    text = Text(DIGITS, font_size=font_size, font=font)
+    glyphs = text.submobjects
+    baseline = min(g.get_bottom()[1] for g in glyphs)
+    chunks = [g.points - np.array([g.get_center()[0], baseline, 0]) for g in glyphs]
+    counts = np.array([len(c) for c in chunks])
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    cell = max(g.width for g in glyphs) * 1.2
+    line_height = text.height * 1.6
+    return np.concatenate(chunks), starts, counts, cell, line_height
+
+
+class BigNumber(VGroup):
+    """
+    A (huge) non-negative integer as wrapped lines of digits, one VMobject per line.
+      - value: the int, or a string of digits
+      - line_digits: digits per line (rounded down to whole groups)
+      - group: digits per group, counted from the right like 1 234 567; 0 for none
+      - window_lines: if set, only this many lines are shown at a time and
+        scroll_to() moves the window
+    """
+
+    def __init__(
+        self,
+        value,
+        line_digits=60,
+        group=3,
+        font_size=24,
+        font="",
+        group_gap=0.5,
+        window_lines=None,
+        color=WHITE,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.digits = value if isinstance(value, str) else digit_string(value)
+        if not self.digits:
+            raise ValueError("BigNumber got an empty digit string; pass 0 for zero")
+        if self.digits.strip(DIGITS):
+            raise ValueError(f"BigNumber takes non-negative integers, got {self.digits[:20]!r}")
+        atlas, starts, counts, cell, line_height = _glyph_atlas(font_size, font)
+        if group:
+            line_digits = max(group, line_digits - line_digits % group)
+        self.line_height = line_height
+
+        # Cell of every digit. Left-padding to a whole group keeps the groups
+        # aligned from the right, as in 12 345 678.
+        values = np.frombuffer(self.digits.encode(), dtype=np.uint8) - ord("0")
+        pad = (-len(values)) % group if group else 0
+        slot = np.arange(len(values)) + pad
+        row, col = np.divmod(slot, line_digits)
+        x = col * cell
+        if group:
+            x = x + (col // group) * group_gap * cell
+        positions = np.column_stack([x, -row * line_height, np.zeros(len(values))])
+
+        # Gather each digit's outline from the atlas, in reading order
+        sizes = counts[values]
+        ends = np.cumsum(sizes)
+        local = np.arange(ends[-1]) - np.repeat(ends - sizes, sizes)
+        points = atlas[np.repeat(starts[values], sizes) + local] + np.repeat(positions, sizes, axis=0)
+
+        # One VMobject per line
+        rows = int(row[-1]) + 1
+        cut = ends[np.searchsorted(row, np.arange(1, rows)) - 1]
+        for line_points in np.split(points, cut):
+            line = VMobject(fill_color=color, fill_opacity=1, stroke_width=0)
+            line.set_points(line_points)
+            self.add(line)
+        self.lines = self.submobjects
+
+        self.window_lines = window_lines
+        self.first_line = 0.0
+        self.center()
+        if window_lines:
+            # Center the window, not the whole number, then hide what's outside it
+            self.shift(UP * (rows - min(rows, window_lines)) * line_height / 2)
+            self._apply_window()
+
+    def _apply_window(self):
+        for i, line in enumerate(self.lines):
+            opacity = np.clip(min(i - self.first_line + 1, self.first_line + self.window_lines - i), 0, 1)
+            line.set_fill(opacity=opacity)
+
+    def scroll_to(self, first_line, **kwargs):
+        """Animation scrolling the window so `first_line` is the top visible line."""
+        if not self.window_lines:
+            raise ValueError("scroll_to needs a BigNumber built with window_lines")
+        first_line = np.clip(first_line, 0, max(0, len(self.lines) - self.window_lines))
+        start = None
+
+        def update(mob, alpha):
+            nonlocal start
+            if start is None:
+                start = mob.first_line   # read when the animation begins, not when it's built
+            target = start + (first_line - start) * alpha
+            mob.shift(UP * (target - mob.first_line) * mob.line_height)
+            mob.first_line = target
+            mob._apply_window()
+
+        return UpdateFromAlphaFunc(self, update, **kwargs)
+
+    def visible_lines(self):
+        """The lines currently inside the window (all of them without a window)."""
+        if not self.window_lines:
+            return list(self.lines)
+        first = int(np.ceil(self.first_line))
+        return self.lines[first:first + self.window_lines]
+
+    def reveal(self, lag_ratio=0.15, **kwargs):
+        """Fades the visible lines in one after another, top to bottom."""
+        return LaggedStart(
+            *[FadeIn(line, shift=UP * 0.2) for line in self.visible_lines()],
+            lag_ratio=lag_ratio, **kwargs
+        )
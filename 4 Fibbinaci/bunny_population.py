@@ -0,0 +1,176 @@
+"""
+Age-structured rabbit population and a point-cloud renderer for it.
+
+The simulator works on counts, not individuals: a Leslie matrix steps the
+vector (newborn pairs, ..., mature pairs) one month at a time. Because
+pairs are numbered in birth order, the age of every single pair at any
+month follows from the births per month with one np.repeat, so 25 months
+(75,025 pairs) is a handful of array operations.
+
+PopulationCloud draws all pairs as ONE point-cloud mobject (PMobject) with
+per-point position and color; newborn and mature pairs get different colors.
+
+    cloud = PopulationCloud(months=24, radius=3)
+    month = ValueTracker(0)
+    cloud.add_updater(lambda m: m.set_month(month.get_value()))
+    self.play(month.animate.set_value(24), run_time=8, rate_func=linear)
+"""
+from functools import lru_cache
+
+import numpy as np
+from manim import *
+
+from golden_ratio import GOLDEN_ANGLE
+
+
+# ---------------------------------- #
+#  Simulator
+# ---------------------------------- #
+def leslie_matrix(maturity=1, litter=1):
+    """
+    Transition matrix for age classes 0..maturity, the last class being
+    mature pairs (it absorbs itself). Each mature pair has `litter` newborn
+    pairs per month; every other class just ages by one month.
+    With the defaults this is Fibonacci's [[0, 1], [1, 1]].
+    """
+    classes = maturity + 1
+    L = np.zeros((classes, classes), dtype=np.int64)
+    L[0, -1] = litter
+    for age in range(classes - 1):
+        L[age + 1, age] = 1
+    L[-1, -1] = 1
+    return L
+
+
+@lru_cache(maxsize=16)
+def simulate(months, maturity=1, litter=1):
+    """
+    Count vectors for months 0..months, starting from one newborn pair.
+    Returns a read-only (months+1, maturity+1) int64 array; row m sums to
+    the number of pairs alive in month m (F(m+1) with the defaults).
+    """
+    L = leslie_matrix(maturity, litter)
+    history = np.zeros((months + 1, maturity + 1), dtype=np.int64)
+    history[0, 0] = 1
+    for month in range(months):
+        history[month + 1] = L @ history[month]
+    history.setflags(write=False)
+    return history
+
+
+def pair_totals(months, maturity=1, litter=1):
+    """Number of pairs in each month 0..months."""
+    return simulate(months, maturity, litter).sum(axis=1)
+
+
+def birth_months(months, maturity=1, litter=1):
+    """Month each pair was born in, for every pair alive at `months`, in birth order."""
+    history = simulate(months, maturity, litter)
+    return np.repeat(np.arange(months + 1), history[:, 0])
+
+
+def ages_at(month, months=None, maturity=1, litter=1):
+    """Age in months of every pair alive in `month`, oldest pair first."""
+    births = birth_months(months if months is not None else month, maturity, litter)
+    births = births[births <= month]
+    return month - births
+
+
+# ---------------------------------- #
+#  Layouts (index -> position)
+# ---------------------------------- #
+def spiral_positions(count, spacing):
+    """
+    Pair i sits at radius spacing*sqrt(i) and angle i*golden angle, so the
+    disc fills evenly and older pairs never move when new ones are born.
+    """
+    i = np.arange(count)
+    r = spacing * np.sqrt(i + 0.5)
+    theta = i * GOLDEN_ANGLE
+    return np.column_stack([r * np.cos(theta), r * np.sin(theta), np.zeros(count)])
+
+
+def column_positions(count, spacing):
+    """Pairs stacked upward in a single column, like the month columns."""
+    i = np.arange(count)
+    return np.column_stack([np.zeros(count), i * spacing, np.zeros(count)])
+
+
+LAYOUTS = {"spiral": spiral_positions, "column": column_positions}
+
+
+# ---------------------------------- #
+#  Point-cloud mobject
+# ---------------------------------- #
+class PopulationCloud(PMobject):
+    """
+    Every rabbit pair of one month as a single point cloud.
+      - months: the last month this cloud will be asked to show (sizes the layout)
+      - month: the month shown now (set_month changes it, fractions are floored)
+      - radius: for the spiral layout, the disc radius at the last month
+      - spacing: for the column layout, distance between pairs
+    """
+
+    def __init__(
+        self,
+        months=5,
+        month=None,
+        layout="spiral",
+        radius=3.0,
+        spacing=0.35,
+        newborn_color=PINK,
+        mature_color=WHITE,
+        maturity=1,
+        litter=1,
+        point_size=None,
+        **kwargs
+    ):
+        self.months = months
+        self.maturity = maturity
+        self.litter = litter
+        total = int(pair_totals(months, maturity, litter)[-1])
+        if layout == "spiral":
+            spacing = radius / np.sqrt(total)
+        self.layout_points = LAYOUTS[layout](total, spacing)
+        self.palette = np.array([color_to_rgba(newborn_color), color_to_rgba(mature_color)])
+        if point_size is None:
+            # about 80% of the gap between neighbours, in pixels at 1080p
+            point_size = max(1.0, 0.8 * spacing * 1080 / config.frame_height)
+        super().__init__(stroke_width=point_size, **kwargs)
+        self.month = None
+        self._scale = 1.0
+        self.set_month(months if month is None else month)
+
+    def set_month(self, month):
+        """Shows the population of `month`: one array slice, no new mobjects."""
+        month = int(np.clip(month, 0, self.months))
+        if month == self.month:
+            return self
+        # The cloud may have been moved/scaled since it was built, so place
+        # the new points with the same shift and scale as the current ones.
+        origin, scale = self._layout_transform()
+        ages = ages_at(month, self.months, self.maturity, self.litter)
+        mature = np.minimum(ages, self.maturity) / self.maturity
+        self.points = origin + scale * self.layout_points[:len(ages)]
+        self.rgbas = self.palette[0] + (self.palette[1] - self.palette[0]) * mature[:, None]
+        self.month = month
+        return self
+
+    def _layout_transform(self):
+        """
+        Recovers (shift, scale) between layout_points and the current points.
+        With a single pair on screen the scale can't be measured, so the last
+        known one is kept.
+        """
+        count = len(self.points)
+        if count == 0:
+            return np.zeros(3), 1.0
+        base = self.layout_points[:count]
+        if count > 1:
+            spread = np.linalg.norm(base[-1] - base[0])
+            self._scale = np.linalg.norm(self.points[-1] - self.points[0]) / spread
+        return self.points[0] - self._scale * base[0], self._scale
+
+    def count(self):
+        """Number of pairs currently shown."""
+        return len(self.points)
@@ -0,0 +1,241 @@
+"""
+Fibonacci computation engine shared by the Fibonacci scenes.
+
+Convention: F(0) = 0, F(1) = 1, F(2) = 1, F(3) = 2, ... so the rabbit
+counts 1, 1, 2, 3, 5, 8 are F(1)..F(6) and F(14)/F(13) = 377/233.
+
+Implementations (all return exact Python ints):
+    fib_naive     plain double recursion, optionally counting its calls
+    fib_memo      top-down recursion with a cache
+    fib_dp        bottom-up loop, O(n) additions
+    fib_doubling  fast doubling, O(log n) multiplications
+    fib_matrix    [[1,1],[1,0]]^n by repeated squaring, O(log n)
+
+Benchmark mode:
+    python fibonacci.py --bench        # up to 10^6, memo up to 10^5 (see BENCH_LIMITS)
+    python fibonacci.py --bench --max-n 1000000 --methods dp doubling matrix
+"""
+import argparse
+import sys
+import time
+from collections import Counter
+from fractions import Fraction
+
+
+# ---------------------------------- #
+#  Naive recursion (instrumented)
+# ---------------------------------- #
+class CallCounter:
+    """
+    Records every call the naive recursion makes: the total, and how many
+    times each F(k) was recomputed (that second part is the "repeated work"
+    the recursion-vs-DP scenes point at).
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.per_n = Counter()
+
+    def record(self, n):
+        self.calls += 1
+        self.per_n[n] += 1
+
+    def repeated(self):
+        """Subproblems computed more than once, as {k: times}."""
+        return {k: c for k, c in sorted(self.per_n.items()) if c > 1}
+
+
+def fib_naive(n, counter=None):
+    """F(n) straight from the definition. Exponential - keep n below ~30."""
+    if counter is not None:
+        counter.record(n)
+    if n < 2:
+        return n
+    return fib_naive(n - 1, counter) + fib_naive(n - 2, counter)
+
+
+def naive_calls(n):
+    """Runs the naive recursion and returns (F(n), CallCounter)."""
+    counter = CallCounter()
+    value = fib_naive(n, counter)
+    return value, counter
+
+
+# ---------------------------------- #
+#  Memoized / DP / log-time versions
+# ---------------------------------- #
+_memo = {0: 0, 1: 1}
+
+
+def _fib_memo(n):
+    if n not in _memo:
+        _memo[n] = _fib_memo(n - 1) + _fib_memo(n - 2)
+    return _memo[n]
+
+
+def fib_memo(n):
+    """
+    Top-down recursion with a cache. The cache is warmed in steps of 500 so
+    the recursion never goes deeper than that, even for n in the millions.
+    """
+    for k in range(max(_memo), n, 500):
+        _fib_memo(k)
+    return _fib_memo(n)
+
+
+def clear_memo():
+    """Empties the fib_memo cache (the benchmark does this between runs)."""
+    _memo.clear()
+    _memo.update({0: 0, 1: 1})
+
+
+def fib_dp(n):
+    """Bottom-up dynamic programming, keeping only the last two values."""
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def _doubling(n):
+    """Returns (F(n), F(n+1)) using F(2k) = F(k)(2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2."""
+    if n == 0:
+        return 0, 1
+    a, b = _doubling(n >> 1)
+    c = a * (2*b - a)
+    d = a*a + b*b
+    if n & 1:
+        return d, c + d
+    return c, d
+
+
+def fib_doubling(n):
+    """Fast doubling: O(log n) big-integer multiplications."""
+    return _doubling(n)[0]
+
+
+def _mat_mult(x, y):
+    return (
+        x[0]*y[0] + x[1]*y[2], x[0]*y[1] + x[1]*y[3],
+        x[2]*y[0] + x[3]*y[2], x[2]*y[1] + x[3]*y[3],
+    )
+
+
+def fib_matrix(n):
+    """[[1,1],[1,0]]^n by repeated squaring; the top-right entry is F(n)."""
+    result = (1, 0, 0, 1)
+    base = (1, 1, 1, 0)
+    while n:
+        if n & 1:
+            result = _mat_mult(result, base)
+        base = _mat_mult(base, base)
+        n >>= 1
+    return result[1]
+
+
+IMPLEMENTATIONS = {
+    "naive": fib_naive,
+    "memo": fib_memo,
+    "dp": fib_dp,
+    "doubling": fib_doubling,
+    "matrix": fib_matrix,
+}
+
+# Largest n each method is benchmarked at by default. memo stops at 10^5:
+# its cache keeps every F(k) <= n, and at 10^6 those add up to ~40 GB.
+BENCH_LIMITS = {
+    "naive": 30,
+    "memo": 10**5,
+    "dp": 10**6,
+    "doubling": 10**6,
+    "matrix": 10**6,
+}
+
+
+# ---------------------------------- #
+#  Values the scenes display
+# ---------------------------------- #
+def fib(n):
+    """F(n) - the fastest implementation, for anything the scenes display."""
+    return fib_doubling(n)
+
+
+def sequence(count, start=1):
+    """[F(start), F(start+1), ...] with `count` terms, e.g. sequence(6) -> [1,1,2,3,5,8]."""
+    values = []
+    a, b = fib(start), fib(start + 1)
+    for _ in range(count):
+        values.append(a)
+        a, b = b, a + b
+    return values
+
+
+def ratio(n):
+    """F(n+1)/F(n) as an exact Fraction (n >= 1)."""
+    return Fraction(fib(n + 1), fib(n))
+
+
+# ---------------------------------- #
+#  Benchmark mode
+# ---------------------------------- #
+def time_call(func, n, repeat=3):
+    """Best wall time of `repeat` calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        if func is fib_memo:
+            clear_memo()
+        start = time.perf_counter()
+        func(n)
+        best = min(best, time.perf_counter() - start)
+    if func is fib_memo:
+        clear_memo()  # the cache holds every F(k) <= n, so don't keep it around
+    return best
+
+
+def benchmark(methods=None, max_n=10**6, repeat=3):
+    """
+    Times each method at n = 10, 100, ... up to its own limit (and max_n),
+    checking every result against fib_doubling. Returns a list of
+    (method, n, seconds) rows.
+    """
+    methods = methods or list(IMPLEMENTATIONS)
+    rows = []
+    for name in methods:
+        func = IMPLEMENTATIONS[name]
+        limit = min(BENCH_LIMITS[name], max_n)
+        sizes = [10**k for k in range(1, 8) if 10**k <= limit]
+        if limit not in sizes:
+            sizes.append(limit)
+        for n in sizes:
+            if func(n) != fib_doubling(n):
+                raise AssertionError(f"{name} gave the wrong F({n})")
+            rows.append((name, n, time_call(func, n, repeat)))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fibonacci implementations and benchmark")
+    parser.add_argument("n", nargs="?", type=int, help="print F(n) and the naive call count")
+    parser.add_argument("--bench", action="store_true", help="time every implementation")
+    parser.add_argument("--max-n", type=int, default=10**6)
+    parser.add_argument("--methods", nargs="+", choices=sorted(IMPLEMENTATIONS))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        print(f"{'method':<10} {'n':>9} {'seconds':>12}")
+        for name, n, seconds in benchmark(args.methods, args.max_n, args.repeat):
+            print(f"{name:<10} {n:>9} {seconds:>12.6f}")
+    elif args.n is not None:
+        if hasattr(sys, "set_int_max_str_digits"):
+            sys.set_int_max_str_digits(0)  # F(n) can run to thousands of digits
+        print(f"F({args.n}) = {fib(args.n)}")
+        if args.n <= 30:
+            _, counter = naive_calls(args.n)
+            print(f"naive recursion: {counter.calls} calls, repeated: {counter.repeated()}")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
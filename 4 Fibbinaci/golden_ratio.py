@@ -0,0 +1,244 @@
+"""
+Golden-ratio convergence engine and a batched Fibonacci-square tiling.
+
+Convergence: F(n+1)/F(n) is streamed with two additions per step, and every
+ratio comes with exact bounds. Consecutive ratios sit on opposite sides of
+phi and differ by exactly 1/(F(n) F(n+1)) (Cassini's identity), so
+
+    lower <= phi <= upper,   |F(n+1)/F(n) - phi| < 1/(F(n) F(n+1))
+
+with no floating point anywhere. n in the thousands is still instant.
+
+    for c in convergents(20): print(c.n, c.ratio, c.digits)
+    to_decimal(convergent(1000).ratio, 200)      # 200 significant digits
+    phi_decimal(50)
+
+Tiling: GoldenTiling(count=30) lays out squares of side F(1)..F(count) in
+the usual counter-clockwise spiral and draws them as two VMobjects, one for
+all square outlines and one for the whole quarter-arc spiral, both built
+from the same corner/side arrays.
+"""
+import math
+from collections import namedtuple
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal, localcontext
+from fractions import Fraction
+
+import numpy as np
+from manim import *
+
+GOLDEN_ANGLE = np.pi * (3 - np.sqrt(5))   # 2*pi / phi^2, about 137.5 degrees
+LOG10_2 = math.log10(2)
+
+Convergent = namedtuple("Convergent", "n ratio lower upper error_bound digits")
+
+
+# ---------------------------------- #
+#  Convergence with exact bounds
+# ---------------------------------- #
+def _certified_digits(q):
+    """Decimal places guaranteed by an error below 1/q (a floor of log10 q, without str())."""
+    return max(0, math.floor((q.bit_length() - 1) * LOG10_2))
+
+
+def convergents(count=None, start=1):
+    """
+    Yields a Convergent for n = start, start+1, ... (forever if count is None):
+        ratio        F(n+1)/F(n) as a Fraction
+        lower/upper  Fractions bracketing phi (this ratio and the next one)
+        error_bound  1/(F(n) F(n+1)), strictly above |ratio - phi|
+        digits       decimal places of phi the bound guarantees
+    """
+    if start < 1:
+        raise ValueError("F(0) = 0, so ratios start at n = 1")
+    a, b = 0, 1                    # F(0), F(1)
+    for _ in range(start - 1):
+        a, b = b, a + b
+    a, b = b, a + b                # F(start), F(start+1)
+    n = start
+    while count is None or n < start + count:
+        c = a + b                  # F(n+2)
+        ratio = Fraction(b, a)
+        following = Fraction(c, b)
+        lower, upper = (ratio, following) if n % 2 else (following, ratio)
+        q = a * b
+        yield Convergent(n, ratio, lower, upper, Fraction(1, q), _certified_digits(q))
+        a, b = b, c
+        n += 1
+
+
+def convergent(n):
+    """The single Convergent for F(n+1)/F(n)."""
+    return next(convergents(1, start=n))
+
+
+def to_decimal(value, digits, rounding=None):
+    """A Fraction as a Decimal with `digits` significant digits."""
+    with localcontext() as ctx:
+        ctx.prec = digits
+        if rounding:
+            ctx.rounding = rounding
+        return Decimal(value.numerator) / Decimal(value.denominator)
+
+
+def decimal_bounds(c, digits):
+    """Decimal lower/upper bounds on phi, rounded outward so they stay bounds."""
+    return to_decimal(c.lower, digits, ROUND_FLOOR), to_decimal(c.upper, digits, ROUND_CEILING)
+
+
+def certified_decimal(c):
+    """
+    The digits of phi this ratio pins down: the common prefix of its lower
+    and upper decimal bounds (so every digit shown is a digit of phi).
+    None while the bounds don't even agree on the first digit.
+    """
+    lower, upper = (str(d) for d in decimal_bounds(c, c.digits + 3))
+    size = 0
+    while size < min(len(lower), len(upper)) and lower[size] == upper[size]:
+        size += 1
+    prefix = lower[:size].rstrip(".")
+    return Decimal(prefix) if prefix else None
+
+
+def phi_decimal(digits):
+    """phi = (1 + sqrt 5) / 2 to `digits` significant digits."""
+    with localcontext() as ctx:
+        ctx.prec = digits + 5
+        value = (1 + Decimal(5).sqrt()) / 2
+        ctx.prec = digits
+        return +value
+
+
+def error_curve(count, start=1):
+    """
+    (n, log10 of the error bound) for `count` ratios, as a float array ready
+    to plot: the errors underflow floats long before n = 1000, their logs don't.
+    """
+    out = np.empty((count, 2))
+    for i, c in enumerate(convergents(count, start)):
+        q = c.error_bound.denominator
+        # log10(q) from the top 53 bits, so huge q doesn't overflow a float
+        shift = max(0, q.bit_length() - 53)
+        out[i] = c.n, -(math.log10(q >> shift) + shift * LOG10_2)
+    return out
+
+
+# ---------------------------------- #
+#  Fibonacci-square tiling
+# ---------------------------------- #
+# Square k is attached to the right, top, left, bottom of the tiling so far,
+# in turn. For each side: which corner the spiral arc is centered on
+# (as a multiple of the side, from the bottom-left corner) and its start angle.
+_ARC_CENTER = np.array([[0, 1], [0, 0], [1, 0], [1, 1]], dtype=float)
+_ARC_START = np.array([-PI/2, 0, PI/2, PI])
+_KAPPA = 4 / 3 * np.tan(PI / 8)   # cubic Bezier handle length for a quarter circle
+
+
+def tile_squares(count):
+    """
+    Bottom-left corners and sides of the squares F(1)..F(count), scaled so
+    the largest side is 1. Returns (corners (count, 2), sides (count,), sides_index)
+    where sides_index[k] is 0..3 = right, top, left, bottom.
+    The layout runs on exact ints, so count can go well past float range.
+    """
+    sides = []
+    corners = []
+    a, b = 1, 1
+    x0 = y0 = 0
+    x1 = y1 = 1
+    for k in range(count):
+        side = a
+        if k == 0:
+            corner = (0, 0)
+        else:
+            d = (k - 1) % 4
+            if d == 0:
+                corner = (x1, y0)
+            elif d == 1:
+                corner = (x0, y1)
+            elif d == 2:
+                corner = (x0 - side, y0)
+            else:
+                corner = (x0, y0 - side)
+            x0, y0 = min(x0, corner[0]), min(y0, corner[1])
+            x1, y1 = max(x1, corner[0] + side), max(y1, corner[1] + side)
+        sides.append(side)
+        corners.append(corner)
+        a, b = b, a + b
+
+    largest = sides[-1]
+    corners = np.array([[x / largest, y / largest] for x, y in corners])
+    sides_f = np.array([s / largest for s in sides])
+    direction = (np.arange(count) - 1) % 4
+    return corners, sides_f, direction
+
+
+def segment_points(starts, ends):
+    """Cubic Bezier control points for straight segments, (4*E, 3)."""
+    t = np.array([0, 1/3, 2/3, 1])[None, :, None]
+    return (starts[:, None, :] * (1 - t) + ends[:, None, :] * t).reshape(-1, 3)
+
+
+class GoldenTiling(VGroup):
+    """
+    `count` Fibonacci squares and the golden spiral through them, as two
+    batched VMobjects:
+        squares  every square outline (4 straight curves per square)
+        spiral   one quarter-circle curve per square, joined end to end
+    `width` is the width of the whole tiling on screen.
+    """
+
+    def __init__(
+        self,
+        count=12,
+        width=6.0,
+        square_color=BLUE,
+        spiral_color=YELLOW,
+        square_width=2,
+        spiral_width=4,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.count = count
+        corners, sides, direction = tile_squares(count)
+        self.direction = direction
+
+        # Scale to the requested width and center on the origin
+        lo = corners.min(axis=0)
+        hi = (corners + sides[:, None]).max(axis=0)
+        scale = width / (hi - lo)[0]
+        corners = (corners - (lo + hi) / 2) * scale
+        sides = sides * scale
+        self.corners = np.column_stack([corners, np.zeros(count)])
+        self.sides = sides
+
+        # Square outlines: bl -> br -> tr -> tl -> bl
+        s = sides[:, None]
+        bl = self.corners
+        br = bl + s * RIGHT
+        tr = br + s * UP
+        tl = bl + s * UP
+        starts = np.stack([bl, br, tr, tl], axis=1).reshape(-1, 3)
+        ends = np.stack([br, tr, tl, bl], axis=1).reshape(-1, 3)
+        self.squares = VMobject(stroke_color=square_color, stroke_width=square_width)
+        self.squares.set_points(segment_points(starts, ends))
+
+        # Quarter arcs, centered on one corner of each square
+        center = bl + np.column_stack([_ARC_CENTER[direction] * s, np.zeros(count)])
+        a0 = _ARC_START[direction]
+        a1 = a0 + PI/2
+        unit0 = np.column_stack([np.cos(a0), np.sin(a0), np.zeros(count)])
+        unit1 = np.column_stack([np.cos(a1), np.sin(a1), np.zeros(count)])
+        p0 = center + s * unit0
+        p3 = center + s * unit1
+        p1 = p0 + _KAPPA * s * unit1
+        p2 = p3 + _KAPPA * s * unit0
+        self.spiral = VMobject(stroke_color=spiral_color, stroke_width=spiral_width)
+        self.spiral.set_points(np.stack([p0, p1, p2, p3], axis=1).reshape(-1, 3))
+
+        self.add(self.squares, self.spiral)
+
+    def square_center(self, k):
+        """Center of square k (0 = the first F(1) square), following any moves since."""
+        base = self.squares.points[16 * k]
+        diagonal = self.squares.points[16 * k + 8] - base
+        return base + diagonal / 2
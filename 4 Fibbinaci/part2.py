@@ -1,18 +1,25 @@
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.azure import AzureService
+
+import itertools
+
+from stairs import count_ways, enumerate_paths
 
 INCLUDE_NARRATION = True
 FANCY_NARRATION = True
 NARRATOR_VOICE = "en-US-SteffanNeural"
 
+
+def make_speech_service():
+    if FANCY_NARRATION:
+        from manim_voiceover.services.azure import AzureService
+        return AzureService(voice=NARRATOR_VOICE)
+    return None
+
 class FibonacciStairsCode(VoiceoverScene):
     def construct(self):
-        if FANCY_NARRATION:
-            service = AzureService(voice=NARRATOR_VOICE)
-        else:
-            service = None
-        if INCLUDE_NARRATION and service:
+        service = make_speech_service() if INCLUDE_NARRATION else None
+        if service:
             self.set_speech_service(service)
 
         title = Text("Climbing Stairs Problem", font_size=36).to_edge(UP)
@@ -36,7 +43,7 @@ class FibonacciStairsCode(VoiceoverScene):
         self.voiceover_or_play(Create(stairs), text=ways_explanation)
         self.wait(2)
 
-        ways = [1,2,3,5,8]
+        ways = [count_ways(n) for n in range(1, stair_count + 1)]
         ways_labels = VGroup()
         for i,w in enumerate(ways):
             lbl = Tex(str(w)).next_to(stairs[i], UP)
@@ -45,6 +52,21 @@ class FibonacciStairsCode(VoiceoverScene):
             self.play(Write(lbl))
             self.wait(0.5)
 
+        # Walk a few of the actual paths up the stairs, pulled lazily from the generator
+        climber = Dot(color=YELLOW).next_to(stairs[0], LEFT+DOWN, buff=0)
+        self.voiceover_or_play(FadeIn(climber), text=(
+            f"Here are a few of the {ways[-1]} ways to reach the top."
+        ))
+        for path in itertools.islice(enumerate_paths(stair_count), 3):
+            start = climber.copy()
+            height = 0
+            for step in path:
+                height += step
+                self.play(climber.animate.next_to(stairs[height - 1], UP, buff=0.05), path_arc=-PI/3, run_time=0.4)
+            self.wait(0.5)
+            self.play(climber.animate.move_to(start), run_time=0.4)
+        self.play(FadeOut(climber))
+
         # Show a Python code snippet as text
         code_text = (
             "def climb_stairs(n):\n"
@@ -1,18 +1,25 @@
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.azure import AzureService
+
+import fibonacci
+from big_number import BigNumber
+from recursion_tree import RecursionTree
 
 INCLUDE_NARRATION = True
 FANCY_NARRATION = True
 NARRATOR_VOICE = "en-US-SteffanNeural"
 
+
+def make_speech_service():
+    if FANCY_NARRATION:
+        from manim_voiceover.services.azure import AzureService
+        return AzureService(voice=NARRATOR_VOICE)
+    return None
+
 class FibonacciRecursionVsDP(VoiceoverScene):
     def construct(self):
-        if FANCY_NARRATION:
-            service = AzureService(voice=NARRATOR_VOICE)
-        else:
-            service = None
-        if INCLUDE_NARRATION and service:
+        service = make_speech_service() if INCLUDE_NARRATION else None
+        if service:
             self.set_speech_service(service)
 
         title = Text("Recursion vs Dynamic Programming", font_size=36).to_edge(UP)
@@ -22,24 +29,40 @@ class FibonacciRecursionVsDP(VoiceoverScene):
         self.voiceover_or_play(FadeIn(title), text=intro)
         self.wait(2)
 
-        # Show a small recursion tree for F_5 for brevity
-        f5 = MathTex("F_{5}")
-        f4 = MathTex("F_{4}").next_to(f5, LEFT+DOWN)
-        f3 = MathTex("F_{3}").next_to(f5, RIGHT+DOWN)
-        self.play(FadeIn(f5), FadeIn(f4), FadeIn(f3))
+        # The full recursion tree for F_5, laid out from the recorded calls
+        tree = RecursionTree(5)
+        tree.scale_to_fit_width(7).next_to(title, DOWN, buff=0.5)
+        self.play(FadeIn(tree.nodes), FadeIn(tree.labels))
+        self.play(Create(tree.edges))
         self.wait(1)
 
-        explanation = "Notice how to compute F_5, we need F_4 and F_3, and each of those need more calls, repeating calculations."
-        self.voiceover_or_play(None, text=explanation)
+        # Real numbers from running the naive recursion
+        _, counter = fibonacci.naive_calls(5)
+        calls_text = Text(
+            f"fib(5) makes {counter.calls} calls; F_2 alone is computed {counter.per_n[2]} times",
+            font_size=24
+        ).to_edge(DOWN)
+        explanation = (
+            "Notice how to compute F_5, we need F_4 and F_3, and each of those need more calls, repeating calculations. "
+            f"In total the naive version makes {counter.calls} calls just for F_5."
+        )
+        self.voiceover_or_play(FadeIn(calls_text), text=explanation)
         self.wait(2)
 
-        # Highlight repetition if desired
+        # Highlight repetition, then collapse repeats the way memoization does
+        repeat_marks = tree.repeat_marks()
+        self.play(Create(repeat_marks))
+        self.wait(1)
         repeat_text = "Dynamic Programming solves this by storing previously computed results."
-        self.voiceover_or_play(None, text=repeat_text)
+        self.voiceover_or_play(
+            AnimationGroup(Transform(tree, tree.collapsed()), FadeOut(repeat_marks)),
+            text=repeat_text
+        )
         self.wait(2)
+        self.play(FadeOut(tree))
 
         # Show DP array
-        dp_vals = [1,1,2,3,5]
+        dp_vals = fibonacci.sequence(5)
         dp_boxes = VGroup()
         for i,v in enumerate(dp_vals):
             box = Square(0.4).shift(RIGHT*i*0.5+DOWN*1)
@@ -56,5 +79,18 @@ class FibonacciRecursionVsDP(VoiceoverScene):
         self.voiceover_or_play(None, text=recap)
         self.wait(2)
 
-        self.play(FadeOut(dp_boxes), FadeOut(dp_title), FadeOut(f5), FadeOut(f4), FadeOut(f3), FadeOut(title))
+        self.play(FadeOut(dp_boxes), FadeOut(dp_title), FadeOut(calls_text))
+
+        # Linear time is fast enough for F(10000): all 2,090 digits, no LaTeX
+        big_n = 10000
+        big = BigNumber(fibonacci.fib_dp(big_n), line_digits=60, font_size=20, window_lines=10).shift(DOWN*0.5)
+        big_label = MathTex(rf"F_{{{big_n}}} \text{{ has }} {len(big.digits):,} \text{{ digits}}").scale(0.8).next_to(title, DOWN)
+        self.voiceover_or_play(big.reveal(), text=(
+            f"Linear time means even F of {big_n:,}, a number with {len(big.digits):,} digits, takes a blink."
+        ))
+        self.play(Write(big_label))
+        self.play(big.scroll_to(len(big.lines)), run_time=6, rate_func=linear)
+        self.wait(2)
+
+        self.play(FadeOut(big), FadeOut(big_label), FadeOut(title))
         self.wait(1)
\ No newline at end of file
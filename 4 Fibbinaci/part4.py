@@ -1,18 +1,26 @@
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.azure import AzureService
+
+import fibonacci
+import golden_ratio
+from golden_ratio import GOLDEN_ANGLE, GoldenTiling
+from phyllotaxis import SeedField, approximant_angles
 
 INCLUDE_NARRATION = True
 FANCY_NARRATION = True
 NARRATOR_VOICE = "en-US-SteffanNeural"
 
+
+def make_speech_service():
+    if FANCY_NARRATION:
+        from manim_voiceover.services.azure import AzureService
+        return AzureService(voice=NARRATOR_VOICE)
+    return None
+
 class FibonacciGoldenRatio(VoiceoverScene):
     def construct(self):
-        if FANCY_NARRATION:
-            service = AzureService(voice=NARRATOR_VOICE)
-        else:
-            service = None
-        if INCLUDE_NARRATION and service:
+        service = make_speech_service() if INCLUDE_NARRATION else None
+        if service:
             self.set_speech_service(service)
 
         title = Text("The Golden Ratio", font_size=36).to_edge(UP)
@@ -21,7 +29,10 @@ class FibonacciGoldenRatio(VoiceoverScene):
         ))
         self.wait(2)
 
-        ratio = MathTex(r"\frac{F_{14}}{F_{13}} \approx 1.618").move_to(UP*1)
+        golden = fibonacci.ratio(13)
+        ratio = MathTex(
+            rf"\frac{{F_{{14}}}}{{F_{{13}}}} = \frac{{{golden.numerator}}}{{{golden.denominator}}} \approx {float(golden):.3f}"
+        ).move_to(UP*1)
         self.play(Write(ratio))
         self.wait(1)
         explain = (
@@ -35,14 +46,66 @@ class FibonacciGoldenRatio(VoiceoverScene):
         self.play(FadeIn(note))
         self.wait(2)
 
-        # Optionally show a golden rectangle
-        golden_rect = Rectangle(width=2, height=2/1.618, color=YELLOW).next_to(ratio, RIGHT, buff=1)
-        self.play(Create(golden_rect))
+        # Push n further: every digit shown is guaranteed by the exact error bound
+        self.play(FadeOut(note))
+        checkpoints = (13, 25, 50, 100)
+        readout = None
+        for c in golden_ratio.convergents(checkpoints[-1] - checkpoints[0] + 1, start=checkpoints[0]):
+            if c.n not in checkpoints:
+                continue
+            line = MathTex(
+                rf"\frac{{F_{{{c.n + 1}}}}}{{F_{{{c.n}}}}} = {golden_ratio.certified_decimal(c)}\ldots",
+                rf"\quad \text{{error}} < 10^{{-{c.digits}}}",
+            ).scale(0.8)
+            if line.width > config.frame_width - 1:     # n = 100 certifies ~40 digits
+                line.scale_to_fit_width(config.frame_width - 1)
+            line.next_to(ratio, DOWN*2)
+            if readout is None:
+                readout = line
+                self.play(Write(readout))
+            else:
+                self.play(Transform(readout, line))
+            self.wait(1)
+
+        # 30 nested Fibonacci squares and the spiral through them, two mobjects in all
+        self.play(FadeOut(ratio), FadeOut(readout))
+        golden_rect = GoldenTiling(count=30, width=7)
+        self.voiceover_or_play(Create(golden_rect.squares), text=(
+            "Tile squares whose sides are the Fibonacci numbers and every new rectangle gets closer to a golden rectangle."
+        ))
+        self.play(Create(golden_rect.spiral), run_time=3)
+        self.wait(2)
+        self.play(FadeOut(golden_rect))
+
+        # Nature: a sunflower head of 20,000 seeds, each turned by one angle from the last
+        seeds = SeedField(seeds=20000, radius=3.2, divergence=approximant_angles(1)[0]).shift(DOWN*0.4)
+        angle = ValueTracker(seeds.divergence)
+        seeds.add_updater(lambda m: m.set_divergence(angle.get_value()))
+        angle_label = always_redraw(lambda: MathTex(
+            rf"{np.degrees(angle.get_value()):.2f}^\circ"
+        ).scale(0.8).to_corner(DR))
+        self.voiceover_or_play(FadeIn(seeds), text=(
+            "A sunflower places each new seed at a fixed turn from the last one."
+        ))
+        self.add(angle_label)
+        self.voiceover_or_play(None, text=(
+            "Turn by a simple fraction of a circle and the seeds line up in spokes, leaving gaps."
+        ))
+        for target in approximant_angles(7)[1:]:
+            self.play(angle.animate.set_value(target), run_time=1.2)
+            self.wait(0.3)
+        self.voiceover_or_play(angle.animate.set_value(GOLDEN_ANGLE), text=(
+            "The Fibonacci fractions close in on the golden angle, about 137.5 degrees, "
+            "and only there do the seeds pack with no gaps at all."
+        ))
+        seeds.clear_updaters()
+        self.play(seeds.animate.highlight_spirals(34))
         self.wait(2)
+        self.play(FadeOut(seeds), FadeOut(angle_label))
 
         final = "From a simple sequence to real-world applications and natural aesthetics, Fibonacci teaches us about interconnectedness."
         self.voiceover_or_play(None, text=final)
         self.wait(3)
 
-        self.play(FadeOut(title), FadeOut(ratio), FadeOut(note), FadeOut(golden_rect))
+        self.play(FadeOut(title))
         self.wait(1)
\ No newline at end of file
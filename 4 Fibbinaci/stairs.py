@@ -0,0 +1,262 @@
+"""
+Generalized stair climbing: how many ways to climb n steps when each move
+can be any size in `steps` (the video's version is steps = (1, 2)).
+
+    count_ways(10)                      -> 89
+    count_ways(10, steps=(1, 3, 5))     -> 47
+    count_ways(10**18, mod=10**9 + 7)   -> matrix power, instant
+
+Counting:
+    count_ways_dp      bottom-up table of the last max(steps) values, O(n k)
+    count_ways_memo    top-down recursion with a cache, O(n k)
+    count_ways_matrix  companion-matrix power, O(k^3 log n)
+All three take an optional modulus.
+
+Enumerating: enumerate_paths() is a generator, so a scene can pull a few
+actual step sequences (or random_path() for a uniform random one) without
+ever materializing all count_ways(n) of them.
+
+Benchmark:
+    python stairs.py --bench
+    python stairs.py --bench --steps 1 3 5 --max-n 10000000
+"""
+import argparse
+import random
+import time
+from functools import lru_cache
+
+DEFAULT_STEPS = (1, 2)
+BENCH_MOD = 10**9 + 7
+
+
+def _normalize(steps):
+    steps = tuple(sorted(set(steps)))
+    if not steps or steps[0] < 1:
+        raise ValueError(f"step sizes must be positive integers, got {steps}")
+    return steps
+
+
+# ---------------------------------- #
+#  Counting
+# ---------------------------------- #
+def count_ways_dp(n, steps=DEFAULT_STEPS, mod=None):
+    """ways(i) = sum(ways(i - s) for s in steps), keeping a window of max(steps) values."""
+    steps = _normalize(steps)
+    k = steps[-1]
+    window = [0] * k      # window[i % k] = ways(i)
+    window[0] = 1
+    for i in range(1, n + 1):
+        total = 0
+        for s in steps:
+            if s <= i:
+                total += window[(i - s) % k]
+        window[i % k] = total % mod if mod else total
+    return window[n % k]
+
+
+def count_ways_memo(n, steps=DEFAULT_STEPS, mod=None):
+    """
+    Top-down recursion with a cache. The cache is filled upward in chunks
+    so the recursion depth stays small even for huge n.
+    """
+    steps = _normalize(steps)
+
+    @lru_cache(maxsize=None)
+    def ways(i):
+        if i < 0:
+            return 0
+        if i == 0:
+            return 1
+        total = sum(ways(i - s) for s in steps)
+        return total % mod if mod else total
+
+    chunk = 200 // steps[-1] * steps[-1] or steps[-1]
+    for i in range(0, n, chunk):
+        ways(i)
+    result = ways(n)
+    ways.cache_clear()
+    return result
+
+
+def companion_matrix(steps=DEFAULT_STEPS):
+    """
+    k x k matrix M with [ways(i), ..., ways(i-k+1)] = M @ [ways(i-1), ..., ways(i-k)].
+    """
+    steps = _normalize(steps)
+    k = steps[-1]
+    M = [[0] * k for _ in range(k)]
+    for s in steps:
+        M[0][s - 1] = 1
+    for row in range(1, k):
+        M[row][row - 1] = 1
+    return M
+
+
+def _mat_mult(A, B, mod=None):
+    cols = list(zip(*B))
+    out = []
+    for row in A:
+        new_row = []
+        for col in cols:
+            total = sum(a * b for a, b in zip(row, col) if a and b)
+            new_row.append(total % mod if mod else total)
+        out.append(new_row)
+    return out
+
+
+def _mat_pow(M, power, mod=None):
+    size = len(M)
+    result = [[int(i == j) for j in range(size)] for i in range(size)]
+    while power:
+        if power & 1:
+            result = _mat_mult(result, M, mod)
+        M = _mat_mult(M, M, mod)
+        power >>= 1
+    return result
+
+
+def count_ways_matrix(n, steps=DEFAULT_STEPS, mod=None):
+    """ways(n) = (M^n)[0][0], since the state for n = 0 is [1, 0, ..., 0]."""
+    return _mat_pow(companion_matrix(steps), n, mod)[0][0]
+
+
+def count_ways(n, steps=DEFAULT_STEPS, mod=None):
+    """ways(n) by whichever method is fastest for this n."""
+    if n < 64:
+        return count_ways_dp(n, steps, mod)
+    return count_ways_matrix(n, steps, mod)
+
+
+IMPLEMENTATIONS = {
+    "dp": count_ways_dp,
+    "memo": count_ways_memo,
+    "matrix": count_ways_matrix,
+}
+
+# Largest n each method is benchmarked at by default (memo keeps every value)
+BENCH_LIMITS = {
+    "dp": 10**7,
+    "memo": 10**6,
+    "matrix": 10**7,
+}
+
+
+# ---------------------------------- #
+#  Enumerating actual paths
+# ---------------------------------- #
+def enumerate_paths(n, steps=DEFAULT_STEPS):
+    """
+    Yields every way to climb n steps as a tuple of step sizes, in
+    lexicographic order, one at a time. Dead ends are never explored: a
+    branch is only entered if the remaining height can still be reached.
+    """
+    steps = _normalize(steps)
+    reachable = [False] * (n + 1)
+    reachable[0] = True
+    for i in range(1, n + 1):
+        reachable[i] = any(s <= i and reachable[i - s] for s in steps)
+    if not reachable[n]:
+        return
+    if n == 0:
+        yield ()
+        return
+
+    path = []
+    stack = [iter(steps)]
+    remaining = n
+    while stack:
+        for s in stack[-1]:
+            if s <= remaining and reachable[remaining - s]:
+                path.append(s)
+                remaining -= s
+                if remaining == 0:
+                    yield tuple(path)
+                    remaining += path.pop()
+                    continue
+                stack.append(iter(steps))
+                break
+        else:
+            stack.pop()
+            if path:
+                remaining += path.pop()
+
+
+def random_path(n, steps=DEFAULT_STEPS, rng=random):
+    """
+    One path chosen uniformly at random among all count_ways(n) paths,
+    picking each step with probability ways(rest after step) / ways(rest).
+    """
+    steps = _normalize(steps)
+    table = [0] * (n + 1)
+    table[0] = 1
+    for i in range(1, n + 1):
+        table[i] = sum(table[i - s] for s in steps if s <= i)
+    if table[n] == 0:
+        raise ValueError(f"{n} steps can't be climbed with moves {steps}")
+    path = []
+    remaining = n
+    while remaining:
+        pick = rng.randrange(table[remaining])
+        for s in steps:
+            if s <= remaining:
+                if pick < table[remaining - s]:
+                    break
+                pick -= table[remaining - s]
+        path.append(s)
+        remaining -= s
+    return tuple(path)
+
+
+# ---------------------------------- #
+#  Benchmark
+# ---------------------------------- #
+def benchmark(steps=DEFAULT_STEPS, methods=None, max_n=10**7, mod=BENCH_MOD):
+    """
+    Times each method at n = 10, 100, ... up to its limit, checking the
+    results agree. Big-n runs use `mod` (the exact answer for n = 10^7
+    has millions of digits). Returns (method, n, seconds) rows.
+    """
+    methods = methods or list(IMPLEMENTATIONS)
+    rows = []
+    for name in methods:
+        func = IMPLEMENTATIONS[name]
+        limit = min(BENCH_LIMITS[name], max_n)
+        for n in [10**k for k in range(1, 8) if 10**k <= limit]:
+            start = time.perf_counter()
+            result = func(n, steps, mod)
+            elapsed = time.perf_counter() - start
+            if n <= 10**5 and result != count_ways_matrix(n, steps, mod):
+                raise AssertionError(f"{name} disagrees with the matrix method at n={n}")
+            rows.append((name, n, elapsed))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stair-climbing counts and benchmark")
+    parser.add_argument("n", nargs="?", type=int, help="print ways(n) and a few paths")
+    parser.add_argument("--steps", nargs="+", type=int, default=list(DEFAULT_STEPS))
+    parser.add_argument("--mod", type=int)
+    parser.add_argument("--bench", action="store_true")
+    parser.add_argument("--max-n", type=int, default=10**7)
+    parser.add_argument("--methods", nargs="+", choices=sorted(IMPLEMENTATIONS))
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        mod = args.mod or BENCH_MOD
+        print(f"steps {sorted(set(args.steps))}, mod {mod}")
+        print(f"{'method':<8} {'n':>9} {'seconds':>12}")
+        for name, n, seconds in benchmark(args.steps, args.methods, args.max_n, mod):
+            print(f"{name:<8} {n:>9} {seconds:>12.6f}")
+    elif args.n is not None:
+        print(f"ways({args.n}) = {count_ways(args.n, args.steps, args.mod)}")
+        for i, path in enumerate(enumerate_paths(args.n, args.steps)):
+            if i == 5:
+                print("...")
+                break
+            print(" + ".join(map(str, path)))
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.azure import AzureService
-from manim_voiceover.services.gtts import GTTSService
+
+import fibonacci
+from recursion_tree import RecursionTree
+from bunny_population import PopulationCloud
+from stairs import count_ways
+from golden_ratio import GOLDEN_ANGLE, GoldenTiling
+from phyllotaxis import SeedField
 import numpy as np
 
 # Flags for narration and styles
@@ -9,16 +14,19 @@ INCLUDE_NARRATION = True
 FANCY_NARRATION = True
 NARRATOR_VOICE = "en-US-SteffanNeural"
 
+
+def make_speech_service():
+    if FANCY_NARRATION:
+        from manim_voiceover.services.azure import AzureService
+        return AzureService(voice=NARRATOR_VOICE)
+    from manim_voiceover.services.gtts import GTTSService
+    return GTTSService(lang="en", tld="com")
+
 class FibonacciExplainer(VoiceoverScene):
     def construct(self):
         # Setup Voiceover Service
-        if FANCY_NARRATION:
-            service = AzureService(voice=NARRATOR_VOICE)
-        else:
-            service = GTTSService(lang="en", tld="com")
-
         if INCLUDE_NARRATION:
-            self.set_speech_service(service)
+            self.set_speech_service(make_speech_service())
 
         # Intro Section
         self.show_introduction()
@@ -38,6 +46,9 @@ class FibonacciExplainer(VoiceoverScene):
         # Golden Ratio Section
         self.golden_ratio_section()
 
+        # Where the golden angle shows up in nature
+        self.sunflower_section()
+
         # Efficiency and Conclusion
         self.efficiency_conclusion()
 
@@ -117,11 +128,10 @@ class FibonacciExplainer(VoiceoverScene):
         self.wait(1)
 
         # Show rabbit counts step-by-step, pausing in between
-        fib_vals = [1,1,2,3,5,8]
-        rabbits_groups = VGroup()
-        for i, val in enumerate(fib_vals):
-            # Represent rabbits as small dots
-            rabbit_group = VGroup(*[Circle(radius=0.1, fill_opacity=1, color=WHITE).shift(UP*(0.2*j)) for j in range(val)])
+        rabbits_groups = Group()
+        for i in range(6):
+            # Each month's pairs as one point cloud, newborns in pink
+            rabbit_group = PopulationCloud(months=i, layout="column", spacing=0.2)
             pos = line.point_from_proportion(i/6) + UP*1
             rabbit_group.move_to(pos)
             rabbits_groups.add(rabbit_group)
@@ -156,7 +166,22 @@ class FibonacciExplainer(VoiceoverScene):
         self.voiceover_or_play(None, text=final_desc)
         self.wait(2)
 
-        self.play(FadeOut(rabbits_groups), FadeOut(line), FadeOut(month_marks), FadeOut(bunny_title))
+        self.play(FadeOut(rabbits_groups), FadeOut(line), FadeOut(month_marks))
+
+        # Two years later: tens of thousands of pairs, still a single mobject
+        months = 24
+        population = PopulationCloud(months=months, radius=2.6).shift(DOWN*0.5)
+        month = ValueTracker(0)
+        population.add_updater(lambda m: m.set_month(month.get_value()))
+        self.add(population)
+        self.voiceover_or_play(
+            month.animate(rate_func=linear).set_value(months),
+            text=f"Keep going for two years and the single pair becomes {fibonacci.fib(months + 1):,} pairs."
+        )
+        self.wait(2)
+        population.clear_updaters()
+
+        self.play(FadeOut(population), FadeOut(bunny_title))
         self.wait(1)
 
     def climbing_stairs(self):
@@ -185,7 +210,7 @@ class FibonacciExplainer(VoiceoverScene):
         ))
         self.wait(2)
 
-        ways = [1,2,3,5,8]
+        ways = [count_ways(n) for n in range(1, stair_count + 1)]
         ways_labels = VGroup()
         for i,w in enumerate(ways):
             label = Tex(str(w)).scale(0.7).next_to(stairs[i], UP)
@@ -226,53 +251,40 @@ class FibonacciExplainer(VoiceoverScene):
         self.voiceover_or_play(FadeIn(recursion_title), text=intro_recursion_text)
         self.wait(2)
 
-        # Recursion tree
-        f5 = MathTex("F_{5}")
-        f4 = MathTex("F_{4}").next_to(f5, LEFT+DOWN)
-        f3 = MathTex("F_{3}").next_to(f5, RIGHT+DOWN)
-        f3_l = MathTex("F_{3}").next_to(f4, LEFT+DOWN)
-        f2_l = MathTex("F_{2}").next_to(f4, RIGHT+DOWN)
-        f2_ll = MathTex("F_{2}").next_to(f3_l, LEFT+DOWN)
-        f1_ll = MathTex("F_{1}").next_to(f3_l, RIGHT+DOWN)
-        f1_lr = MathTex("F_{1}").next_to(f2_l, LEFT+DOWN)
-        f0_lr = MathTex("F_{0}").next_to(f2_l, RIGHT+DOWN)
-        recursion_group = VGroup(f5,f4,f3,f3_l,f2_l,f2_ll,f1_ll,f1_lr,f0_lr).scale(0.7).move_to(LEFT*3+UP*1)
-
-        self.play(FadeIn(f5))
-        self.play(FadeIn(f4),FadeIn(f3))
-        self.play(FadeIn(f3_l),FadeIn(f2_l))
-        self.play(FadeIn(f2_ll),FadeIn(f1_ll),FadeIn(f1_lr),FadeIn(f0_lr))
-        self.wait(1)
+        # Recursion tree: every call fib(5) makes, laid out automatically
+        recursion_group = RecursionTree(5).scale_to_fit_width(5.5).move_to(LEFT*3+UP*0.5)
 
-        arrow_pairs = [(f5,f4),(f5,f3),(f4,f3_l),(f4,f2_l),(f3_l,f2_ll),(f3_l,f1_ll),(f2_l,f1_lr),(f2_l,f0_lr)]
-        arrs = VGroup(*[Arrow(p1.get_bottom(), p2.get_top(), buff=0.1, color=BLUE) for p1,p2 in arrow_pairs])
-        self.play(*[Create(a) for a in arrs])
+        self.play(FadeIn(recursion_group.nodes), FadeIn(recursion_group.labels))
+        self.wait(1)
+        self.play(Create(recursion_group.edges))
         self.wait(2)
 
+        _, counter = fibonacci.naive_calls(5)
         highlight_text = (
-            "Notice how some values, like F_2 and F_3, appear multiple times, causing exponential redundancy."
+            "Notice how some values, like F_2 and F_3, appear multiple times, causing exponential redundancy. "
+            f"Computing F_5 this way takes {counter.calls} calls, and F_2 alone is computed {counter.per_n[2]} times."
         )
         self.voiceover_or_play(None, text=highlight_text)
         self.wait(2)
 
-        repeat_circle = Circle(color=RED)
-        repeat_circle.surround(f2_ll)
-        repeat_circle.scale(1.2)
-        self.play(Create(repeat_circle))
+        repeat_marks = recursion_group.repeat_marks()
+        self.play(Create(repeat_marks))
         self.wait(1)
-        self.play(FadeOut(repeat_circle))
+        self.play(FadeOut(repeat_marks))
         self.wait(1)
 
+        self.next_section("dp")
         dp_title = Text("Dynamic Programming", font_size=36).to_edge(UP).shift(RIGHT*3)
         dp_intro_text = (
             "With Dynamic Programming, we store previously computed values to avoid repetition, "
             "reducing complexity dramatically."
         )
         self.play(Write(dp_title))
-        self.voiceover_or_play(None, text=dp_intro_text)
+        # Memoization collapses every repeated call onto the first one
+        self.voiceover_or_play(Transform(recursion_group, recursion_group.collapsed()), text=dp_intro_text)
         self.wait(2)
 
-        dp_values = [1,1,2,3,5]
+        dp_values = fibonacci.sequence(5)
         dp_boxes = VGroup()
         for i,v in enumerate(dp_values):
             box = Square(side_length=0.5).shift(RIGHT*(i*0.7+3) + DOWN*1)
@@ -295,7 +307,7 @@ class FibonacciExplainer(VoiceoverScene):
             self.play(FadeOut(arr1), FadeOut(arr2))
             self.wait(1)
 
-        self.play(FadeOut(recursion_title), FadeOut(dp_title), FadeOut(recursion_group), FadeOut(arrs), FadeOut(dp_boxes))
+        self.play(FadeOut(recursion_title), FadeOut(dp_title), FadeOut(recursion_group), FadeOut(dp_boxes))
         self.wait(2)
 
     def golden_ratio_section(self):
@@ -306,7 +318,10 @@ class FibonacciExplainer(VoiceoverScene):
         self.voiceover_or_play(FadeIn(gold_title), text=intro_gold_text)
         self.wait(2)
 
-        ratio_calc = MathTex(r"\frac{F_{14}}{F_{13}} = \frac{377}{233} \approx 1.618").move_to(UP*1)
+        golden = fibonacci.ratio(13)
+        ratio_calc = MathTex(
+            rf"\frac{{F_{{14}}}}{{F_{{13}}}} = \frac{{{golden.numerator}}}{{{golden.denominator}}} \approx {float(golden):.3f}"
+        ).move_to(UP*1)
         self.play(Write(ratio_calc))
         self.wait(1)
         self.voiceover_or_play(None, text=(
@@ -320,12 +335,30 @@ class FibonacciExplainer(VoiceoverScene):
         self.play(FadeIn(note))
         self.wait(2)
 
-        golden_rect = Rectangle(width=2, height=2/1.618, color=YELLOW).next_to(ratio_calc, RIGHT, buff=1)
-        self.play(Create(golden_rect))
+        golden_rect = GoldenTiling(count=12, width=3).next_to(ratio_calc, RIGHT, buff=1)
+        self.play(Create(golden_rect.squares))
+        self.play(Create(golden_rect.spiral))
         self.wait(2)
         self.play(FadeOut(gold_title), FadeOut(ratio_calc), FadeOut(note), FadeOut(golden_rect))
         self.wait(1)
 
+    def sunflower_section(self):
+        title = Text("Sunflower Seeds", font_size=36).to_edge(UP)
+        seeds = SeedField(seeds=10000, radius=3, divergence=TAU/3).shift(DOWN*0.4)
+        angle = ValueTracker(TAU/3)
+        seeds.add_updater(lambda m: m.set_divergence(angle.get_value()))
+        self.voiceover_or_play(FadeIn(title, seeds), text=(
+            "Seeds placed a third of a turn apart line up in three spokes."
+        ))
+        self.wait(1)
+        self.voiceover_or_play(angle.animate.set_value(GOLDEN_ANGLE), text=(
+            "Turn each seed by the golden angle instead, and the sunflower's spirals appear."
+        ))
+        self.wait(2)
+        seeds.clear_updaters()
+        self.play(FadeOut(title), FadeOut(seeds))
+        self.wait(1)
+
     def efficiency_conclusion(self):
         comp_title = Text("Efficiency Comparison", font_size=36).to_edge(UP)
         intro_comp_text = (
@@ -1,8 +1,5 @@
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
-from manim_voiceover.services.azure import AzureService
-from manim_voiceover.services.recorder import RecorderService
 import numpy as np  # For any mathematical functions if needed
 
 # Flags and configuration
@@ -10,18 +7,22 @@ INCLUDE_NARRATION = False
 FANCY_NARRATION = True
 NARRARATOR_VOICE = "en-US-SteffanNeural"
 
+
+def make_speech_service():
+    if FANCY_NARRATION:
+        # Using the RecorderService for now; can switch to AzureService once ready
+        from manim_voiceover.services.recorder import RecorderService
+        return RecorderService()
+        # from manim_voiceover.services.azure import AzureService
+        # return AzureService(voice=NARRARATOR_VOICE)
+    from manim_voiceover.services.gtts import GTTSService
+    return GTTSService(lang="en", tld="com")
+
 class CacheIndexingExplanation(VoiceoverScene):
     def construct(self):
         # Set up voiceover service
-        if FANCY_NARRATION:
-            # Using the RecorderService for now; can switch to AzureService once ready
-            service = RecorderService()
-            # service = AzureService(voice=NARRARATOR_VOICE)
-        else:
-            service = GTTSService(lang="en", tld="com")
-
         if INCLUDE_NARRATION:
-            self.set_speech_service(service)
+            self.set_speech_service(make_speech_service())
 
         # Helper method to handle voiceover and animation sync
         def voiceover_or_play(animation, text=""):
@@ -0,0 +1,174 @@
+"""
+Palindromic tree (eertree): every distinct palindrome in a string, built
+one character at a time.
+
+Manacher answers "what is the longest palindrome"; the eertree answers the
+rest: how many distinct palindromic substrings there are, how often each one
+occurs, and which palindromes end at each position. Each node is one
+distinct palindrome, with an edge c from X to cXc and a suffix link to its
+longest proper palindromic suffix. Appending a character adds at most one
+node, and construction is linear overall.
+
+Nodes live in parallel int32 arrays (length, suffix link, occurrence count,
+first end position), and all edges of the tree share ONE dict keyed by
+node << 21 | code point, so there is no per-node dict or object. Node 0 is
+the imaginary root of length -1, node 1 the empty palindrome.
+
+    tree = Eertree("abacaba")
+    tree.distinct()                  # 7
+    tree.palindromes()               # {'a': 4, 'b': 2, 'c': 1, 'aba': 2, ...}
+    tree.ending_at(6)                # ['abacaba', 'aba', 'a']
+    tree.append("x")                 # streaming: feed more text at any time
+
+Usage:
+    python eertree.py abacaba
+    python eertree.py --bench            # against Manacher on "a" * n, as in Part 5
+"""
+import argparse
+import time
+from array import array
+
+from manacher import longestPalindrome
+
+IMAGINARY, EMPTY = 0, 1
+
+
+class Eertree:
+    def __init__(self, text=""):
+        self.text = array("I")              # code points appended so far
+        self.length = array("i", [-1, 0])
+        self.link = array("i", [IMAGINARY, IMAGINARY])
+        self.count = array("i", [0, 0])      # times the node was the longest palindromic suffix
+        self.first_end = array("i", [-1, -1])  # where each palindrome first occurs (its node was made there)
+        self.edges = {}
+        self.suffix = array("i")             # longest palindromic suffix node after each position
+        self.last = EMPTY
+        self.extend(text)
+
+    def _fits(self, node, pos, c):
+        """Does c + palindrome(node) + c end at pos?"""
+        start = pos - 1 - self.length[node]
+        return start >= 0 and self.text[start] == c
+
+    def append(self, ch):
+        """Adds one character (str or int code point). Returns True if it created a new palindrome."""
+        c = ord(ch) if isinstance(ch, str) else ch
+        text, length, link = self.text, self.length, self.link
+        pos = len(text)
+        text.append(c)
+
+        node = self.last
+        while not self._fits(node, pos, c):
+            node = link[node]
+        key = node << 21 | c
+        found = self.edges.get(key)
+        if found is not None:
+            self.last = found
+            self.count[found] += 1
+            self.suffix.append(found)
+            return False
+
+        new = len(length)
+        length.append(length[node] + 2)
+        if length[new] == 1:
+            link.append(EMPTY)
+        else:
+            parent = link[node]
+            while not self._fits(parent, pos, c):
+                parent = link[parent]
+            link.append(self.edges[parent << 21 | c])
+        self.count.append(1)
+        self.first_end.append(pos)
+        self.edges[key] = new
+        self.last = new
+        self.suffix.append(new)
+        return True
+
+    def extend(self, text):
+        for ch in text:
+            self.append(ch)
+        return self
+
+    # Queries ---------------------------------------------------------- #
+    def __len__(self):
+        return len(self.text)
+
+    def distinct(self):
+        """Number of distinct non-empty palindromic substrings."""
+        return len(self.length) - 2
+
+    def occurrences(self):
+        """
+        array('i') of occurrence counts per node. Every occurrence of a
+        palindrome is also an occurrence of its palindromic suffixes, so the
+        counts are pushed down the suffix links, longest nodes first.
+        """
+        total = array("i", self.count)
+        for node in range(len(total) - 1, 1, -1):
+            total[self.link[node]] += total[node]
+        return total
+
+    def node_string(self, node):
+        """The palindrome of a node, read from its first occurrence."""
+        end = self.first_end[node]
+        return "".join(map(chr, self.text[end + 1 - self.length[node]:end + 1]))
+
+    def ending_at(self, pos):
+        """Every palindrome ending at position pos, longest first."""
+        found = []
+        node = self.suffix[pos]
+        while self.length[node] > 0:
+            found.append(self.node_string(node))
+            node = self.link[node]
+        return found
+
+    def palindromes(self):
+        """{palindrome: occurrences} for every distinct palindrome."""
+        totals = self.occurrences()
+        return {self.node_string(node): totals[node] for node in range(2, len(self.length))}
+
+    def longest(self):
+        """The longest palindrome, leftmost on ties like longestPalindrome."""
+        if self.distinct() == 0:
+            return ""
+        # nodes are created at their first occurrence, so the lowest-numbered is leftmost
+        best = max(range(2, len(self.length)), key=lambda node: (self.length[node], -node))
+        return self.node_string(best)
+
+
+# ---------------------------------- #
+#  Benchmark mode
+# ---------------------------------- #
+def benchmark(sizes=(15, 1000, 10000, 100000, 1000000), out=print):
+    """Eertree construction vs longestPalindrome on the worst-case "a" * n from Part 5."""
+    out(f"{'n':>9} {'manacher':>10} {'eertree':>10} {'distinct':>9}")
+    for n in sizes:
+        s = "a" * n
+        start = time.perf_counter()
+        expected = longestPalindrome(s)
+        manacher_time = time.perf_counter() - start
+        start = time.perf_counter()
+        tree = Eertree(s)
+        tree_time = time.perf_counter() - start
+        if tree.distinct() != n or len(expected) != n:
+            raise AssertionError(f"wrong result for 'a' * {n}")
+        out(f"{n:>9} {manacher_time:>9.4f}s {tree_time:>9.4f}s {tree.distinct():>9}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Palindromic tree (eertree)")
+    parser.add_argument("text", nargs="?")
+    parser.add_argument("--bench", action="store_true", help="time against Manacher on 'a' * n")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        benchmark()
+    elif args.text is not None:
+        tree = Eertree(args.text)
+        print(f"{tree.distinct()} distinct palindromes, longest {tree.longest()!r}")
+        for palindrome, count in sorted(tree.palindromes().items(), key=lambda kv: (-len(kv[0]), kv[0])):
+            print(f"  {count:>5}  {palindrome}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""
+Longest-palindromic-substring algorithms behind one registry, each counting
+its own basic operations, so the figures in the video come from real runs.
+
+    naive      every substring, checked from both ends          O(n^3)
+    expand     expand around each of the 2n - 1 centers         O(n^2)
+    manacher   expand, but start from the mirror's radius       O(n)
+    hash       binary search on the length per parity, with
+               rolling hashes to test a length in O(n)          O(n log n)
+    suffix     suffix array + LCP + sparse table, so each
+               center's radius is one O(1) longest-common-
+               extension query between s and reversed s         O(n log^2 n)
+
+Every algorithm returns (start, length, ops): the leftmost longest palindrome
+and how many of its basic steps it took (character comparisons for the
+first three, hash checks, sort keys plus LCE queries). New ones are added
+with @register and show up in the benchmark automatically.
+
+    operation_counts("a" * 50)     # {'naive': 10725, 'expand': 1225, 'manacher': 49}
+
+Those three are spoken as literals in the Part 1 narration of video.py
+(PART1_COUNTS); --check fails if the algorithms no longer produce them.
+
+Usage:
+    python lps_algorithms.py abacdfgdcaba
+    python lps_algorithms.py --bench --algorithms expand manacher hash --sizes 100 1000
+    python lps_algorithms.py --check
+"""
+import argparse
+import os
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from manacher_stream import manacher_scan
+
+Algorithm = namedtuple("Algorithm", "name label complexity unit func limit")
+Result = namedtuple("Result", "algorithm family n start length ops seconds")
+
+ALGORITHMS = {}
+
+# What the Part 1 narration in video.py says for "a" * 50
+PART1_TEXT = "a" * 50
+PART1_COUNTS = {"naive": 10725, "expand": 1225, "manacher": 49}
+
+
+def register(name, label, complexity, unit, limit=None):
+    """Adds an algorithm; `limit` caps the n the benchmark gives it."""
+    def decorator(func):
+        ALGORITHMS[name] = Algorithm(name, label, complexity, unit, func, limit)
+        return func
+    return decorator
+
+
+def _better(length, start, best_length, best_start):
+    return length > best_length or (length == best_length and start < best_start)
+
+
+# ---------------------------------- #
+#  Algorithms
+# ---------------------------------- #
+@register("naive", "Obvious Solution", "O(n^3)", "character checks", limit=400)
+def naive(s):
+    n = len(s)
+    ops = 0
+    best_start, best_len = 0, min(n, 1)
+    for i in range(n):
+        for j in range(i + 1, n + 1):
+            lo, hi = i, j - 1
+            while lo < hi:
+                ops += 1
+                if s[lo] != s[hi]:
+                    break
+                lo += 1
+                hi -= 1
+            else:
+                if j - i > best_len:
+                    best_start, best_len = i, j - i
+    return best_start, best_len, ops
+
+
+@register("expand", "Expand by letter", "O(n^2)", "character checks", limit=20000)
+def expand(s):
+    n = len(s)
+    ops = 0
+    best_start, best_len = 0, min(n, 1)
+    for c in range(2 * n - 1):
+        if c % 2 == 0:          # on a letter
+            lo, hi = c // 2 - 1, c // 2 + 1
+        else:                   # between two letters
+            lo, hi = c // 2, c // 2 + 1
+        while lo >= 0 and hi < n:
+            ops += 1
+            if s[lo] != s[hi]:
+                break
+            lo -= 1
+            hi += 1
+        if _better(hi - lo - 1, lo + 1, best_len, best_start):
+            best_start, best_len = lo + 1, hi - lo - 1
+    return best_start, best_len, ops
+
+
+@register("manacher", "Manacher's Algorithm", "O(n)", "character checks")
+def manacher(s):
+    # the shared loop, T's separators implied by parity
+    return manacher_scan(s, count=True)
+
+
+HASH_MOD = (1 << 61) - 1
+HASH_BASE = 1_000_003
+
+
+@register("hash", "Rolling hash + binary search", "O(n log n)", "hash checks")
+def rolling_hash(s):
+    n = len(s)
+    if n == 0:
+        return 0, 0, 0
+    codes = [ord(c) for c in s]
+    power, forward, backward = [1] * (n + 1), [0] * (n + 1), [0] * (n + 1)
+    for k in range(n):
+        power[k + 1] = power[k] * HASH_BASE % HASH_MOD
+        forward[k + 1] = (forward[k] * HASH_BASE + codes[k]) % HASH_MOD
+        backward[k + 1] = (backward[k] * HASH_BASE + codes[n - 1 - k]) % HASH_MOD
+    ops = 0
+
+    def leftmost(length):
+        """Start of the leftmost palindrome of exactly this length, or -1."""
+        nonlocal ops
+        if length > n:
+            return -1
+        scale = power[length]
+        for i in range(n - length + 1):
+            ops += 1
+            j = n - i - length          # s[i:i + length] reversed is reversed_s[j:j + length]
+            if (forward[i + length] - forward[i] * scale) % HASH_MOD == \
+                    (backward[j + length] - backward[j] * scale) % HASH_MOD:
+                return i
+        return -1
+
+    best_start, best_len = 0, 1
+    for first in (1, 2):                # odd lengths 1 + 2k, then even lengths 2 + 2k
+        start = leftmost(first)
+        if start < 0:
+            continue
+        found = (start, first)
+        lo, hi = 0, (n - first) // 2    # a palindrome of length L holds one of L - 2, so k is monotone
+        while lo < hi:
+            k = (lo + hi + 1) // 2
+            start = leftmost(first + 2 * k)
+            if start >= 0:
+                lo, found = k, (start, first + 2 * k)
+            else:
+                hi = k - 1
+        if _better(found[1], found[0], best_len, best_start):
+            best_start, best_len = found
+    return best_start, best_len, ops
+
+
+@register("suffix", "Suffix array + LCE", "O(n log^2 n)", "sort keys + LCE queries")
+def suffix_lce(s):
+    n = len(s)
+    if n == 0:
+        return 0, 0, 0
+    # s, a separator, reversed s; ranks are small ints, -1 is past the end
+    text = [ord(c) + 1 for c in s] + [0] + [ord(c) + 1 for c in reversed(s)]
+    size = len(text)
+    rank = text[:]
+    order = list(range(size))
+    ops = 0
+    step = 1
+    while True:
+        key = [(rank[i], rank[i + step] if i + step < size else -1) for i in range(size)]
+        order.sort(key=key.__getitem__)
+        ops += size
+        rank = [0] * size
+        for a, b in zip(order, order[1:]):
+            rank[b] = rank[a] + (key[a] != key[b])
+        if rank[order[-1]] == size - 1:
+            break
+        step *= 2
+
+    # Kasai: lcp[r] = common prefix of the suffixes at order[r - 1] and order[r]
+    lcp = [0] * size
+    h = 0
+    for i in range(size):
+        if rank[i]:
+            j = order[rank[i] - 1]
+            while i + h < size and j + h < size and text[i + h] == text[j + h]:
+                h += 1
+            lcp[rank[i]] = h
+            h = max(h - 1, 0)
+        else:
+            h = 0
+    table = [lcp]
+    while 1 << len(table) <= size:
+        prev, half = table[-1], 1 << (len(table) - 1)
+        table.append([min(prev[k], prev[k + half]) for k in range(size - 2 * half + 1)])
+
+    def lce(a, b):
+        nonlocal ops
+        ops += 1
+        a, b = sorted((rank[a], rank[b]))
+        level = (b - a).bit_length() - 1
+        return min(table[level][a + 1], table[level][b - (1 << level) + 1])
+
+    best_start, best_len = 0, 1
+    for k in range(n):
+        # odd, centered on s[k]: s[k:] against reversed s from s[k] backwards
+        e = lce(k, n + 1 + (n - 1 - k))
+        if _better(2 * e - 1, k - e + 1, best_len, best_start):
+            best_start, best_len = k - e + 1, 2 * e - 1
+        # even, between s[k - 1] and s[k]
+        if k:
+            e = lce(k, n + 1 + (n - k))
+            if _better(2 * e, k - e, best_len, best_start):
+                best_start, best_len = k - e, 2 * e
+    return best_start, best_len, ops
+
+
+# ---------------------------------- #
+#  Running
+# ---------------------------------- #
+def run(name, s, family=""):
+    start = time.perf_counter()
+    begin, length, ops = ALGORITHMS[name].func(s)
+    return Result(name, family, len(s), begin, length, ops, time.perf_counter() - start)
+
+
+def operation_counts(s, names=("naive", "expand", "manacher")):
+    """{algorithm: ops} for one input, e.g. the Part 1 bullet figures."""
+    return {name: run(name, s).ops for name in names}
+
+
+def check_part1_counts():
+    """Raises if operation_counts(PART1_TEXT) no longer matches the narrated PART1_COUNTS."""
+    ops = operation_counts(PART1_TEXT, tuple(PART1_COUNTS))
+    if ops != PART1_COUNTS:
+        raise AssertionError(f"update the Part 1 narration in video.py: counts are now {ops}")
+
+
+def _fibonacci_word(n):
+    a, b = "a", "ab"
+    while len(b) < n:
+        a, b = b, b + a
+    return b[:n]
+
+
+FAMILIES = {
+    "all-a": lambda n, rng: "a" * n,
+    "binary": lambda n, rng: "".join(rng.choices("ab", k=n)),
+    "letters": lambda n, rng: "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=n)),
+    "periodic": lambda n, rng: ("abcba" * (n // 5 + 1))[:n],
+    "fibonacci": lambda n, rng: _fibonacci_word(n),
+}
+
+
+def _bench_task(name, family, n, seed):
+    return run(name, FAMILIES[family](n, random.Random(seed)), family)
+
+
+def benchmark(names=None, families=None, sizes=(50, 500, 2000), workers=None, seed=0):
+    """Every (algorithm, family, n) combination on a process pool; lengths are cross-checked."""
+    names = names or list(ALGORITHMS)
+    families = families or list(FAMILIES)
+    tasks = [(name, family, n, seed) for family in families for n in sizes for name in names
+             if ALGORITHMS[name].limit is None or n <= ALGORITHMS[name].limit]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        results = list(pool.map(_bench_task, *zip(*tasks)))
+    for family in families:
+        for n in sizes:
+            lengths = {r.length for r in results if r.family == family and r.n == n}
+            if len(lengths) > 1:
+                raise AssertionError(f"algorithms disagree on {family} n={n}: {sorted(lengths)}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Longest palindromic substring algorithms")
+    parser.add_argument("text", nargs="?")
+    parser.add_argument("--bench", action="store_true")
+    parser.add_argument("--check", action="store_true", help="check the counts the Part 1 narration quotes")
+    parser.add_argument("--algorithms", nargs="+", choices=sorted(ALGORITHMS))
+    parser.add_argument("--families", nargs="+", choices=sorted(FAMILIES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[50, 500, 2000])
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args(argv)
+
+    if args.check:
+        check_part1_counts()
+        print(f"Part 1 counts match: {PART1_COUNTS}")
+    elif args.bench:
+        print(f"{'family':<10} {'n':>6} {'algorithm':<9} {'ops':>12} {'seconds':>9}  unit")
+        for r in benchmark(args.algorithms, args.families, args.sizes, args.workers):
+            print(f"{r.family:<10} {r.n:>6} {r.algorithm:<9} {r.ops:>12,} {r.seconds:>9.4f}  "
+                  f"{ALGORITHMS[r.algorithm].unit}")
+    elif args.text is not None:
+        for name in args.algorithms or ALGORITHMS:
+            r = run(name, args.text)
+            print(f"{name:<9} {args.text[r.start:r.start + r.length]!r:<20} {r.ops:>8,} {ALGORITHMS[name].unit}")
+
+
+if __name__ == "__main__":
+    main()
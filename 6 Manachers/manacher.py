@@ -0,0 +1,40 @@
+"""
+Manacher's algorithm, as shown on screen in LPSPart4PythonCode.
+
+The listing in the video is built straight from `longestPalindrome`
+(see code_listing.py), so whatever is written here is exactly what
+the viewer reads - edit the function and the video follows.
+"""
+
+
+def longestPalindrome(s: str) -> str:
+    # 1. Transform the string with delimiters
+    T = '|' + '|'.join(s) + '|'
+    n = len(T)
+    p = [0]*n  # p[i] = radius of palindrome around center i in T
+    center = 0
+    right = 0
+
+    # 2. Main loop
+    for i in range(n):
+        mirror = 2*center - i
+        if i < right:
+            p[i] = min(right - i, p[mirror])
+
+        # Expand around i
+        while (i - p[i] - 1 >= 0 and i + p[i] + 1 < n
+               and T[i - p[i] - 1] == T[i + p[i] + 1]):
+            p[i] += 1
+
+        # Update center and right if expanded past right
+        if i + p[i] > right:
+            center = i
+            right = i + p[i]
+
+    # 3. Find max palindrome
+    max_len = max(p)
+    max_center = p.index(max_len)
+
+    # 4. Convert back to original indices
+    start = (max_center - max_len)//2
+    return s[start : start + max_len]
@@ -0,0 +1,154 @@
+"""
+Longest palindromes of many short strings in one call (log lines,
+identifiers, ...), instead of one longestPalindrome(s) call per string.
+
+    starts, lengths = longest_palindromes(["abacdfgdcaba", "cbbd", ...])
+    starts, lengths = longest_palindromes_packed(buffer, offsets, workers=8)
+
+What the per-string version pays every call and this pays once per batch:
+building T with '|'.join, allocating the p list, and slicing the answer out
+of s. Here each string is scanned in place by manacher_stream's
+manacher_scan (a packed buffer is indexed at base + k, never sliced), every
+scan reuses one int32 scratch array sized
+for the longest string, and the result is two int32 arrays, not substrings.
+With workers > 1 the batch is cut into chunks for a process pool.
+
+Packed form: all strings back to back in one bytes-like buffer, and
+offsets[k]:offsets[k + 1] the k-th string (len(offsets) == count + 1).
+
+Usage:
+    python manacher_batch.py --bench --count 200000 --workers 8
+"""
+import argparse
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from manacher import longestPalindrome
+from manacher_stream import manacher_scan
+
+CHUNK = 20000   # strings per pool task
+
+
+def _scratch(longest):
+    return array("i", bytes(4 * (2 * longest + 1)))
+
+
+def _spans_of_list(strings):
+    starts = array("i", bytes(4 * len(strings)))
+    lengths = array("i", bytes(4 * len(strings)))
+    p = _scratch(max(map(len, strings), default=0))
+    for k, s in enumerate(strings):
+        starts[k], lengths[k], _ = manacher_scan(s, 0, len(s), p)
+    return starts, lengths
+
+
+def _spans_of_packed(buffer, offsets):
+    count = len(offsets) - 1
+    starts = array("i", bytes(4 * count))
+    lengths = array("i", bytes(4 * count))
+    offsets = np.asarray(offsets, dtype=np.int64)
+    p = _scratch(int(np.diff(offsets).max(initial=0)))
+    bounds = offsets.tolist()       # plain ints index the buffer faster than NumPy scalars
+    for k in range(count):
+        starts[k], lengths[k], _ = manacher_scan(buffer, bounds[k], bounds[k + 1] - bounds[k], p)
+    return starts, lengths
+
+
+def _as_arrays(parts):
+    starts = np.concatenate([np.frombuffer(s, dtype=np.int32) for s, _ in parts] or [np.zeros(0, np.int32)])
+    lengths = np.concatenate([np.frombuffer(l, dtype=np.int32) for _, l in parts] or [np.zeros(0, np.int32)])
+    return starts, lengths
+
+
+def longest_palindromes(strings, workers=1, chunk_size=CHUNK):
+    """
+    (starts, lengths) int32 arrays for a list or NumPy array of str or
+    bytes: strings[k][starts[k]:starts[k] + lengths[k]] is the leftmost
+    longest palindrome of strings[k].
+    """
+    if isinstance(strings, np.ndarray):
+        strings = strings.tolist()
+    if workers <= 1 or len(strings) <= chunk_size:
+        return _as_arrays([_spans_of_list(strings)])
+    chunks = [strings[k:k + chunk_size] for k in range(0, len(strings), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _as_arrays(list(pool.map(_spans_of_list, chunks)))
+
+
+def longest_palindromes_packed(buffer, offsets, workers=1, chunk_size=CHUNK):
+    """(starts, lengths) for strings packed in one buffer; starts are relative to each string."""
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if workers <= 1 or len(offsets) - 1 <= chunk_size:
+        return _as_arrays([_spans_of_packed(buffer, offsets)])
+    tasks = []
+    for k in range(0, len(offsets) - 1, chunk_size):
+        cut = offsets[k:k + chunk_size + 1]
+        tasks.append((bytes(buffer[cut[0]:cut[-1]]), cut - cut[0]))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _as_arrays(list(pool.map(_spans_of_packed, *zip(*tasks))))
+
+
+def pack(strings, encoding="latin-1"):
+    """(bytes buffer, offsets) for a list of str or bytes, one byte per character."""
+    encoded = [s if isinstance(s, bytes) else s.encode(encoding) for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(s) for s in encoded], out=offsets[1:])
+    return b"".join(encoded), offsets
+
+
+# ---------------------------------- #
+#  Benchmark mode
+# ---------------------------------- #
+def random_strings(count, min_len=8, max_len=64, alphabet="abcde", seed=0):
+    rng = random.Random(seed)
+    return ["".join(rng.choices(alphabet, k=rng.randint(min_len, max_len))) for _ in range(count)]
+
+
+def benchmark(count=100000, workers=None, out=print):
+    """Per-string loop vs batch (1 process, packed, pool), checked against each other."""
+    workers = workers or os.cpu_count() or 1
+    strings = random_strings(count)
+    buffer, offsets = pack(strings)
+    runs = [
+        ("longestPalindrome loop", lambda: [longestPalindrome(s) for s in strings]),
+        ("batch, list", lambda: longest_palindromes(strings)),
+        ("batch, packed", lambda: longest_palindromes_packed(buffer, offsets)),
+        (f"batch, packed, {workers} workers", lambda: longest_palindromes_packed(buffer, offsets, workers)),
+    ]
+    results = {}
+    for name, run in runs:
+        start = time.perf_counter()
+        results[name] = run()
+        seconds = time.perf_counter() - start
+        out(f"{name:<32} {seconds:8.3f}s  {count / seconds / 1e3:8.1f}k strings/s")
+
+    expected = results["longestPalindrome loop"]
+    for name, (starts, lengths) in list(results.items())[1:]:
+        got = [s[a:a + b] for s, a, b in zip(strings, starts.tolist(), lengths.tolist())]
+        if got != expected:
+            raise AssertionError(f"{name} disagrees with longestPalindrome")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch longest-palindrome API")
+    parser.add_argument("strings", nargs="*", help="print the longest palindrome of each")
+    parser.add_argument("--bench", action="store_true", help="compare against a longestPalindrome loop")
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--workers", type=int, help="pool size for the benchmark (default: all cores)")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        benchmark(args.count, args.workers)
+    else:
+        starts, lengths = longest_palindromes(args.strings)
+        for s, a, b in zip(args.strings, starts, lengths):
+            print(f"{s}: {s[a:a + b]}")
+
+
+if __name__ == "__main__":
+    main()
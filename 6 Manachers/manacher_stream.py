@@ -0,0 +1,174 @@
+"""
+Manacher's algorithm for inputs too big to copy: memory-mapped files,
+genomic FASTA, anything that indexes to byte values.
+
+It is the same loop as longestPalindrome in manacher.py (the on-screen
+version), with three changes:
+
+    - T = '|' + '|'.join(s) + '|' is never built. Position k of T is a
+      separator when k is even and s[(k - 1) // 2] when k is odd, and the
+      expansion compares the two s characters directly, two T steps at a time.
+    - p is a compact int32 array('i'), not a list of Python ints.
+    - p is a ring buffer of `window` entries. Manacher only reads p[mirror]
+      for mirrors inside the current rightmost palindrome, and the best
+      palindrome is tracked as the loop goes, so older entries are never
+      needed again. If a palindrome is longer than the window, the mirror
+      value is gone and i just expands from scratch: the answer is still exact,
+      only that stretch loses the linear-time guarantee.
+
+The loop itself is manacher_scan, which the batch API, the palindrome
+index and the algorithm comparison import rather than copy.
+
+Memory is therefore 4 * window bytes plus whatever pages of the file the OS
+keeps mapped, however large the input. The loop itself is plain Python, at
+roughly a microsecond per character.
+
+Usage:
+    python manacher_stream.py chr21.fa --fasta
+    python manacher_stream.py big.txt --window 4194304
+"""
+import argparse
+import mmap
+import sys
+import tempfile
+import time
+from array import array
+from contextlib import contextmanager
+
+WINDOW = 1 << 22    # p entries kept (16 MB); palindromes up to ~2M chars stay linear
+
+
+def manacher_scan(s, base=0, n=None, p=None, mask=-1, count=False):
+    """
+    The loop every fast variant here shares (manacher_batch, palindrome_index,
+    lps_algorithms): Manacher over s[base:base + n] without building T or
+    slicing s. Returns (start, length, ops) of the leftmost longest
+    palindrome, start relative to base; ops is the number of character
+    comparisons, counted only with count=True (else 0).
+
+    p receives T's radii, entry i at p[i & mask]: with mask=-1 it needs
+    2n + 1 entries (a scratch array can be reused across calls); with a
+    power-of-two ring, mask = size - 1, and mirrors that fell out of the
+    ring expand from scratch.
+    """
+    if n is None:
+        n = len(s) - base
+    if p is None:
+        p = array("i", bytes(4 * (2 * n + 1)))
+    end = base + n
+    center = right = best_len = best_center = ops = 0
+
+    for i in range(2 * n + 1):
+        r = i & 1      # a character center is a palindrome of length 1 on its own
+        if i < right:
+            mirror = 2 * center - i
+            if mask < 0 or i - mirror <= mask:      # still in the ring buffer
+                r = min(right - i, p[mirror & mask])
+
+        # Expand: s indices just outside the current palindrome
+        start_r = r
+        lo = base + (i - r) // 2 - 1
+        hi = base + (i + r) // 2
+        while lo >= base and hi < end and s[lo] == s[hi]:
+            lo -= 1
+            hi += 1
+        r = hi - lo - 1
+        p[i & mask] = r
+        if count:
+            # every match grows r by 2; a mismatch inside the string is one more check
+            ops += (r - start_r) // 2 + (lo >= base and hi < end)
+
+        if i + r > right:
+            center, right = i, i + r
+        if r > best_len:
+            best_len, best_center = r, i
+
+    return (best_center - best_len) // 2, best_len, ops
+
+
+def longest_palindrome_span(s, window=WINDOW):
+    """
+    (start, length) of the longest palindromic substring of `s`, which can
+    be bytes, a bytearray, an mmap, or anything else indexing to ints.
+    Leftmost on ties, like longestPalindrome.
+    """
+    n = len(s)
+    if n == 0:
+        return 0, 0
+    size = 1 << max(window - 1, 1).bit_length()     # power of two, so k & mask is k % size
+    start, length, _ = manacher_scan(s, 0, n, array("i", bytes(4 * size)), mask=size - 1)
+    return start, length
+
+
+@contextmanager
+def map_file(path):
+    """
+    Read-only mmap of a whole file (an empty bytes object for empty files).
+    Use it in a with block; the mapping and the file are closed on exit.
+    """
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def longest_palindrome_in_file(path, window=WINDOW):
+    """(start, length, bytes of the palindrome) for a file, read through mmap."""
+    with map_file(path) as data:
+        start, length = longest_palindrome_span(data, window)
+        return start, length, bytes(data[start:start + length])
+
+
+def fasta_records(path, chunk_size=1 << 24):
+    """
+    Yields (name, mmap of the sequence) per FASTA record. Line breaks are
+    stripped into an unnamed temporary file chunk by chunk, so only one
+    chunk is ever in memory. Each sequence is closed when the next record
+    is requested, so copy out anything needed past that.
+    """
+    with map_file(path) as data:
+        pos = 0
+        while pos < len(data):
+            header_end = data.find(b"\n", pos)
+            if header_end < 0:
+                header_end = len(data)
+            name = bytes(data[pos + 1:header_end]).decode(errors="replace").strip()
+            next_header = data.find(b"\n>", header_end)
+            end = len(data) if next_header < 0 else next_header + 1
+
+            with tempfile.TemporaryFile() as sequence:
+                for chunk_start in range(header_end + 1, end, chunk_size):
+                    chunk = data[chunk_start:min(chunk_start + chunk_size, end)]
+                    sequence.write(chunk.replace(b"\n", b"").replace(b"\r", b""))
+                sequence.flush()
+                if sequence.tell():
+                    with mmap.mmap(sequence.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        yield name, mapped
+                else:
+                    yield name, b""
+            pos = end
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Longest palindrome of a file with bounded memory")
+    parser.add_argument("path")
+    parser.add_argument("--fasta", action="store_true", help="one result per FASTA record, line breaks ignored")
+    parser.add_argument("--window", type=int, default=WINDOW, help="p entries kept in memory")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    if args.fasta:
+        for name, sequence in fasta_records(args.path):
+            start, length = longest_palindrome_span(sequence, args.window)
+            text = bytes(sequence[start:start + min(length, 80)]).decode(errors="replace")
+            print(f"{name}: {len(sequence)} bp, longest palindrome {length} at {start}: {text}")
+    else:
+        start, length, found = longest_palindrome_in_file(args.path, args.window)
+        print(f"longest palindrome: {length} bytes at {start}: {found[:80].decode(errors='replace')}")
+    print(f"{time.perf_counter() - start_time:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+"Is s[i:j] a palindrome?" in O(1), from one Manacher pass.
+
+Manacher's p (the same p as in longestPalindrome, in characters of s)
+gives, for every center of T = '|' + '|'.join(s) + '|', the length of the
+longest palindrome around it. s[i:j] sits in T centered at i + j, so
+
+    s[i:j] is a palindrome  <=>  p[i + j] >= j - i
+
+which is one array lookup. With p as a NumPy array, any number of (i, j)
+pairs are answered in one vectorized expression, so the whole substring
+grid of an n-letter word (the Part 2 table, or n in the thousands) costs
+O(n^2) array work instead of O(n^3) character checks.
+
+    index = PalindromeIndex("babcd")
+    index.is_palindrome(0, 3)        # "bab" -> True
+    index.grid()                     # grid[i, L - 1]: is s[i:i + L] a palindrome
+    index.spans()                    # [(0, 1), (1, 2), ..., (0, 3)], shortest first
+"""
+from array import array
+
+import numpy as np
+
+from manacher_stream import manacher_scan
+
+
+def radii(s):
+    """Manacher's p for s as an int32 array of 2n + 1 entries, without building T."""
+    p = array("i", bytes(4 * (2 * len(s) + 1)))
+    manacher_scan(s, 0, len(s), p)
+    return np.frombuffer(p, dtype=np.int32)
+
+
+class PalindromeIndex:
+    def __init__(self, s):
+        self.s = s
+        self.n = len(s)
+        self.p = radii(s)
+
+    def is_palindrome(self, i, j):
+        """True if s[i:j] is a palindrome (empty ranges count)."""
+        if not 0 <= i <= j <= self.n:
+            raise IndexError(f"[{i}:{j}] is outside a string of length {self.n}")
+        return i == j or int(self.p[i + j]) >= j - i
+
+    def query(self, starts, ends):
+        """Vectorized is_palindrome over arrays of starts and ends (any matching shapes)."""
+        starts, ends = np.asarray(starts), np.asarray(ends)
+        if np.any((starts < 0) | (starts > ends) | (ends > self.n)):
+            raise IndexError(f"a range is outside a string of length {self.n}")
+        return self.p[starts + ends] >= ends - starts
+
+    def grid(self):
+        """
+        n x n bool array: grid[i, L - 1] says whether s[i:i + L] is a
+        palindrome; False where i + L runs past the end. Laid out like the
+        Part 2 table (row = start letter, column = length).
+        """
+        starts = np.arange(self.n)[:, None]
+        ends = starts + np.arange(1, self.n + 1)[None, :]
+        valid = ends <= self.n
+        found = np.zeros((self.n, self.n), dtype=bool)
+        found[valid] = self.query(np.broadcast_to(starts, ends.shape)[valid], ends[valid])
+        return found
+
+    def spans(self):
+        """Every palindromic (i, j) with s[i:j] non-empty, shortest first, then by start."""
+        rows, cols = np.nonzero(self.grid())
+        order = np.lexsort((rows, cols))
+        return [(int(i), int(i + L + 1)) for i, L in zip(rows[order], cols[order])]
+
+    def count(self):
+        """Number of non-empty palindromic substrings (with repeats), straight from p."""
+        return int(((self.p + 1) // 2).sum())
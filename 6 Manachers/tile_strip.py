@@ -0,0 +1,142 @@
+from manim import *
+
+import math
+
+# -------- Strip Defaults -------- #
+TILE_SPACING = 1.0      # distance between tile centers, as in tile.move_to(RIGHT * i)
+TILE_MARGIN = 2         # tiles kept past each edge of the view, so panning never shows a gap
+
+
+# ---------------------------------- #
+#  Helper: a row of tiles, only the visible part built
+# ---------------------------------- #
+class TileStrip(VGroup):
+    """
+    A row of tiles for `text`, like the scenes build by hand:
+
+        tile.move_to(RIGHT * i)
+        tiles.shift(center + LEFT * (len(text) - 1) * 0.5)
+
+    but only the tiles inside the camera's view (plus TILE_MARGIN on each
+    side) exist as mobjects. When the view moves, tiles that leave it are
+    taken out of the group and kept per letter, and the next tile that
+    comes into view with the same letter reuses one instead of building a
+    new Text. A 10,000-letter string costs as many tiles as fit on screen.
+
+        strip = TileStrip(text, create_tile, tile_width=0.9, frame=self.camera.frame)
+        self.play(Write(strip))
+        strip.follow(self.camera.frame)     # from now on it tracks the camera
+        self.play(self.camera.frame.animate.set_x(strip.position(5000)[0]))
+
+    Index i always sits at start + RIGHT * i * spacing, visible or not, so
+    position / index_at / box work for the whole string. Shifting the strip
+    is fine (start is re-read from a live tile), but a recycled tile keeps
+    any color given to it, so restyle tiles through tile(i) each time.
+    """
+
+    def __init__(
+        self,
+        text,
+        make_tile,
+        spacing=TILE_SPACING,
+        center=ORIGIN,
+        start=None,
+        frame=None,
+        margin=TILE_MARGIN,
+        **tile_kwargs
+    ):
+        super().__init__()
+        self.text = text
+        self.make_tile = make_tile
+        self.tile_kwargs = tile_kwargs
+        self.spacing = spacing
+        self.margin = margin
+        if start is None:
+            # the whole string centered on `center`, as the hand-built strips are
+            start = np.array(center, dtype=float) + LEFT * (len(text) - 1) * spacing / 2
+        self.start = np.array(start, dtype=float)    # center of tile 0
+        self.live = {}          # index -> tile currently in the group
+        self.spare = {}         # letter -> tiles waiting to be reused
+        self.created = 0        # tile mobjects ever built
+        self.show_range(*self.visible_range(frame))
+
+    # Index <-> position ----------------------------------------------- #
+    def position(self, i):
+        """Center of tile i, whether or not it is built."""
+        return self.start + RIGHT * i * self.spacing
+
+    def index_at(self, x):
+        """Index of the tile nearest to x (may be outside the string)."""
+        return round((x - self.start[0]) / self.spacing)
+
+    def box(self, lo, hi):
+        """Invisible rectangle over tiles lo..hi-1, for braces and highlights off screen."""
+        width = (hi - lo - 1) * self.spacing + self.tile_kwargs.get("tile_width", 1.0)
+        height = self.tile_kwargs.get("tile_height", 1.0)
+        rect = Rectangle(width=width, height=height, stroke_opacity=0, fill_opacity=0)
+        return rect.move_to((self.position(lo) + self.position(hi - 1)) / 2)
+
+    # Tiles -------------------------------------------------------------- #
+    def tile(self, i):
+        """Tile i, built (or recycled) on demand if it is outside the view."""
+        if i not in self.live:
+            self._place(i)
+        return self.live[i]
+
+    def tiles(self, lo, hi):
+        """VGroup of tiles lo..hi-1, e.g. for a Brace."""
+        return VGroup(*(self.tile(i) for i in range(lo, hi)))
+
+    def _place(self, i):
+        letter = self.text[i]
+        pool = self.spare.get(letter)
+        if pool:
+            tile = pool.pop()
+        else:
+            tile = self.make_tile(letter, **self.tile_kwargs)
+            self.created += 1
+        tile.move_to(self.position(i))
+        self.live[i] = tile
+        self.add(tile)
+
+    def show_range(self, lo, hi):
+        """Makes exactly tiles lo..hi-1 live, recycling the rest."""
+        for i in [i for i in self.live if not lo <= i < hi]:
+            tile = self.live.pop(i)
+            self.remove(tile)
+            self.spare.setdefault(self.text[i], []).append(tile)
+        for i in range(lo, hi):
+            if i not in self.live:
+                self._place(i)
+        return self
+
+    # Following the camera ----------------------------------------------- #
+    def visible_range(self, frame=None):
+        """(lo, hi) of the tiles under `frame` (the default frame if None), with the margin."""
+        if frame is None:
+            center_x, width = 0.0, config.frame_width
+        else:
+            center_x, width = frame.get_center()[0], frame.width
+        lo = math.floor((center_x - width / 2 - self.start[0]) / self.spacing) - self.margin
+        hi = math.ceil((center_x + width / 2 - self.start[0]) / self.spacing) + self.margin + 1
+        return max(lo, 0), min(hi, len(self.text))
+
+    def sync(self, frame):
+        """Re-reads start (in case the strip moved) and matches the tiles to the view."""
+        if self.live:
+            i, tile = next(iter(self.live.items()))
+            self.start = tile.get_center() - RIGHT * i * self.spacing
+        return self.show_range(*self.visible_range(frame))
+
+    def follow(self, frame):
+        """
+        Keeps the strip in sync with a camera frame on every frame drawn.
+        Call it after any Write/FadeIn of the strip itself, since those
+        animations expect the group's tiles to stay the same.
+        """
+        self.add_updater(lambda strip: strip.sync(frame))
+        return self
+
+    def unfollow(self):
+        self.clear_updaters()
+        return self
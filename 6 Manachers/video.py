@@ -1,16 +1,37 @@
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
-from manim_voiceover.services.azure import AzureService
-from manim_voiceover.services.recorder import RecorderService
 
 # For mathematical operations if you need them (e.g., random, etc.)
 import numpy as np
+import ast
+
+from code_listing import CodeListing
+from manacher import longestPalindrome
+from palindrome_index import PalindromeIndex
+from lps_algorithms import operation_counts
+from tile_strip import TileStrip
 
 # -------- Configuration Flags -------- #
 INCLUDE_NARRATION = False      # Toggle to True/False for including voiceover
 FANCY_NARRATION = False        # If True, use AzureService or RecorderService
 NARRATOR_VOICE = "en-US-SteffanNeural"
+LONG_STRING_LENGTH = 10_000    # letters in the Part 6 panning demo
+PAN_TILES_PER_SECOND = 40      # how fast the Part 6 camera sweeps the string
+
+
+# ---------------------------------- #
+#  Helper: speech service (lazy import)
+# ---------------------------------- #
+def make_speech_service():
+    """Builds the narration backend: the recorder with FANCY_NARRATION, else gTTS."""
+    if FANCY_NARRATION:
+        # RecorderService for custom voice track, or switch to AzureService for TTS
+        from manim_voiceover.services.recorder import RecorderService
+        return RecorderService()
+        # from manim_voiceover.services.azure import AzureService
+        # return AzureService(voice=NARRATOR_VOICE)
+    from manim_voiceover.services.gtts import GTTSService
+    return GTTSService(lang="en", tld="com")
 
 
 # ----------------------------------------- #
@@ -125,15 +146,8 @@ class LPSPart1ProblemExplanation(VoiceoverScene):
         """
 
         # 1) Set up voiceover service
-        if FANCY_NARRATION:
-            # RecorderService for custom voice track, or switch to AzureService for TTS
-            service = RecorderService()
-            #service = AzureService(voice=NARRATOR_VOICE)
-        else:
-            service = GTTSService(lang="en", tld="com")
-
         if INCLUDE_NARRATION:
-            self.set_speech_service(service)
+            self.set_speech_service(make_speech_service())
 
         #
         # (A) FIVE-PART ROADMAP
@@ -395,11 +409,16 @@ class LPSPart1ProblemExplanation(VoiceoverScene):
         # Add a heading for the section
         complexity_heading = Text("Time Complexity Comparison for a 50 letter word", font_size=32, color=BLUE).to_edge(UP)
 
+        # Character checks each approach really makes on the worst case, "a" * 50.
+        # The narration below says them as literals so it can be recorded ahead;
+        # `python lps_algorithms.py --check` confirms they still match.
+        ops = operation_counts("a" * 50)
+
         # Define the bullet points with improved formatting
         bullet_points = VGroup(
-            Text("1. Obvious Solution: ~125,000 expansions", font_size=26, color=RED).scale(0.9),
-            Text("2. Expand by letter: ~2,500 expansions", font_size=26, color=ORANGE).scale(0.9),
-            Text("3. Manacher’s Algorithm: ~50 expansions", font_size=26, color=GREEN).scale(0.9)
+            Text(f"1. Obvious Solution: {ops['naive']:,} expansions", font_size=26, color=RED).scale(0.9),
+            Text(f"2. Expand by letter: {ops['expand']:,} expansions", font_size=26, color=ORANGE).scale(0.9),
+            Text(f"3. Manacher’s Algorithm: {ops['manacher']:,} expansions", font_size=26, color=GREEN).scale(0.9)
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.5).next_to(complexity_heading, DOWN, buff=1)
 
         # Fade in the heading first
@@ -412,9 +431,9 @@ class LPSPart1ProblemExplanation(VoiceoverScene):
 
         # Fade in bullet points one by one
         bullet_texts = [
-            "A naive O(n^3) solution might do around 125,000 expansions for a 50-character string.",
-            "An O(n^2) approach reduces the work significantly to about 2,500 expansions.",
-            "And finally Manacher’s Algorithm, which solves the problem with only 50 or so expansions."
+            "A naive O(n^3) solution does 10,725 expansions for a 50-character string.",
+            "An O(n^2) approach reduces the work significantly to 1,225 expansions.",
+            "And finally Manacher’s Algorithm, which solves the problem with only 49 expansions."
         ]
 
         for bullet, text in zip(bullet_points, bullet_texts):
@@ -482,14 +501,8 @@ class LPSPart2NaiveExpandSolutions(VoiceoverScene):
           5) Less visual clutter, more engaging, friendlier tone.
         """
         # 1) Set up voiceover service
-        if FANCY_NARRATION:
-            service = RecorderService()
-            #service = AzureService(voice=NARRATOR_VOICE)
-        else:
-            service = GTTSService(lang="en", tld="com")
-
         if INCLUDE_NARRATION:
-            self.set_speech_service(service)
+            self.set_speech_service(make_speech_service())
 
         #
         # (A) ROADMAP REVIEW
@@ -597,14 +610,13 @@ class LPSPart2NaiveExpandSolutions(VoiceoverScene):
         # Final fade out
         self.play(FadeOut(sliding_window, tiles, main_title))
 
-        # Substrings data in 3 columns
+        # Substrings table: row = start letter, column = length
+        n = len(sample_str)
         substrings_columns = [
-            ["b", "ba", "bab", "babc", "babcd"],
-            ["a", "ab", "abc", "abcd", ''],
-            ["b", "bc", "bcd", '', ''],
-            ["c", "cd", '', '', ''], 
-            ["d", '', '', '', '']
+            [sample_str[i:i + length] if i + length <= n else '' for length in range(1, n + 1)]
+            for i in range(n)
         ]
+        pal_index = PalindromeIndex(sample_str)
 
         # Create the table
         table = Table(
@@ -623,9 +635,8 @@ class LPSPart2NaiveExpandSolutions(VoiceoverScene):
         )
         self.wait(1)
 
-        # Highlight a cell (row 1, column 1)
-        palCells = [table.get_cell((1, 1)), table.get_cell((2, 1)), table.get_cell((4, 1)),
-                    table.get_cell((5, 1)), table.get_cell((3, 1)), table.get_cell((1, 3))]
+        # Every palindromic cell, shortest first, so the longest one ends up last
+        palCells = [table.get_cell((i + 1, j - i)) for i, j in pal_index.spans()]
         for cell in palCells:
             cell.set_stroke(width=0)
         # Add the table to the scene
@@ -809,14 +820,8 @@ class LPSPart3ManacherMirror(VoiceoverScene):
         """
 
         # 1) Voiceover configuration
-        if FANCY_NARRATION:
-            service = RecorderService()
-            # or: service = AzureService(voice=NARRATOR_VOICE)
-        else:
-            service = GTTSService(lang="en", tld="com")
-
         if INCLUDE_NARRATION:
-            self.set_speech_service(service)
+            self.set_speech_service(make_speech_service())
 
         #
         # (A) PART 3 TITLE
@@ -836,12 +841,7 @@ class LPSPart3ManacherMirror(VoiceoverScene):
         sample_str =  'aaaaaaaaaaa'
 
         # Scrabble tiles
-        tiles = VGroup()
-        for i, ch in enumerate(sample_str):
-            tile = create_tile(ch, tile_width=0.9)
-            tile.move_to(RIGHT * i)
-            tiles.add(tile)
-        tiles.shift(DOWN*0.5 + LEFT*(len(sample_str)-1)*0.5)
+        tiles = TileStrip(sample_str, create_tile, tile_width=0.9, center=DOWN*0.5)
 
         # Create the counter text
         counter = 0  # Initial value
@@ -927,13 +927,13 @@ class LPSPart3ManacherMirror(VoiceoverScene):
             return
 
         # 4) Highlight the center tile just for clarity
-        center_rect = SurroundingRectangle(tiles[center_index], color=GREEN, buff=0)
+        center_rect = SurroundingRectangle(tiles.tile(center_index), color=GREEN, buff=0)
         self.play(Create(center_rect))
         self.wait(0.5)
         
         # 5) Create curly braces under the “left half” and “right half” of this expansion
-        left_half  = tiles[left_start : center_index]    # indices [1..2]
-        right_half = tiles[center_index+1 : right_end+1] # indices [4..5]
+        left_half  = tiles.tiles(left_start, center_index)    # indices [1..2]
+        right_half = tiles.tiles(center_index+1, right_end+1) # indices [4..5]
 
         # Create the braces
         brace_left  = Brace(left_half, direction=UP, buff=0.2)
@@ -1073,14 +1073,8 @@ class LPSPart3ManacherMirror(VoiceoverScene):
 class LPSPart4PythonCode(VoiceoverScene):
     def construct(self):
         # 1) Voiceover service
-        if FANCY_NARRATION:
-            service = RecorderService()
-            # service = AzureService(voice=NARRATOR_VOICE)
-        else:
-            service = GTTSService(lang="en", tld="com")
-
         if INCLUDE_NARRATION:
-            self.set_speech_service(service)
+            self.set_speech_service(make_speech_service())
 
         # Title
         title_text = Text("Manacher’s Algorithm – Python Implementation", font_size=32).to_edge(UP)
@@ -1089,57 +1083,35 @@ class LPSPart4PythonCode(VoiceoverScene):
 
         self.wait(1)
 
-        # Present the code in chunks
-        code_lines = [
-            "def longestPalindrome(s: str) -> str:",
-            "    # 1. Transform the string with delimiters",
-            "    T = '|' + '|'.join(s) + '|'",
-            "    n = len(T)",
-            "    p = [0]*n  # p[i] = radius of palindrome around center i in T",
-            "    center = 0",
-            "    right = 0",
-            "",
-            "    # 2. Main loop",
-            "    for i in range(n):",
-            "        mirror = 2*center - i",
-            "        if i < right:",
-            "            p[i] = min(right - i, p[mirror])",
-            "",
-            "        # Expand around i",
-            "        while (i - p[i] - 1 >= 0 and i + p[i] + 1 < n",
-            "               and T[i - p[i] - 1] == T[i + p[i] + 1]):",
-            "            p[i] += 1",
-            "",
-            "        # Update center and right if expanded past right",
-            "        if i + p[i] > right:",
-            "            center = i",
-            "            right = i + p[i]",
-            "",
-            "    # 3. Find max palindrome",
-            "    max_len = max(p)",
-            "    max_center = p.index(max_len)",
-            "",
-            "    # 4. Convert back to original indices",
-            "    start = (max_center - max_len)//2",
-            "    return s[start : start + max_len]"
-        ]
-
-        # We'll display them line by line as we narrate
-        code_text_group = VGroup(*[CodeLine(line, font_size=20) for line in code_lines]).arrange(DOWN, aligned_edge=LEFT)
+        # Present the real function, highlighted and laid out in one pass
+        listing = CodeListing(longestPalindrome, font_size=20)
         code_box = Rectangle(width=10, height=8, color=WHITE).move_to(ORIGIN)
         code_box.set_opacity(0.1).scale(1.1)
 
         self.add(code_box)
-        self.add(code_text_group)
-        code_text_group.shift(UP*0.5)
+        self.add(listing)
+        listing.shift(UP*0.5)
 
         voiceover_or_play(self, None,
                           text="Let’s look at the essential steps inside this function.")
 
         self.wait(1)
 
-        # Animate highlighting different regions
-        highlight_rect = Rectangle(width=9, height=0.6, color=YELLOW).set_opacity(0.3)
+        # Highlight blocks straight from the function's AST
+        func = listing.nodes(ast.FunctionDef)[0]
+        loop = listing.nodes(ast.For)[0]
+        expand = listing.nodes(ast.While)[0]
+        before_loop = func.body[:func.body.index(loop)]
+        after_loop = func.body[func.body.index(loop) + 1:]
+        highlights = [
+            # up to the last statement before the loop, so "# 2. Main loop" belongs to the next bar
+            listing.highlight(listing.line_range(before_loop[0])[0], before_loop[-1].end_lineno),
+            listing.highlight(loop, header_only=True),
+            listing.highlight(loop.body[0].lineno, loop.body[1].end_lineno),
+            listing.highlight(expand),
+            listing.highlight(loop.body[-1]),
+            listing.highlight(listing.line_range(after_loop[0])[0], after_loop[-1].end_lineno),
+        ]
 
         # Transform steps
         step_descriptions = [
@@ -1150,12 +1122,12 @@ class LPSPart4PythonCode(VoiceoverScene):
             "Finally, we update center and right if our new palindrome extends beyond the old boundary.",
             "After finishing, we find the maximum palindrome length in p, convert back to the original string, and return it."
         ]
-        highlight_indices = [0, 7, 11, 14, 18, 24]
 
-        for i, desc in enumerate(step_descriptions):
-            # Move highlight rect to the line region
-            highlight_rect.move_to(code_text_group[highlight_indices[i]].get_center())
-            voiceover_or_play(self, Create(highlight_rect), text=desc)
+        highlight_rect = highlights[0]
+        voiceover_or_play(self, FadeIn(highlight_rect), text=step_descriptions[0])
+        self.wait(2)
+        for desc, rect in zip(step_descriptions[1:], highlights[1:]):
+            voiceover_or_play(self, Transform(highlight_rect, rect), text=desc)
             self.wait(2)
 
         # Wrap up
@@ -1170,14 +1142,8 @@ class LPSPart4PythonCode(VoiceoverScene):
 class LPSPart5PerformanceTest(VoiceoverScene):
     def construct(self):
         # 1) Voiceover service
-        if FANCY_NARRATION:
-            service = RecorderService()
-            # service = AzureService(voice=NARRATOR_VOICE)
-        else:
-            service = GTTSService(lang="en", tld="com")
-
         if INCLUDE_NARRATION:
-            self.set_speech_service(service)
+            self.set_speech_service(make_speech_service())
 
         # Title
         title_text = Text("Performance Demo on Worst-Case String", font_size=32).to_edge(UP)
@@ -1230,20 +1196,90 @@ class LPSPart5PerformanceTest(VoiceoverScene):
         self.wait(3)
 
 
-# ------------------------
-#   Utility: CodeLine
-# ------------------------
-# A helper class to display code lines nicely. 
-# (This is optional; you can also just use Text.)
-class CodeLine(Text):
-    CONFIG = {
-        "t2c": {
-            # You can add syntax highlighting here if you want, e.g.:
-            # "def": BLUE,
-            # "return": GREEN,
-        },
-        "font": "Consolas"
-    }
-
-    def __init__(self, text, **kwargs):
-        Text.__init__(self, text, **kwargs)
\ No newline at end of file
+# ---------------------------------- #
+#   PART 6: Manacher on a Long String
+# ---------------------------------- #
+def long_sample(n, seed=7):
+    """Random a/b letters with one long palindrome planted two thirds of the way in."""
+    rng = np.random.default_rng(seed)
+    letters = list(rng.choice(["a", "b"], size=n))
+    half = "".join(rng.choice(["a", "b"], size=min(30, n // 4)))
+    planted = half + "c" + half[::-1]
+    at = max(n * 2 // 3 - len(planted) // 2, 0)
+    letters[at:at + len(planted)] = planted
+    return "".join(letters[:n])
+
+
+class LPSPart6LongString(VoiceoverScene, MovingCameraScene):
+    def construct(self):
+        """
+        The camera sweeps a LONG_STRING_LENGTH-letter string while a box
+        shows the palindrome Manacher's p gives for the letter under the
+        middle of the screen. The strip only builds the tiles in view, so
+        the whole sweep uses a screenful of tile mobjects.
+        """
+        if INCLUDE_NARRATION:
+            self.set_speech_service(make_speech_service())
+
+        text = long_sample(LONG_STRING_LENGTH)
+        p = PalindromeIndex(text).p
+        frame = self.camera.frame
+
+        # Letter 0 starts at the left edge of the screen
+        tiles = TileStrip(
+            text, create_tile, tile_width=0.9,
+            start=LEFT*(config.frame_width/2 - 1) + DOWN*0.5, frame=frame
+        )
+        voiceover_or_play(
+            self,
+            Write(tiles),
+            text=f"Here is a string of {len(text):,} letters, far too long to fit on the screen."
+        )
+        tiles.follow(frame)
+
+        # The palindrome around the letter in the middle of the view
+        def middle_index():
+            return min(max(tiles.index_at(frame.get_center()[0]), 0), len(text) - 1)
+
+        def around_middle(rect):
+            i = middle_index()
+            length = int(p[2*i + 1])
+            start = i - length // 2
+            rect.become(SurroundingRectangle(tiles.box(start, start + length), color=GREEN, buff=0.05))
+
+        highlight = SurroundingRectangle(tiles.box(0, 1), color=GREEN, buff=0.05)
+        highlight.add_updater(around_middle)
+        label = VGroup(Text("p =", font_size=36), Integer(1, font_size=36)).arrange(RIGHT)
+        label.add_updater(lambda m: m[1].set_value(int(p[2*middle_index() + 1])))
+        label.add_updater(lambda m: m.move_to(frame.get_center() + DOWN*2.5))
+        self.add(highlight, label)
+
+        # Sweep to the end, then come back and zoom out on the longest palindrome
+        voiceover_or_play(
+            self,
+            frame.animate.set_x(tiles.position(len(text) - 1)[0]),
+            text="Manacher's algorithm reads the whole string once, keeping the palindrome at every center.",
+            run_time=len(text) / PAN_TILES_PER_SECOND
+        )
+        self.wait(1)
+
+        best = int(p.argmax())
+        best_len = int(p[best])
+        best_start = (best - best_len) // 2
+        best_box = tiles.box(best_start, best_start + best_len)
+        highlight.clear_updaters()
+        label.clear_updaters()
+        self.play(FadeOut(label))
+        voiceover_or_play(
+            self,
+            [
+                frame.animate.move_to(best_box).set(width=max(best_box.width + 4, config.frame_width)),
+                highlight.animate.become(SurroundingRectangle(best_box, color=YELLOW, buff=0.1)),
+            ],
+            text=f"And the longest palindrome it found has {best_len} letters."
+        )
+        self.wait(2)
+
+        tiles.unfollow()
+        self.play(FadeOut(tiles), FadeOut(highlight))
+        self.wait()